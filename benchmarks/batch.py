@@ -0,0 +1,57 @@
+from random import choice, randint
+from timeit import default_timer
+
+from gameframe.poker import NoLimitTexasHoldEm, PokerNature, PokerPlayer
+from gameframe.poker.batch import NoLimitTexasHoldEmBatch, random_policy
+
+HAND_COUNT = 1000
+BATCH_HAND_COUNT = 100000
+STACKS = 200, 200, 200, 200, 200, 200
+
+
+def play(game: NoLimitTexasHoldEm) -> None:
+    while not game.terminal:
+        if isinstance(game.actor, PokerNature):
+            if game.actor.can_deal_hole():
+                for player in game.actor.dealable_players:
+                    game.actor.deal_hole(player)
+            else:
+                game.actor.deal_board()
+        elif isinstance(game.actor, PokerPlayer):
+            player = game.actor
+            actions = player.legal_actions()
+            tokens = []
+
+            if actions.can_fold:
+                tokens.append(player.fold)
+
+            if actions.can_check_call:
+                tokens.append(player.check_call)
+
+            if actions.min_bet_raise is not None and actions.max_bet_raise is not None:
+                amount = randint(actions.min_bet_raise, actions.max_bet_raise)
+                tokens.append(lambda: player.bet_raise(amount))
+
+            if actions.can_showdown:
+                tokens.append(player.showdown)
+
+            choice(tokens)()
+
+
+def main() -> None:
+    start = default_timer()
+
+    for _ in range(HAND_COUNT):
+        play(NoLimitTexasHoldEm(1, (1, 2), STACKS))
+
+    object_rate = HAND_COUNT / (default_timer() - start)
+
+    start = default_timer()
+    NoLimitTexasHoldEmBatch(BATCH_HAND_COUNT, 1, (1, 2), STACKS, 0).run(random_policy(0))
+    batch_rate = BATCH_HAND_COUNT / (default_timer() - start)
+
+    print(f'object {object_rate:.0f} hands/s, batch {batch_rate:.0f} hands/s ({batch_rate / object_rate:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
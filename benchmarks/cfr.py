@@ -0,0 +1,23 @@
+from timeit import default_timer
+
+from gameframe.poker.cfr import CFRSolver
+
+ITERATION_COUNT = 100000
+
+
+def main() -> None:
+    start_time = default_timer()
+    solver = CFRSolver()
+    build_time = default_timer() - start_time
+
+    start_time = default_timer()
+    exploitabilities = solver.iterate(ITERATION_COUNT)
+    iteration_time = default_timer() - start_time
+
+    print(f'built the tree in {build_time * 1000:.1f} ms')
+    print(f'{ITERATION_COUNT / iteration_time:.0f} iterations/s, final exploitability {exploitabilities[-1]:.2e}, '
+          f'game value {solver.game_value:.6f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+from copy import deepcopy
+from timeit import timeit
+
+from gameframe.poker import NoLimitTexasHoldEm, PotLimitOmahaHoldEm, parse_poker
+
+COUNT = 10000
+
+
+def main() -> None:
+    games = {
+        'No-Limit Texas Hold\'em': parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200,) * 6), (
+            'dh 0', 'dh 1', 'dh 2', 'dh 3', 'dh 4', 'dh 5', 'cc', 'cc', 'cc', 'cc', 'cc', 'cc', 'db',
+        )),
+        'Pot-Limit Omaha Hold\'em': parse_poker(PotLimitOmahaHoldEm(1, (1, 2), (200,) * 6), (
+            'dh 0', 'dh 1', 'dh 2', 'dh 3', 'dh 4', 'dh 5', 'cc', 'cc', 'cc', 'cc', 'cc', 'cc', 'db',
+        )),
+    }
+
+    for name, game in games.items():
+        clone_time = timeit(game.clone, number=COUNT)
+        deepcopy_time = timeit(lambda: deepcopy(game), number=COUNT)
+
+        print(f'{name}: clone {COUNT / clone_time:.0f}/s, deepcopy {COUNT / deepcopy_time:.0f}/s '
+              f'({deepcopy_time / clone_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
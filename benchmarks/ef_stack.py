@@ -0,0 +1,39 @@
+from timeit import timeit
+
+from gameframe.poker import NoLimitTexasHoldEm, Poker, parse_poker
+
+COUNT = 100000
+
+
+def sorted_relevance(game: Poker) -> list[bool]:
+    relevances = []
+
+    for player in game.players:
+        ef_stacks = sorted(player.starting_stack for player in game.players if not player.mucked)
+        ef_stack = min(ef_stacks[-2], player.starting_stack) if len(ef_stacks) > 1 else 0
+
+        relevances.append(not player.mucked and player._put < ef_stack)
+
+    return relevances
+
+
+def tabulated_relevance(game: Poker) -> list[bool]:
+    return [player._relevant for player in game.players]
+
+
+def main() -> None:
+    for player_count in (2, 6, 9):
+        game = parse_poker(
+            NoLimitTexasHoldEm(1, (1, 2), range(100, 100 + 50 * player_count, 50)),
+            tuple(f'dh {i}' for i in range(player_count)),
+        )
+
+        sorted_time = timeit(lambda: sorted_relevance(game), number=COUNT)
+        tabulated_time = timeit(lambda: tabulated_relevance(game), number=COUNT)
+
+        print(f'{player_count} players: sorted {COUNT / sorted_time:.0f}/s, tabulated {COUNT / tabulated_time:.0f}/s '
+              f'({sorted_time / tabulated_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
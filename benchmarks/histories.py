@@ -0,0 +1,32 @@
+from os import remove
+from resource import RUSAGE_SELF, getrusage
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+
+from gameframe.poker import read_hands
+from gameframe.runner import payoffs
+
+LINE = 'NoLimitTexasHoldEm\t1\t1,2\t200,200,200,200,200,200\t' \
+       'dh 0 dh 1 dh 2 dh 3 dh 4 dh 5 br 6 cc cc cc cc cc db br 10 cc cc cc cc cc ' \
+       'db cc cc cc cc cc cc db cc cc cc cc cc cc s s s s s s\n'
+
+
+def main() -> None:
+    for count in (2000, 20000):
+        with NamedTemporaryFile('w', suffix='.txt', delete=False) as file:
+            file.write(LINE * count)
+            path = file.name
+
+        try:
+            start_time = perf_counter()
+            total = sum(sum(result) for result in read_hands(path, payoffs, True))
+            end_time = perf_counter()
+
+            print(f'{count} hands: {count / (end_time - start_time):.0f} hands/s, total payoff {total}, '
+                  f'peak memory {getrusage(RUSAGE_SELF).ru_maxrss // 1024} MiB')
+        finally:
+            remove(path)
+
+
+if __name__ == '__main__':
+    main()
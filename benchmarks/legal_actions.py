@@ -0,0 +1,77 @@
+from collections.abc import Callable
+from random import choice, randint
+from timeit import default_timer
+
+from gameframe.poker import NoLimitTexasHoldEm, PokerNature, PokerPlayer, parse_poker
+
+HAND_COUNT = 1000
+
+
+def verified_tokens(player: PokerPlayer) -> list[str]:
+    tokens = []
+
+    if player.can_fold():
+        tokens.append('f')
+
+    if player.can_check_call():
+        tokens.append('cc')
+
+    if player.can_bet_raise():
+        tokens.extend((f'br {player.min_bet_raise}', f'br {player.max_bet_raise}'))
+
+    if player.can_showdown():
+        tokens.append('s')
+
+    return tokens
+
+
+def enumerated_tokens(player: PokerPlayer) -> list[str]:
+    actions = player.legal_actions()
+    tokens = []
+
+    if actions.can_fold:
+        tokens.append('f')
+
+    if actions.can_check_call:
+        tokens.append('cc')
+
+    if actions.can_bet_raise:
+        tokens.extend((f'br {actions.min_bet_raise}', f'br {actions.max_bet_raise}'))
+
+    if actions.can_showdown:
+        tokens.append('s')
+
+    return tokens
+
+
+def run(tokens_of: Callable[[PokerPlayer], list[str]]) -> float:
+    action_count = 0
+    elapsed_time = 0.0
+
+    for _ in range(HAND_COUNT):
+        game = NoLimitTexasHoldEm(1, (1, 2), tuple(randint(0, 200) for _ in range(randint(2, 9))))
+
+        while not game.terminal:
+            if isinstance(game.actor, PokerNature):
+                if game.actor.can_deal_hole():
+                    game.actor.deal_hole(next(game.actor.dealable_players))
+                else:
+                    game.actor.deal_board()
+            elif isinstance(game.actor, PokerPlayer):
+                start_time = default_timer()
+                tokens = tokens_of(game.actor)
+                elapsed_time += default_timer() - start_time
+                action_count += 1
+
+                parse_poker(game, (choice(tokens),))
+
+    return action_count / elapsed_time
+
+
+def main() -> None:
+    print(f'can_* methods: {run(verified_tokens):.0f} actions/s')
+    print(f'legal_actions: {run(enumerated_tokens):.0f} actions/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+from timeit import default_timer
+from typing import Any
+
+from gameframe.adapters import PokerMCTSAdapter, TicTacToeMCTSAdapter
+from gameframe.mcts import MCTSAdapter, MonteCarloTreeSearch
+from gameframe.poker import NoLimitTexasHoldEm
+from gameframe.sequential import SequentialGame
+from gameframe.tictactoe import TicTacToe
+
+ITERATION_COUNT = 10000
+
+
+def main() -> None:
+    game = NoLimitTexasHoldEm(1, (1, 2), (200, 200), 0)
+
+    for player in game.players:
+        game.nature.deal_hole(player)
+
+    searches: tuple[tuple[str, MCTSAdapter[Any, Any], SequentialGame[Any, Any]], ...] = (
+        ('TicTacToe', TicTacToeMCTSAdapter(), TicTacToe()),
+        ('heads-up NoLimitTexasHoldEm', PokerMCTSAdapter(), game),
+    )
+
+    for name, adapter, searched_game in searches:
+        search = MonteCarloTreeSearch(adapter, rng=0)
+        start_time = default_timer()
+        move = search.search(searched_game, ITERATION_COUNT)
+        end_time = default_timer()
+
+        print(f'{name}: {ITERATION_COUNT / (end_time - start_time):.0f} iterations/s, {search.node_count} nodes, '
+              f'best move {move}')
+
+
+if __name__ == '__main__':
+    main()
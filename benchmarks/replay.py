@@ -0,0 +1,33 @@
+from timeit import timeit
+
+from gameframe.poker import NoLimitTexasHoldEm, apply_actions, parse_actions, parse_poker
+
+COUNT = 2000
+TOKENS = (
+    'dh 0', 'dh 1', 'dh 2', 'dh 3', 'dh 4', 'dh 5', 'br 6', 'cc', 'cc', 'cc', 'cc', 'cc',
+    'db', 'br 10', 'cc', 'cc', 'cc', 'cc', 'cc',
+    'db', 'cc', 'cc', 'cc', 'cc', 'cc', 'cc',
+    'db', 'cc', 'cc', 'cc', 'cc', 'cc', 'cc',
+    's', 's', 's', 's', 's', 's',
+)
+
+
+def main() -> None:
+    verified_time = timeit(lambda: parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200,) * 6, 0), TOKENS), number=COUNT)
+    trusted_time = timeit(
+        lambda: parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200,) * 6, 0), TOKENS, True), number=COUNT,
+    )
+
+    parse_time = timeit(lambda: parse_actions(' '.join(TOKENS)), number=COUNT)
+    actions = parse_actions(TOKENS)
+    apply_time = timeit(
+        lambda: apply_actions(NoLimitTexasHoldEm(1, (1, 2), (200,) * 6, 0), actions, True), number=COUNT,
+    )
+
+    print(f'verified {COUNT / verified_time:.0f} hands/s, trusted {COUNT / trusted_time:.0f} hands/s '
+          f'({verified_time / trusted_time:.1f}x)')
+    print(f'parsing {COUNT / parse_time:.0f} hands/s, applying parsed actions {COUNT / apply_time:.0f} hands/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+from functools import partial
+from os import cpu_count
+from timeit import default_timer
+
+from gameframe.poker import NoLimitTexasHoldEm
+from gameframe.runner import run_rollouts
+
+COUNT = 20000
+WORKER_COUNTS = 1, 2, 4, 8, 16, 32
+
+
+def main() -> None:
+    factory = partial(NoLimitTexasHoldEm, 1, (1, 2), (200,) * 6)
+    base_rate = None
+
+    print(f'{cpu_count()} cores available')
+
+    for worker_count in WORKER_COUNTS:
+        start = default_timer()
+        run_rollouts(factory, COUNT, chunk_size=250, max_workers=worker_count)
+        rate = COUNT / (default_timer() - start)
+
+        if base_rate is None:
+            base_rate = rate
+
+        print(f'{worker_count} workers: {rate:.0f} hands/s ({rate / base_rate:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+from gameframe.adapters import TicTacToeSearchAdapter
+from gameframe.search import AlphaBetaSearch, TranspositionTable
+from gameframe.tictactoe import TicTacToe
+
+
+def main() -> None:
+    for size in (1 << 4, 1 << 10, 1 << 20):
+        result = AlphaBetaSearch(TicTacToeSearchAdapter(), TranspositionTable(size)).search(TicTacToe())
+
+        print(f'table size {size}: value {result.value} in {result.elapsed_time * 1000:.1f} ms, '
+              f'{result.node_count} nodes, {result.nodes_per_second:.0f} nodes/s, {result.hit_rate:.1%} hits')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+from random import Random
+from timeit import default_timer
+
+from gameframe.tictactoe import TicTacToe, TicTacToePlayer
+
+GAME_COUNT = 20000
+
+
+def play(game: TicTacToe, rng: Random) -> None:
+    while not game.terminal:
+        player = game.actor
+
+        assert isinstance(player, TicTacToePlayer)
+
+        player.mark(*rng.choice(tuple(game.empty_coords)))
+
+
+def main() -> None:
+    rng = Random(0)
+    start_time = default_timer()
+
+    for _ in range(GAME_COUNT):
+        play(TicTacToe(), rng)
+
+    end_time = default_timer()
+
+    print(f'{GAME_COUNT / (end_time - start_time):.0f} self-play games/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from random import Random
+from typing import Any, cast, final
+
+from gameframe.mcts import MCTSAdapter
+from gameframe.poker import Poker, PokerPlayer
+from gameframe.search import SearchAdapter
+from gameframe.tictactoe import TicTacToe, TicTacToePlayer
+
+
+@final
+class TicTacToeSearchAdapter(SearchAdapter[TicTacToe, tuple[int, int]]):
+    """TicTacToeSearchAdapter is the class for the search adapters of tic tac toe games.
+
+       The moves are the coordinates of the empty cells, which are ordered from the center to the corners and then to
+       the edges. Wins of the first player are scored as 1, losses as -1, and draws as 0.
+    """
+
+    _PRIORITIES = ((1, 2, 1), (2, 0, 2), (1, 2, 1))
+
+    def moves(self, game: TicTacToe) -> Iterable[tuple[int, int]]:
+        return game.empty_coords
+
+    def play(self, game: TicTacToe, move: tuple[int, int]) -> None:
+        cast(TicTacToePlayer, game.actor).mark(*move)
+
+    def key(self, game: TicTacToe) -> str:
+        return ''.join('.' if player is None else repr(player) for row in game.board for player in row)
+
+    def score(self, game: TicTacToe) -> float:
+        if (winner := game.winner) is None:
+            return 0
+        else:
+            return 1 if winner is game.players[0] else -1
+
+    def order(self, game: TicTacToe, moves: Iterable[tuple[int, int]]) -> Sequence[tuple[int, int]]:
+        return sorted(moves, key=lambda move: self._PRIORITIES[move[0]][move[1]])
+
+
+@final
+class TicTacToeMCTSAdapter(MCTSAdapter[TicTacToe, tuple[int, int]]):
+    """TicTacToeMCTSAdapter is the class for the Monte Carlo tree search adapters of tic tac toe games.
+
+       Wins are scored as 1, losses as 0, and draws as 0.5.
+    """
+
+    def moves(self, game: TicTacToe) -> Sequence[tuple[int, int]]:
+        return tuple(game.empty_coords)
+
+    def play(self, game: TicTacToe, move: tuple[int, int]) -> None:
+        cast(TicTacToePlayer, game.actor).mark(*move)
+
+    def payoffs(self, game: TicTacToe) -> Sequence[float]:
+        if (winner := game.winner) is None:
+            return 0.5, 0.5
+        else:
+            return tuple(float(player is winner) for player in game.players)
+
+
+@final
+class PokerMCTSAdapter(MCTSAdapter[Poker, tuple[Any, ...]]):
+    """PokerMCTSAdapter is the class for the Monte Carlo tree search adapters of poker games.
+
+       The moves are the tuples ('f',) to fold, ('c',) to check or call, ('b', amount) to bet or raise, ('d', False) to
+       stand pat, ('d', True) to discard and redraw every hole card, and ('s',) to showdown. Bets and raises are
+       abstracted to the minimum, the pot-sized, and the maximum amounts. The nature deals random cards from the deck.
+
+       The dealt hole cards of every player are visible to the search, so it is a search of the perfect information
+       game. The payoffs are the net stack changes divided by the largest starting stack.
+    """
+
+    def moves(self, game: Poker) -> Sequence[tuple[Any, ...]]:
+        player = cast(PokerPlayer, game.actor)
+        actions = player.legal_actions()
+        moves = list[tuple[Any, ...]]()
+
+        if actions.can_showdown:
+            return ('s',),
+        elif actions.can_discard_draw:
+            moves.append(('d', False))
+
+            if player.can_discard_draw(player.hole):
+                moves.append(('d', True))
+
+            return moves
+
+        if actions.can_fold:
+            moves.append(('f',))
+        if actions.can_check_call:
+            moves.append(('c',))
+        if actions.min_bet_raise is not None and actions.max_bet_raise is not None:
+            max_bet = max(opponent.bet for opponent in game.players)
+            pot = game.pot + sum(opponent.bet for opponent in game.players) + max_bet - player.bet
+            amounts = actions.min_bet_raise, min(max(max_bet + pot, actions.min_bet_raise), actions.max_bet_raise), \
+                actions.max_bet_raise
+            moves.extend(('b', amount) for amount in sorted(set(amounts)))
+
+        return moves
+
+    def play(self, game: Poker, move: tuple[Any, ...]) -> None:
+        player = cast(PokerPlayer, game.actor)
+
+        if move[0] == 'f':
+            player.fold()
+        elif move[0] == 'c':
+            player.check_call()
+        elif move[0] == 'b':
+            player.bet_raise(move[1])
+        elif move[0] == 'd':
+            player.discard_draw(player.hole if move[1] else ())
+        else:
+            player.showdown()
+
+    def sample(self, game: Poker, rng: Random) -> None:
+        actions = game.nature.legal_actions()
+
+        if actions.hole_deal_count is not None:
+            game.nature.deal_hole(actions.dealable_players[0], rng.sample(tuple(game.deck), actions.hole_deal_count))
+        elif actions.board_deal_count is not None:
+            game.nature.deal_board(rng.sample(tuple(game.deck), actions.board_deal_count))
+        else:
+            raise ValueError('The nature does not act in the game')
+
+    def payoffs(self, game: Poker) -> Sequence[float]:
+        scale = max(player.starting_stack for player in game.players)
+
+        return tuple((player.stack - player.starting_stack) / scale for player in game.players)
@@ -1,22 +1,39 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from typing import Any, Final, Generic, TypeVar
+from collections.abc import Iterable, Sequence
+from random import Random
+from typing import TYPE_CHECKING, Any, Final, Generic, Optional, TypeVar, Union
 
 from gameframe.exceptions import ActionException
 
+if TYPE_CHECKING:
+    from numpy.random import Generator
+
 _N = TypeVar('_N')
 _P = TypeVar('_P')
+_T = TypeVar('_T')
+
+RNG = Union[Random, 'Generator']
 
 
 class Game(Generic[_N, _P], ABC):
     """Game is the abstract generic base class for all games.
 
-       Every game has to define its nature and players.
+       Every game has to define its nature and players. Each game owns its random number generator, which is either a
+       random.Random or a NumPy Generator instance. If a seed or None is given, a random.Random instance is created
+       from it.
     """
 
-    def __init__(self, nature: _N, players: Iterable[_P]):
+    def __init__(self, nature: _N, players: Iterable[_P], rng: Optional[Union[RNG, int]] = None):
         self.nature: Final = nature
         self.players: Final = tuple(players)
+        self._rng: RNG = Random(rng) if rng is None or isinstance(rng, int) else rng
+
+    @property
+    def rng(self) -> RNG:
+        """
+        :return: The random number generator of this game.
+        """
+        return self._rng
 
     @property
     @abstractmethod
@@ -27,6 +44,29 @@ class Game(Generic[_N, _P], ABC):
         pass
 
 
+def spawn_rngs(rng: RNG, count: int) -> Sequence[RNG]:
+    """Spawns the independent child streams of the random number generator.
+
+    NumPy generators are spawned through their seed sequences, while random.Random instances seed their children
+    with 128 random bits each. In both cases, the children are reproducible from the state of the parent.
+
+    :param rng: The parent random number generator.
+    :param count: The number of children.
+    :return: The child random number generators.
+    """
+    if isinstance(rng, Random):
+        return tuple(Random(rng.getrandbits(128)) for _ in range(count))
+    else:
+        return tuple(rng.spawn(count))
+
+
+def _sample(rng: RNG, population: Sequence[_T], count: int) -> list[_T]:
+    if isinstance(rng, Random):
+        return rng.sample(population, count)
+    else:
+        return [population[index] for index in rng.choice(len(population), count, replace=False)]
+
+
 _G = TypeVar('_G', bound=Game[Any, Any])
 _A = TypeVar('_A')
 
@@ -36,8 +76,10 @@ class _Action(Generic[_G, _A], ABC):
         self.game = game
         self.actor = actor
 
-    def act(self) -> None:
-        self.verify()
+    def act(self, trusted: bool = False) -> None:
+        if not trusted:
+            self.verify()
+
         self.apply()
 
     def verify(self) -> None:
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Callable, Sequence
+from math import inf, log, sqrt
+from random import Random
+from typing import Any, Final, Generic, Optional, TypeVar, Union, cast, final
+
+from gameframe.sequential import SequentialGame
+
+_SG = TypeVar('_SG', bound=SequentialGame[Any, Any])
+_M = TypeVar('_M')
+
+RolloutPolicy = Callable[[Any, Sequence[Any], Random], Any]
+
+
+class MCTSAdapter(Generic[_SG, _M], ABC):
+    """MCTSAdapter is the abstract generic base class for all adapters of sequential games to the Monte Carlo tree
+       search.
+
+       Adapters generate and play the moves of the players, sample the actions of the nature, and determine the
+       payoffs. Each move played and each sample applies exactly one action to the game, so that the actions can be
+       undone through the undo method of the game.
+    """
+
+    @abstractmethod
+    def moves(self, game: _SG) -> Sequence[_M]:
+        """Generates the legal moves of the player that acts in the non-terminal game.
+
+        :param game: The game.
+        :return: The legal moves.
+        """
+        pass
+
+    @abstractmethod
+    def play(self, game: _SG, move: _M) -> None:
+        """Plays the legal move in the game.
+
+        :param game: The game.
+        :param move: The move to play.
+        :return: None.
+        """
+        pass
+
+    def is_chance(self, game: _SG) -> bool:
+        """Determines if the nature acts in the non-terminal game.
+
+        :param game: The game.
+        :return: True if the nature acts, else False.
+        """
+        return game.nature is not None and game.actor is game.nature
+
+    def sample(self, game: _SG, rng: Random) -> None:
+        """Applies a random action of the nature to the game.
+
+        By default, the nature is assumed never to act, so this method is only overridden for games with chance events.
+
+        :param game: The game.
+        :param rng: The random number generator to use.
+        :return: None.
+        """
+        raise ValueError('The nature does not act in the game')
+
+    @abstractmethod
+    def payoffs(self, game: _SG) -> Sequence[float]:
+        """Determines the payoffs of the players of the terminal game.
+
+        The payoffs should be scaled to about the unit interval to suit the default exploration constant.
+
+        :param game: The terminal game.
+        :return: The payoffs of the players.
+        """
+        pass
+
+
+def random_rollout(game: Any, moves: Sequence[Any], rng: Random) -> Any:
+    """Chooses a uniformly random move.
+
+    :param game: The game.
+    :param moves: The legal moves.
+    :param rng: The random number generator to use.
+    :return: The chosen move.
+    """
+    return rng.choice(moves)
+
+
+@final
+class MonteCarloTreeSearch(Generic[_SG, _M]):
+    """MonteCarloTreeSearch is the class for Monte Carlo tree searches of sequential games with UCT.
+
+       The statistics of the nodes are kept in flat arrays indexed by the nodes, with the children of each node stored
+       contiguously. The value of each node is the total payoff of the player that chose the move leading to it. The
+       actions of the nature are chance nodes with a single child, whose outcome is sampled anew in every iteration,
+       so the tree is open-loop with respect to the nature.
+
+       Each iteration plays the selected moves and the rollout in a clone of the searched game, with its history
+       enabled, and then undoes them, so the searched game is left unchanged. After the move chosen in the real game is
+       passed to the advance method, the subtree below it is kept as the new tree.
+    """
+
+    def __init__(
+            self,
+            adapter: MCTSAdapter[_SG, _M],
+            rollout_policy: RolloutPolicy = random_rollout,
+            exploration: float = sqrt(2),
+            rng: Optional[Union[Random, int]] = None,
+    ):
+        self.adapter: Final = adapter
+        self.rollout_policy: Final = rollout_policy
+        self.exploration: Final = exploration
+        self.rng: Final = rng if isinstance(rng, Random) else Random(rng)
+
+        self.__moves: list[Optional[_M]] = []
+        self.__choosers = array('b')
+        self.__first_children = array('q')
+        self.__child_counts = array('l')
+        self.__visit_counts = array('q')
+        self.__values = array('d')
+
+        self.reset()
+
+    @property
+    def node_count(self) -> int:
+        """
+        :return: The number of nodes of the tree.
+        """
+        return len(self.__visit_counts)
+
+    @property
+    def visit_count(self) -> int:
+        """
+        :return: The number of visits of the root.
+        """
+        return self.__visit_counts[0]
+
+    def statistics(self) -> dict[_M, tuple[int, float]]:
+        """Determines the visit counts and the mean payoffs of the moves at the root.
+
+        :return: The visit counts and the mean payoffs of the moves.
+        """
+        return {
+            cast(_M, self.__moves[child]): (
+                self.__visit_counts[child], self.__values[child] / max(self.__visit_counts[child], 1),
+            ) for child in self.__children(0)
+        }
+
+    def search(self, game: _SG, iteration_count: int) -> _M:
+        """Runs the iterations on the game and chooses the most visited move.
+
+        The game must be in the state at the root of the tree, which holds as long as every action applied to the game
+        since the creation or the last reset of this search is passed to the advance method.
+
+        :param game: The game to be searched, in which a player acts.
+        :param iteration_count: The number of iterations.
+        :return: The most visited move.
+        """
+        if game.terminal or self.adapter.is_chance(game):
+            raise ValueError('A player must act in the game')
+
+        game = game.clone(history=True)
+
+        for _ in range(iteration_count):
+            self.__iterate(game)
+
+        return cast(_M, self.__moves[max(self.__children(0), key=self.__visit_counts.__getitem__)])
+
+    def advance(self, move: Optional[_M] = None) -> None:
+        """Moves the root of the tree to the child of the move, keeping its subtree.
+
+        The move is None for an action of the nature. The tree is reset if the move was never expanded.
+
+        :param move: The move applied to the game.
+        :return: None.
+        """
+        root = next((child for child in self.__children(0) if self.__moves[child] == move), None)
+
+        if root is None:
+            self.reset()
+        else:
+            self.__compact(root)
+
+    def reset(self) -> None:
+        """Discards the tree.
+
+        :return: None.
+        """
+        self.__moves = [None]
+        self.__choosers = array('b', (-1,))
+        self.__first_children = array('q', (0,))
+        self.__child_counts = array('l', (0,))
+        self.__visit_counts = array('q', (0,))
+        self.__values = array('d', (0,))
+
+    def __children(self, node: int) -> range:
+        return range(self.__first_children[node], self.__first_children[node] + self.__child_counts[node])
+
+    def __iterate(self, game: _SG) -> None:
+        node = 0
+        path = [0]
+        action_count = 0
+
+        while not game.terminal:
+            if not self.__child_counts[node]:
+                self.__expand(node, game)
+
+                break
+
+            node = self.__select(node)
+            self.__apply(game, node)
+            path.append(node)
+
+        while not game.terminal:
+            if self.adapter.is_chance(game):
+                self.adapter.sample(game, self.rng)
+            else:
+                self.adapter.play(game, self.rollout_policy(game, self.adapter.moves(game), self.rng))
+
+            action_count += 1
+
+        payoffs = self.adapter.payoffs(game)
+
+        for node in path:
+            self.__visit_counts[node] += 1
+
+            if self.__choosers[node] >= 0:
+                self.__values[node] += payoffs[self.__choosers[node]]
+
+        for _ in range(len(path) - 1 + action_count):
+            game.undo()
+
+    def __expand(self, node: int, game: _SG) -> None:
+        if self.adapter.is_chance(game):
+            moves: Sequence[Optional[_M]] = None,
+            chooser = -1
+        else:
+            moves = self.adapter.moves(game)
+            chooser = game.players.index(game.actor)
+
+        self.__first_children[node] = len(self.__moves)
+        self.__child_counts[node] = len(moves)
+        self.__moves.extend(moves)
+        self.__choosers.extend((chooser,) * len(moves))
+        self.__first_children.extend((0,) * len(moves))
+        self.__child_counts.extend((0,) * len(moves))
+        self.__visit_counts.extend((0,) * len(moves))
+        self.__values.extend((0,) * len(moves))
+
+    def __select(self, node: int) -> int:
+        if self.__child_counts[node] == 1:
+            return self.__first_children[node]
+
+        scale = self.exploration * sqrt(log(self.__visit_counts[node]))
+        best_score = -inf
+        best_child = -1
+
+        for child in self.__children(node):
+            if not (visit_count := self.__visit_counts[child]):
+                return child
+
+            score = self.__values[child] / visit_count + scale / sqrt(visit_count)
+
+            if score > best_score:
+                best_score, best_child = score, child
+
+        return best_child
+
+    def __apply(self, game: _SG, node: int) -> None:
+        if self.__choosers[node] < 0:
+            self.adapter.sample(game, self.rng)
+        else:
+            self.adapter.play(game, cast(_M, self.__moves[node]))
+
+    def __compact(self, root: int) -> None:
+        nodes = [root]
+        first_children = array('q')
+
+        for node in nodes:
+            first_children.append(len(nodes) if self.__child_counts[node] else 0)
+            nodes.extend(self.__children(node))
+
+        self.__moves = [self.__moves[node] for node in nodes]
+        self.__choosers = array('b', (self.__choosers[node] for node in nodes))
+        self.__first_children = first_children
+        self.__child_counts = array('l', (self.__child_counts[node] for node in nodes))
+        self.__visit_counts = array('q', (self.__visit_counts[node] for node in nodes))
+        self.__values = array('d', (self.__values[node] for node in nodes))
+        self.__choosers[0] = -1
@@ -1,4 +1,6 @@
-from gameframe.poker.bases import Limit, Poker, PokerNature, PokerPlayer, Stage
+from gameframe.poker.analysis import Equity, equity, exact_equity
+from gameframe.poker.bases import (Limit, Poker, PokerNature, PokerNatureActions, PokerPlayer, PokerPlayerActions,
+                                   Pot, Stage, card_mask)
 from gameframe.poker.exceptions import BetRaiseAmountException, CardCountException, PlayerException
 from gameframe.poker.games import (Badugi, Courchevel, FiveCardDraw, FixedLimitBadugi, FixedLimitCourchevel,
                                    FixedLimitFiveCardDraw, FixedLimitFiveCardOmahaHoldEm, FixedLimitGreekHoldEm,
@@ -13,20 +15,23 @@ from gameframe.poker.games import (Badugi, Courchevel, FiveCardDraw, FixedLimitB
                                    PotLimitOmahaHoldEm, PotLimitShortHoldEm, PotLimitSingleDrawLowball27,
                                    PotLimitSixCardOmahaHoldEm, PotLimitTexasHoldEm, PotLimitTripleDrawLowball27,
                                    SingleDrawLowball27, TripleDrawLowball27)
+from gameframe.poker.histories import parse_hand, read_hands
 from gameframe.poker.parameters import (BettingStage, BoardDealingStage, DealingStage, DiscardDrawStage, FixedLimit,
                                         HoleDealingStage, NoLimit, PotLimit)
-from gameframe.poker.utils import parse_poker
+from gameframe.poker.utils import apply_actions, parse_action_log, parse_actions, parse_poker
 
-__all__ = ('Limit', 'Poker', 'PokerNature', 'PokerPlayer', 'Stage', 'BetRaiseAmountException', 'CardCountException',
-           'PlayerException', 'Badugi', 'Courchevel', 'FiveCardDraw', 'FixedLimitBadugi', 'FixedLimitCourchevel',
-           'FixedLimitFiveCardDraw', 'FixedLimitFiveCardOmahaHoldEm', 'FixedLimitGreekHoldEm', 'FixedLimitHoldEm',
-           'FixedLimitOmahaHoldEm', 'FixedLimitSixCardOmahaHoldEm', 'FixedLimitSingleDrawLowball27',
-           'FixedLimitShortHoldEm', 'FixedLimitTripleDrawLowball27', 'FixedLimitTexasHoldEm', 'HoldEm', 'KuhnPoker',
-           'NoLimitBadugi', 'NoLimitCourchevel', 'NoLimitFiveCardDraw', 'NoLimitFiveCardOmahaHoldEm',
-           'NoLimitGreekHoldEm', 'NoLimitHoldEm', 'NoLimitOmahaHoldEm', 'NoLimitSixCardOmahaHoldEm',
-           'NoLimitSingleDrawLowball27', 'NoLimitShortHoldEm', 'NoLimitTripleDrawLowball27', 'NoLimitTexasHoldEm',
-           'PotLimitBadugi', 'PotLimitCourchevel', 'PotLimitFiveCardDraw', 'PotLimitFiveCardOmahaHoldEm',
-           'PotLimitGreekHoldEm', 'PotLimitHoldEm', 'PotLimitOmahaHoldEm', 'PotLimitSixCardOmahaHoldEm',
-           'PotLimitSingleDrawLowball27', 'PotLimitShortHoldEm', 'PotLimitTripleDrawLowball27', 'PotLimitTexasHoldEm',
-           'SingleDrawLowball27', 'TripleDrawLowball27', 'BettingStage', 'BoardDealingStage', 'DealingStage',
-           'DiscardDrawStage', 'FixedLimit', 'HoleDealingStage', 'NoLimit', 'PotLimit', 'parse_poker')
+__all__ = ('Equity', 'equity', 'Limit', 'Poker', 'PokerNature', 'PokerNatureActions', 'PokerPlayer',
+           'PokerPlayerActions', 'Pot', 'Stage', 'BetRaiseAmountException', 'CardCountException', 'PlayerException',
+           'Badugi', 'Courchevel', 'FiveCardDraw', 'FixedLimitBadugi', 'FixedLimitCourchevel', 'FixedLimitFiveCardDraw',
+           'FixedLimitFiveCardOmahaHoldEm', 'FixedLimitGreekHoldEm', 'FixedLimitHoldEm', 'FixedLimitOmahaHoldEm',
+           'FixedLimitSixCardOmahaHoldEm', 'FixedLimitSingleDrawLowball27', 'FixedLimitShortHoldEm',
+           'FixedLimitTripleDrawLowball27', 'FixedLimitTexasHoldEm', 'HoldEm', 'KuhnPoker', 'NoLimitBadugi',
+           'NoLimitCourchevel', 'NoLimitFiveCardDraw', 'NoLimitFiveCardOmahaHoldEm', 'NoLimitGreekHoldEm',
+           'NoLimitHoldEm', 'NoLimitOmahaHoldEm', 'NoLimitSixCardOmahaHoldEm', 'NoLimitSingleDrawLowball27',
+           'NoLimitShortHoldEm', 'NoLimitTripleDrawLowball27', 'NoLimitTexasHoldEm', 'PotLimitBadugi',
+           'PotLimitCourchevel', 'PotLimitFiveCardDraw', 'PotLimitFiveCardOmahaHoldEm', 'PotLimitGreekHoldEm',
+           'PotLimitHoldEm', 'PotLimitOmahaHoldEm', 'PotLimitSixCardOmahaHoldEm', 'PotLimitSingleDrawLowball27',
+           'PotLimitShortHoldEm', 'PotLimitTripleDrawLowball27', 'PotLimitTexasHoldEm', 'SingleDrawLowball27',
+           'TripleDrawLowball27', 'BettingStage', 'BoardDealingStage', 'DealingStage', 'DiscardDrawStage', 'FixedLimit',
+           'HoleDealingStage', 'NoLimit', 'PotLimit', 'apply_actions', 'card_mask', 'exact_equity', 'parse_action_log',
+           'parse_actions', 'parse_hand', 'parse_poker', 'read_hands')
@@ -1,13 +1,13 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-from typing import cast
+from random import Random
+from typing import Any, Optional, Union, cast
 
-from auxiliary import after, bind
 from pokertools import Card, HoleCard
 
 from gameframe.exceptions import ActionException
-from gameframe.game import _A
-from gameframe.poker.bases import Poker, PokerNature, PokerPlayer
+from gameframe.game import RNG, _A, _sample
+from gameframe.poker.bases import Poker, PokerNature, PokerPlayer, Stage, card_mask
 from gameframe.poker.exceptions import BetRaiseAmountException, CardCountException, PlayerException
 from gameframe.poker.parameters import (BettingStage, BoardDealingStage, DealingStage, DiscardDrawStage,
                                         HoleDealingStage,
@@ -17,69 +17,102 @@ from gameframe.sequential import _SequentialAction
 
 class PokerAction(_SequentialAction[Poker, _A], ABC):
     def distribute(self) -> None:
-        players = [player for player in self.game.players if not player.mucked]
+        for pot in self.game._pots:
+            for i, board in enumerate(self.game.boards):
+                amount = pot.amount // len(self.game.boards) + (i < pot.amount % len(self.game.boards))
+                winners: tuple[PokerPlayer, ...]
 
-        if len(players) > 1:
-            players.sort(key=lambda player: (player.hand, -player._put), reverse=True)
-
-        base = 0
-
-        for base_player in players:
-            if base < base_player._put:
-                side_pot = self.side_pot(base, base_player._put)
-                winners = tuple(
-                    player for player in players if player is base_player or player.hand == base_player.hand)
+                if len(pot.eligible_players) == 1:
+                    winners = pot.eligible_players
+                else:
+                    hands = tuple(
+                        self.game._evaluator.hand(player._hole, board) if i else player.hand
+                        for player in pot.eligible_players
+                    )
+                    best_hand = max(hands)
+                    winners = tuple(player for player, hand in zip(pot.eligible_players, hands) if hand == best_hand)
 
                 for winner in winners:
-                    winner._bet += side_pot // len(winners)
+                    winner._bet += amount // len(winners)
                 else:
-                    winners[0]._bet += side_pot % len(winners)
-
-                base = max(base, base_player._put)
+                    winners[0]._bet += amount % len(winners)
 
         for player in self.game.players:
-            if player._put > base:
-                player._bet += player._put - base
-
             player._stack += player._bet
             player._bet = 0
 
         self.game._pot = 0
+        self.game._pots = ()
+        self.game._aggregate()
 
-    def side_pot(self, lo: int, hi: int) -> int:
-        side_pot = 0
-
-        for player in self.game.players:
-            side_pot += bind(player._put, lo, hi) - lo
+    def act(self, trusted: bool = False) -> None:
+        self.stage_index = self.game._stage_index
+        self.stage_state = self.game._stage._save()
+        self.transition: Optional[tuple[int, PokerPlayer, int, int, tuple[tuple[int, int], ...]]] = None
+        self.opening: Optional[tuple[Stage, Any]] = None
 
-        return side_pot
+        if self.game._history is not None:
+            self.aggregates = self.game._save_aggregates()
 
-    def act(self) -> None:
-        super().act()
+        super().act(trusted)
 
         if self.game._stage._skippable(self.game):
+            if self.game._history is not None:
+                self.transition = (
+                    self.game._pot, self.game._aggressor, self.game._max_delta, self.game._bet_raise_count,
+                    tuple((player._stack, player._bet) for player in self.game.players),
+                )
+
             self.game._stage._close(self.game)
 
-            try:
-                self.game._stage = after(self.game._stages, self.game._stage)
+            while self.game._stage_index + 1 < len(self.game._stages):
+                self.game._stage_index += 1
+
+                if not self.game._stage._skippable(self.game):
+                    if self.game._history is not None:
+                        self.opening = self.game._stage, self.game._stage._save()
 
-                while self.game._stage._skippable(self.game):
-                    self.game._stage = after(self.game._stages, self.game._stage)
-                else:
                     self.game._stage._open(self.game)
-            except ValueError:
+                    break
+            else:
                 self.game._reset()
                 self.distribute()
                 self.game._actor = None
         else:
             self.game._stage._update(self.game)
 
+    def undo(self) -> None:
+        if self.opening is not None:
+            stage, stage_state = self.opening
+            stage._restore(stage_state)
+
+        if self.transition is not None:
+            pot, aggressor, max_delta, bet_raise_count, stacks = self.transition
+
+            self.game._pot = pot
+            self.game._aggressor = aggressor
+            self.game._max_delta = max_delta
+            self.game._bet_raise_count = bet_raise_count
+
+            for player, (stack, bet) in zip(self.game.players, stacks):
+                player._stack = stack
+                player._bet = bet
+
+        self.game._stage_index = self.stage_index
+        self.game._stage._restore(self.stage_state)
+
+        super().undo()
+
+        self.game._restore_aggregates(self.aggregates)
+
 
 class DealingAction(PokerAction[PokerNature], ABC):
-    def __init__(self, game: Poker, actor: PokerNature, cards: Iterable[Card]):
+    def __init__(self, game: Poker, actor: PokerNature, cards: Iterable[Card], sampled: bool = False):
         super().__init__(game, actor)
 
         self.cards = tuple(cards)
+        self.sampled = sampled
+        self.mask = card_mask(self.cards)
 
     @property
     def next_actor(self) -> PokerNature:
@@ -89,26 +122,36 @@ class DealingAction(PokerAction[PokerNature], ABC):
     def deal(self) -> None:
         pass
 
+    @abstractmethod
+    def undeal(self) -> None:
+        pass
+
     def verify(self) -> None:
         super().verify()
 
         if not isinstance(self.game._stage, DealingStage):
             raise ActionException('Dealing not allowed')
-        elif any(card not in self.game._deck for card in self.cards):
+        elif not self.sampled and self.mask & ~self.game._deck_mask:
             raise ActionException('Card not in deck')
-        elif len(self.cards) != len(set(self.cards)):
+        elif not self.sampled and bin(self.mask).count('1') != len(self.cards):
             raise ActionException('Duplicates in cards')
         elif len(self.cards) != self.game._stage._card_count:
             raise CardCountException('Invalid number of hole cards are dealt')
 
     def apply(self) -> None:
-        self.game._deck.draw(self.cards)
+        self.indices = self.game._draw(self.cards)
         self.deal()
 
+    def unapply(self) -> None:
+        self.undeal()
+        self.game._undraw(self.indices)
+
 
 class HoleDealingAction(DealingAction):
-    def __init__(self, game: Poker, actor: PokerNature, player: PokerPlayer, cards: Iterable[Card]):
-        super().__init__(game, actor, cards)
+    def __init__(
+            self, game: Poker, actor: PokerNature, player: PokerPlayer, cards: Iterable[Card], sampled: bool = False,
+    ):
+        super().__init__(game, actor, cards, sampled)
 
         self.player = player
 
@@ -116,6 +159,11 @@ class HoleDealingAction(DealingAction):
         status = cast(HoleDealingStage, self.game._stage)._status
 
         self.player._hole.extend(HoleCard(card, status) for card in self.cards)
+        self.player._hole_mask |= self.mask
+
+    def undeal(self) -> None:
+        del self.player._hole[len(self.player._hole) - len(self.cards):]
+        self.player._hole_mask &= ~self.mask
 
     def verify(self) -> None:
         if not isinstance(self.player, PokerPlayer):
@@ -133,6 +181,11 @@ class HoleDealingAction(DealingAction):
 class BoardDealingAction(DealingAction):
     def deal(self) -> None:
         self.game._board.extend(self.cards)
+        self.game._board_mask |= self.mask
+
+    def undeal(self) -> None:
+        del self.game._board[len(self.game._board) - len(self.cards):]
+        self.game._board_mask &= ~self.mask
 
     def verify(self) -> None:
         if not isinstance(self.game._stage, BoardDealingStage):
@@ -143,15 +196,80 @@ class BoardDealingAction(DealingAction):
         super().verify()
 
 
-class BettingAction(PokerAction[PokerPlayer], ABC):
+class RunOutAction(PokerAction[PokerNature]):
+    def __init__(self, game: Poker, actor: PokerNature, rng: Optional[Union[RNG, int]], times: int):
+        super().__init__(game, actor)
+
+        self.rng = rng
+        self.times = times
+        self.count = sum(
+            stage._card_count for stage in game._stages if isinstance(stage, BoardDealingStage)
+        ) - len(game._board)
+
     @property
-    def next_actor(self) -> PokerPlayer:
-        actor = after(self.game.players, self.actor, True)
+    def next_actor(self) -> PokerNature:
+        return self.game.nature
 
-        while not actor._relevant and actor is not self.game._aggressor:
-            actor = after(self.game.players, actor, True)
+    def verify(self) -> None:
+        super().verify()
+
+        if not isinstance(self.game._stage, BoardDealingStage):
+            raise ActionException('Running out not allowed')
+        elif self.game._relevant_mask:
+            raise ActionException('Players can still bet')
+        elif any(isinstance(stage, (HoleDealingStage, DiscardDrawStage))
+                 for stage in self.game._stages[self.game._stage_index:]):
+            raise ActionException('Running out is only allowed for board games')
+        elif self.times < 1:
+            raise ActionException('The board has to be run out at least once')
+        elif self.count * self.times > len(self.game._deck) - self.game._deck_cursor:
+            raise CardCountException('The deck does not have enough cards for the runouts')
+
+    def apply(self) -> None:
+        deck = self.game._deck[self.game._deck_cursor:]
+
+        if self.rng is None:
+            cards = deck[:self.count * self.times]
+        else:
+            cards = _sample(Random(self.rng) if isinstance(self.rng, int) else self.rng, deck, self.count * self.times)
 
-        return actor
+        self.indices = self.game._draw(cards)
+        self.board = self.game._board.copy()
+        self.board_mask = self.game._board_mask
+        self.runouts = self.game._runouts
+        self.statuses = tuple(player._status for player in self.game.players)
+
+        self.game._board.extend(cards[:self.count])
+        self.game._board_mask |= card_mask(cards[:self.count])
+        self.game._runouts = tuple(
+            tuple(self.board) + tuple(cards[i * self.count:(i + 1) * self.count]) for i in range(1, self.times)
+        )
+        self.game._stage_index = max(
+            index for index, stage in enumerate(self.game._stages) if isinstance(stage, BoardDealingStage)
+        )
+
+        if self.times > 1:
+            for player in self.game.players:
+                if not player.mucked and not player.shown:
+                    player._show()
+
+    def unapply(self) -> None:
+        self.game._board[:] = self.board
+        self.game._board_mask = self.board_mask
+        self.game._runouts = self.runouts
+
+        for player, status in zip(self.game.players, self.statuses):
+            player._status = status
+
+        self.game._undraw(self.indices)
+
+
+class BettingAction(PokerAction[PokerPlayer], ABC):
+    @property
+    def next_actor(self) -> PokerPlayer:
+        return self.game.players[self.game._next_seat(
+            self.actor._index, self.game._relevant_mask | 1 << self.game._aggressor._index,
+        )]
 
     def verify(self) -> None:
         super().verify()
@@ -164,23 +282,29 @@ class FoldAction(BettingAction):
     def verify(self) -> None:
         super().verify()
 
-        if self.actor._bet >= max(player._bet for player in self.game.players):
+        if self.actor._bet >= self.game._max_bet:
             raise ActionException('Folding is redundant')
 
     def apply(self) -> None:
-        self.actor._status = self.actor._Status.MUCKED
+        self.status = self.actor._status
+        self.actor._muck()
+
+    def unapply(self) -> None:
+        self.actor._status = self.status
 
 
 class CheckCallAction(BettingAction):
     @property
     def amount(self) -> int:
-        return min(self.actor._stack, max(player._bet for player in self.game.players) - self.actor._bet)
+        return min(self.actor._stack, self.game._max_bet - self.actor._bet)
 
     def apply(self) -> None:
-        amount = self.amount
+        self.called_amount = self.amount
+        self.actor._commit(self.called_amount)
 
-        self.actor._stack -= amount
-        self.actor._bet += amount
+    def unapply(self) -> None:
+        self.actor._stack += self.called_amount
+        self.actor._bet -= self.called_amount
 
 
 class BetRaiseAction(BettingAction):
@@ -192,9 +316,9 @@ class BetRaiseAction(BettingAction):
     def verify(self) -> None:
         super().verify()
 
-        if max(player._bet for player in self.game.players) >= self.actor._total:
+        if self.game._max_bet >= self.actor._total:
             raise ActionException('The stack of the acting player is covered')
-        elif all(not player._relevant for player in self.game.players if player is not self.actor):
+        elif not self.game._relevant_mask & ~(1 << self.actor._index):
             raise ActionException('Betting/Raising is redundant')
         elif self.game._bet_raise_count == self.game._limit._max_count:
             raise ActionException('Too many number of bets/raises')
@@ -205,51 +329,72 @@ class BetRaiseAction(BettingAction):
         stage = cast(BettingStage, self.game._stage)
         stage._behavior = stage._Behavior.DEFAULT
 
+        self.aggressor = self.game._aggressor
+        self.max_delta = self.game._max_delta
+        self.bet_raise_count = self.game._bet_raise_count
+        self.bet = self.actor._bet
+
         self.game._aggressor = self.actor
-        self.game._max_delta = max(self.game._max_delta, self.amount - max(player._bet for player in self.game.players))
+        self.game._max_delta = max(self.game._max_delta, self.amount - self.game._max_bet)
         self.game._bet_raise_count += 1
 
-        self.actor._stack -= self.amount - self.actor._bet
-        self.actor._bet = self.amount
+        self.actor._commit(self.amount - self.actor._bet)
+
+    def unapply(self) -> None:
+        self.game._aggressor = self.aggressor
+        self.game._max_delta = self.max_delta
+        self.game._bet_raise_count = self.bet_raise_count
+
+        self.actor._stack += self.amount - self.bet
+        self.actor._bet = self.bet
 
 
 class DiscardDrawAction(PokerAction[PokerPlayer]):
-    def __init__(self, game: Poker, actor: PokerPlayer, discards: Iterable[Card], draws: Iterable[Card]):
+    def __init__(
+            self, game: Poker, actor: PokerPlayer, discards: Iterable[Card], draws: Iterable[Card],
+            sampled: bool = False,
+    ):
         super().__init__(game, actor)
 
         self.discards = tuple(discards)
         self.draws = tuple(draws)
+        self.sampled = sampled
+        self.discard_mask = card_mask(self.discards)
+        self.draw_mask = card_mask(self.draws)
 
     @property
     def next_actor(self) -> PokerPlayer:
-        actor = after(self.game.players, self.actor, True)
-
-        while actor.mucked:
-            actor = after(self.game.players, actor, True)
-
-        return actor
+        return self.game.players[self.game._next_seat(self.actor._index, self.game._active_mask)]
 
     def verify(self) -> None:
         super().verify()
 
         if not isinstance(self.game._stage, DiscardDrawStage):
             raise ActionException('Not a draw round')
-        elif any(from_ not in self.actor._hole for from_ in self.discards):
+        elif self.discard_mask & ~self.actor._hole_mask:
             raise ActionException('The hole card does not belong to the actor.')
-        elif any(card not in self.game._deck for card in self.draws):
+        elif not self.sampled and self.draw_mask & ~self.game._deck_mask:
             raise ActionException('Card not in deck')
-        elif len(self.discards) + len(self.draws) != len(set(self.discards) | set(self.draws)):
+        elif len(self.discards) + len(self.draws) != bin(self.discard_mask | self.draw_mask).count('1'):
             raise ActionException('Duplicates in cards')
         elif len(self.discards) != len(self.draws):
             raise CardCountException('The from cards must be of same length as to cards.')
 
     def apply(self) -> None:
-        self.game._deck.draw(self.draws)
+        self.indices = self.game._draw(self.draws)
+        self.hole = self.actor._hole.copy()
+        self.hole_mask = self.actor._hole_mask
+        self.actor._hole_mask = self.actor._hole_mask & ~self.discard_mask | self.draw_mask
 
         for i, card in enumerate(self.actor._hole):
             if card in self.discards:
                 self.actor._hole[i] = HoleCard(self.draws[self.discards.index(card)], card.status)
 
+    def unapply(self) -> None:
+        self.actor._hole[:] = self.hole
+        self.actor._hole_mask = self.hole_mask
+        self.game._undraw(self.indices)
+
 
 class ShowdownAction(PokerAction[PokerPlayer]):
     def __init__(self, game: Poker, actor: PokerPlayer, force: bool) -> None:
@@ -259,12 +404,7 @@ class ShowdownAction(PokerAction[PokerPlayer]):
 
     @property
     def next_actor(self) -> PokerPlayer:
-        actor = after(self.game.players, self.actor, True)
-
-        while actor.mucked:
-            actor = after(self.game.players, actor, True)
-
-        return actor
+        return self.game.players[self.game._next_seat(self.actor._index, self.game._active_mask)]
 
     def verify(self) -> None:
         super().verify()
@@ -273,8 +413,13 @@ class ShowdownAction(PokerAction[PokerPlayer]):
             raise ActionException('Game not in showdown')
 
     def apply(self) -> None:
+        self.status = self.actor._status
+
         if self.force or all(not (player.hand > self.actor.hand and player._put >= self.actor._put)
                              for player in self.game.players if player.shown):
-            self.actor._status = self.actor._Status.SHOWN
+            self.actor._show()
         else:
-            self.actor._status = self.actor._Status.MUCKED
+            self.actor._muck()
+
+    def unapply(self) -> None:
+        self.actor._status = self.status
@@ -0,0 +1,266 @@
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import combinations, permutations
+from math import sqrt
+from random import Random
+from statistics import NormalDist
+from typing import Final, Optional, Union, final
+
+from pokertools import Card, Suit
+
+from gameframe.game import RNG, _sample
+from gameframe.poker.bases import _RANK_INDICES, _SUIT_INDICES, Poker
+from gameframe.poker.parameters import BoardDealingStage, HoleDealingStage
+
+
+@final
+class Equity:
+    """Equity is the class for the all-in equities of poker players.
+
+       All estimates are indexed by the players of the game, with mucked players having zero equities. The win and tie
+       rates are the frequencies of winning alone and splitting the pot, and the equities are the expected shares of
+       the pot. Each estimate is paired with its standard error.
+    """
+
+    def __init__(
+            self,
+            sample_count: int,
+            wins: Sequence[float],
+            ties: Sequence[float],
+            equities: Sequence[float],
+            win_errors: Sequence[float],
+            tie_errors: Sequence[float],
+            equity_errors: Sequence[float],
+    ):
+        self.sample_count: Final = sample_count
+        self.wins: Final = tuple(wins)
+        self.ties: Final = tuple(ties)
+        self.equities: Final = tuple(equities)
+        self.win_errors: Final = tuple(win_errors)
+        self.tie_errors: Final = tuple(tie_errors)
+        self.equity_errors: Final = tuple(equity_errors)
+
+    def __repr__(self) -> str:
+        return f'Equity({self.sample_count}, {self.equities}, {self.equity_errors})'
+
+
+def equity(
+        game: Poker,
+        samples: int = 10000,
+        rng: Optional[Union[RNG, int]] = None,
+        batch_size: int = 1000,
+        tolerance: Optional[float] = None,
+        confidence: float = 0.95,
+) -> Equity:
+    """Estimates the all-in equities of the unmucked players of the poker game by sampling runouts.
+
+    The missing hole and board cards are sampled from the deck of the game and the hands are evaluated by the
+    evaluator of the game. Any remaining discard and draw stages are not simulated. The runouts are sampled in batches
+    and, if the tolerance is given, the estimation stops early once the confidence intervals of all equities are at
+    most the tolerance away from the estimates. The random number generator of the game is never used, so analyzing a
+    game does not change the cards it deals afterwards.
+
+    :param game: The poker game to be analyzed.
+    :param samples: The maximum number of runouts.
+    :param rng: The optional random number generator or seed, defaults to a new unseeded random number generator.
+    :param batch_size: The number of runouts sampled between early stopping checks.
+    :param tolerance: The optional half-width of the confidence intervals to stop at.
+    :param confidence: The confidence level of the intervals.
+    :return: The equities of the players.
+    """
+    if samples <= 0 or batch_size <= 0:
+        raise ValueError('The sample count and the batch size must be positive')
+
+    rng = Random(rng) if rng is None or isinstance(rng, int) else rng
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+
+    hole_target = sum(stage._card_count for stage in game._stages if isinstance(stage, HoleDealingStage))
+    board_target = sum(stage._card_count for stage in game._stages if isinstance(stage, BoardDealingStage))
+    players = tuple(player for player in game.players if not player.mucked)
+    deck = tuple(game.deck)
+
+    hole_counts = tuple(hole_target - len(player.hole) for player in players)
+    board_count = board_target - len(game.board)
+    count = sum(hole_counts) + board_count
+
+    if count > len(deck):
+        raise ValueError('The deck does not have enough cards for the runouts')
+    elif not count:
+        samples = 1
+
+    wins = [0] * len(players)
+    ties = [0] * len(players)
+    shares = [0.0] * len(players)
+    squared_shares = [0.0] * len(players)
+    sample_count = 0
+
+    while sample_count < samples:
+        for _ in range(min(batch_size, samples - sample_count)):
+            cards = _sample(rng, deck, count)
+            board = list[Card](game.board)
+            board.extend(cards[:board_count])
+            index = board_count
+            hands = []
+
+            for player, hole_count in zip(players, hole_counts):
+                hands.append(game._evaluator.hand(list[Card](player.hole) + cards[index:index + hole_count], board))
+                index += hole_count
+
+            best_hand = max(hands)
+            winner_indices = tuple(i for i, hand in enumerate(hands) if hand == best_hand)
+            share = 1 / len(winner_indices)
+
+            for i in winner_indices:
+                if len(winner_indices) == 1:
+                    wins[i] += 1
+                else:
+                    ties[i] += 1
+
+                shares[i] += share
+                squared_shares[i] += share * share
+
+        sample_count += min(batch_size, samples - sample_count)
+
+        if tolerance is not None and all(
+                z * _error(sample_count, share, squared_share) <= tolerance
+                for share, squared_share in zip(shares, squared_shares)
+        ):
+            break
+
+    indices = tuple(players.index(player) if player in players else None for player in game.players)
+
+    return Equity(
+        sample_count,
+        _estimates(indices, sample_count, wins),
+        _estimates(indices, sample_count, ties),
+        _estimates(indices, sample_count, shares),
+        _errors(indices, sample_count, wins, wins),
+        _errors(indices, sample_count, ties, ties),
+        _errors(indices, sample_count, shares, squared_shares),
+    )
+
+
+def exact_equity(game: Poker) -> Equity:
+    """Enumerates every board runout of the poker game to determine the exact all-in equities of the unmucked players.
+
+    The remaining board cards are determined by the board dealing stages of the game. Only one runout of each class of
+    runouts that are identical up to a permutation of suits preserving the hole cards, the board, and the deck is
+    generated, along with the number of runouts in its class. The runouts are chosen rank by rank, and the choices of
+    suits for each rank are reduced by the permutations that preserve the choices for the previous ranks. The standard
+    errors are therefore zero and the sample count is the number of runouts.
+
+    :param game: The poker game to be analyzed.
+    :return: The equities of the players.
+    """
+    hole_target = sum(stage._card_count for stage in game._stages if isinstance(stage, HoleDealingStage))
+    board_target = sum(stage._card_count for stage in game._stages if isinstance(stage, BoardDealingStage))
+    players = tuple(player for player in game.players if not player.mucked)
+
+    if any(len(player.hole) != hole_target for player in players):
+        raise ValueError('All hole cards have to be dealt for exact equities')
+
+    masks = [game.deck_mask, game.board_mask]
+    masks.extend(player.hole_mask for player in players)
+    cards = {(_RANK_INDICES[card.rank], _SUIT_INDICES[card.suit]): card for card in game.deck}
+    wins = [0] * len(players)
+    ties = [0] * len(players)
+    shares = [0.0] * len(players)
+    count = 0
+
+    for runout, multiplicity in _runouts(cards, board_target - len(game.board), tuple(_suit_permutations(masks))):
+        board = list[Card](game.board)
+        board.extend(runout)
+        hands = tuple(game._evaluator.hand(player.hole, board) for player in players)
+        best_hand = max(hands)
+        winner_indices = tuple(i for i, hand in enumerate(hands) if hand == best_hand)
+
+        for i in winner_indices:
+            if len(winner_indices) == 1:
+                wins[i] += multiplicity
+            else:
+                ties[i] += multiplicity
+
+            shares[i] += multiplicity / len(winner_indices)
+
+        count += multiplicity
+
+    indices = tuple(players.index(player) if player in players else None for player in game.players)
+    errors = (0.0,) * len(game.players)
+
+    return Equity(
+        count,
+        _estimates(indices, count, wins),
+        _estimates(indices, count, ties),
+        _estimates(indices, count, shares),
+        errors,
+        errors,
+        errors,
+    )
+
+
+def _runouts(
+        cards: dict[tuple[int, int], Card],
+        count: int,
+        symmetries: Sequence[Sequence[int]],
+) -> Iterator[tuple[list[Card], int]]:
+    ranks = sorted({rank for rank, _ in cards})
+    suits = tuple(tuple(suit for suit in range(len(Suit)) if (rank, suit) in cards) for rank in ranks)
+    capacities = tuple(sum(map(len, suits[index:])) for index in range(len(ranks) + 1))
+
+    def expand(
+            index: int, count: int, symmetries: Sequence[Sequence[int]], runout: list[Card], multiplicity: int,
+    ) -> Iterator[tuple[list[Card], int]]:
+        if not count:
+            yield runout, multiplicity
+        elif capacities[index] >= count:
+            for size in range(min(count, len(suits[index])) + 1):
+                for subset in combinations(suits[index], size):
+                    images = tuple(tuple(sorted(symmetry[suit] for suit in subset)) for symmetry in symmetries)
+
+                    if subset == min(images):
+                        yield from expand(
+                            index + 1,
+                            count - size,
+                            tuple(symmetry for symmetry, image in zip(symmetries, images) if image == subset),
+                            runout + [cards[ranks[index], suit] for suit in subset],
+                            multiplicity * len(set(images)),
+                        )
+
+    return expand(0, count, symmetries, [], 1)
+
+
+def _suit_permutations(masks: Iterable[int]) -> Iterable[Sequence[int]]:
+    masks = tuple(masks)
+
+    for suits in permutations(range(len(Suit))):
+        if all(_permute_mask(mask, suits) == mask for mask in masks):
+            yield suits
+
+
+def _permute_mask(mask: int, suits: Sequence[int]) -> int:
+    permuted_mask = 0
+
+    while mask:
+        index = (mask & -mask).bit_length() - 1
+        permuted_mask |= 1 << (index - index % len(suits) + suits[index % len(suits)])
+        mask &= mask - 1
+
+    return permuted_mask
+
+
+def _error(count: int, total: float, squared_total: float) -> float:
+    mean = total / count
+
+    return sqrt(max(squared_total / count - mean * mean, 0) / count)
+
+
+def _estimates(indices: Sequence[Optional[int]], count: int, totals: Sequence[float]) -> Sequence[float]:
+    return tuple(0.0 if i is None else totals[i] / count for i in indices)
+
+
+def _errors(
+        indices: Sequence[Optional[int]],
+        count: int,
+        totals: Sequence[float],
+        squared_totals: Sequence[float],
+) -> Sequence[float]:
+    return tuple(0.0 if i is None else _error(count, totals[i], squared_totals[i]) for i in indices)
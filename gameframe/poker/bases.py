@@ -1,18 +1,41 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 from collections.abc import Iterable, Iterator, Sequence
+from copy import copy
 from enum import Enum, auto
-from random import sample
-from typing import Final, Optional, Union, cast, final, overload
+from itertools import islice
+from random import Random
+from typing import Any, Final, Optional, Union, cast, final, overload
 
 from auxiliary import default, iter_equal
-from pokertools import Card, Deck, Evaluator, Hand, HoleCard
+from pokertools import Card, Deck, Evaluator, Hand, HoleCard, Rank, Suit
 
 from gameframe.exceptions import ActionException, ParameterException
+from gameframe.game import RNG
 from gameframe.poker.exceptions import BetRaiseAmountException, CardCountException, PlayerException
 from gameframe.sequential import SequentialGame
 
+_RANK_INDICES = {rank: index for index, rank in enumerate(Rank)}
+_SUIT_INDICES = {suit: index for index, suit in enumerate(Suit)}
+
+
+def card_mask(cards: Iterable[Card]) -> int:
+    """Determines the card mask of the cards.
+
+       The bit of each card is at the index of its rank times the number of suits plus the index of its suit.
+
+    :param cards: The cards of the mask.
+    :return: The card mask of the cards.
+    """
+    mask = 0
+
+    for card in cards:
+        mask |= 1 << (_RANK_INDICES[card.rank] * len(_SUIT_INDICES) + _SUIT_INDICES[card.suit])
+
+    return mask
+
 
 @final
 class PokerNature:
@@ -62,9 +85,9 @@ class PokerNature:
         from gameframe.poker._actions import HoleDealingAction
 
         if cards is None:
-            cards = sample(tuple(self.__game._deck), self.hole_deal_count)
-
-        HoleDealingAction(self.__game, self, player, cards).act()
+            HoleDealingAction(self.__game, self, player, self.__game._peek(self.hole_deal_count), True).act()
+        else:
+            HoleDealingAction(self.__game, self, player, cards).act()
 
     @overload
     def can_deal_hole(self) -> bool:
@@ -107,9 +130,9 @@ class PokerNature:
         from gameframe.poker._actions import BoardDealingAction
 
         if cards is None:
-            cards = sample(tuple(self.__game._deck), self.board_deal_count)
-
-        BoardDealingAction(self.__game, self, cards).act()
+            BoardDealingAction(self.__game, self, self.__game._peek(self.board_deal_count), True).act()
+        else:
+            BoardDealingAction(self.__game, self, cards).act()
 
     def can_deal_board(self, cards: Optional[Iterable[Card]] = None) -> bool:
         """Determines if the cards can be dealt to the board.
@@ -128,6 +151,59 @@ class PokerNature:
         else:
             return True
 
+    def run_out(self, rng: Optional[Union[RNG, int]] = None, times: int = 1) -> None:
+        """Deals every remaining board card at once when no more bets can be made.
+
+        The remaining betting stages are skipped and the game proceeds directly to the showdown. If the board is run out
+        multiple times, each runout is dealt from the deck without replacement, every remaining hand is shown, and each
+        pot is split evenly across the runouts before being distributed.
+
+        :param rng: The optional random number generator or seed to sample the cards with, defaults to the deck order.
+        :param times: The number of runouts.
+        :return: None.
+        """
+        from gameframe.poker._actions import RunOutAction
+
+        RunOutAction(self.__game, self, rng, times).act()
+
+    def can_run_out(self, times: int = 1) -> bool:
+        """Determines if the board can be run out.
+
+        :param times: The number of runouts.
+        :return: True if the board can be run out, else False.
+        """
+        from gameframe.poker._actions import RunOutAction
+
+        try:
+            RunOutAction(self.__game, self, None, times).verify()
+        except ActionException:
+            return False
+        else:
+            return True
+
+    def legal_actions(self) -> PokerNatureActions:
+        """Determines the legal actions of this poker nature from the current stage without verifying any action.
+
+        :return: The legal actions of this poker nature.
+        """
+        from gameframe.poker.parameters import BoardDealingStage, HoleDealingStage
+
+        game = self.__game
+
+        if game._actor is not self:
+            return PokerNatureActions()
+        elif isinstance(game._stage, HoleDealingStage):
+            target = game._stage._card_target(game)
+
+            return PokerNatureActions(
+                tuple(player for player in game.players if not player.mucked and len(player._hole) < target),
+                game._stage._card_count,
+            )
+        elif isinstance(game._stage, BoardDealingStage) and len(game._board) < game._stage._card_target(game):
+            return PokerNatureActions(board_deal_count=game._stage._card_count)
+        else:
+            return PokerNatureActions()
+
     def __repr__(self) -> str:
         return 'PokerNature'
 
@@ -136,13 +212,16 @@ class PokerNature:
 class PokerPlayer:
     """PokerPlayer is the class for poker players."""
 
-    def __init__(self, game: Poker, stack: int):
+    def __init__(self, game: Poker, index: int, stack: int):
         self.__game = game
         self.starting_stack: Final = stack
 
+        self._index = index
+
         self._stack = stack
         self._bet = 0
         self._hole = list[HoleCard]()
+        self._hole_mask = 0
         self._status = self._Status.DEFAULT
 
     @property
@@ -171,6 +250,13 @@ class PokerPlayer:
         else:
             return tuple(self._hole)
 
+    @property
+    def hole_mask(self) -> int:
+        """
+        :return: The card mask of the hole cards of this poker player.
+        """
+        return self._hole_mask
+
     @property
     def mucked(self) -> bool:
         """
@@ -190,7 +276,7 @@ class PokerPlayer:
         """
         :return: The hand of this poker player.
         """
-        return self.__game._evaluator.hand(self._hole, self.__game._board)
+        return self.__game._hand(self)
 
     @property
     def min_bet_raise(self) -> int:
@@ -222,11 +308,7 @@ class PokerPlayer:
 
     @property
     def _ef_stack(self) -> int:
-        try:
-            return min(sorted(player.starting_stack for player in self.__game.players if not player.mucked)[-2],
-                       self.starting_stack)
-        except IndexError:
-            return 0
+        return min(self.__game._max_ef_stack, self.starting_stack)
 
     @property
     def _relevant(self) -> bool:
@@ -316,9 +398,10 @@ class PokerPlayer:
 
         if draws is None:
             discards = tuple(discards)
-            draws = sample(tuple(self.__game._deck), len(discards))
 
-        DiscardDrawAction(self.__game, self, discards, draws).act()
+            DiscardDrawAction(self.__game, self, discards, self.__game._peek(len(discards)), True).act()
+        else:
+            DiscardDrawAction(self.__game, self, discards, draws).act()
 
     @overload
     def can_discard_draw(self) -> bool:
@@ -375,6 +458,81 @@ class PokerPlayer:
         else:
             return True
 
+    def legal_actions(self) -> PokerPlayerActions:
+        """Determines the legal actions of this poker player from the current stage without verifying any action.
+
+        :return: The legal actions of this poker player.
+        """
+        from gameframe.poker.parameters import BettingStage, DiscardDrawStage, _ShowdownStage
+
+        game = self.__game
+
+        if game._actor is not self:
+            return PokerPlayerActions()
+        elif isinstance(game._stage, BettingStage):
+            if game._max_bet < self._total and game._bet_raise_count != game._limit._max_count \
+                    and game._relevant_mask & ~(1 << self._index):
+                return PokerPlayerActions(
+                    self._bet < game._max_bet, True, game._limit._min_amount(game), game._limit._max_amount(game),
+                )
+            else:
+                return PokerPlayerActions(self._bet < game._max_bet, True)
+        elif isinstance(game._stage, DiscardDrawStage):
+            return PokerPlayerActions(can_discard_draw=True)
+        elif isinstance(game._stage, _ShowdownStage):
+            return PokerPlayerActions(can_showdown=True)
+        else:
+            return PokerPlayerActions()
+
+    def _commit(self, amount: int) -> None:
+        self._stack -= amount
+        self._bet += amount
+
+        self.__game._max_bet = max(self.__game._max_bet, self._bet)
+        self.__game._bet_total += amount
+
+        if not self._relevant:
+            self.__game._relevant_mask &= ~(1 << self._index)
+
+    def _muck(self) -> None:
+        game = self.__game
+        max_ef_stack = game._max_ef_stack
+        self._status = self._Status.MUCKED
+
+        index = bisect_left(game._ef_stacks, self.starting_stack)
+        game._ef_stacks = game._ef_stacks[:index] + game._ef_stacks[index + 1:]
+
+        game._active_count -= 1
+        game._active_mask &= ~(1 << self._index)
+
+        if game._max_ef_stack == max_ef_stack:
+            game._relevant_mask &= ~(1 << self._index)
+        else:
+            game._relevant_mask = sum(1 << player._index for player in game.players if player._relevant)
+
+        pots = list[Pot]()
+
+        for pot in game._pots:
+            eligible_players = tuple(player for player in pot.eligible_players if player is not self)
+
+            if pots and (not eligible_players or eligible_players == pots[-1].eligible_players):
+                pots[-1] = Pot(pots[-1].amount + pot.amount, pots[-1].eligible_players)
+            else:
+                pots.append(Pot(pot.amount, eligible_players))
+
+        game._pots = tuple(pots)
+
+    def _show(self) -> None:
+        self._status = self._Status.SHOWN
+        self.__game._shown_count += 1
+
+    def _clone(self, game: Poker) -> PokerPlayer:
+        player = copy(self)
+        player.__game = game
+        player._hole = self._hole.copy()
+
+        return player
+
     def __repr__(self) -> str:
         if self.mucked:
             return f'PokerPlayer({self._bet}, {self._stack})'
@@ -387,6 +545,84 @@ class PokerPlayer:
         SHOWN = auto()
 
 
+@final
+class PokerNatureActions:
+    """PokerNatureActions is the class for the legal actions of poker natures.
+
+       The hole and board deal counts are None if the corresponding cards cannot be dealt.
+    """
+
+    def __init__(
+            self,
+            dealable_players: Sequence[PokerPlayer] = (),
+            hole_deal_count: Optional[int] = None,
+            board_deal_count: Optional[int] = None,
+    ):
+        self.dealable_players: Final = tuple(dealable_players)
+        self.hole_deal_count: Final = hole_deal_count
+        self.board_deal_count: Final = board_deal_count
+
+    @property
+    def can_deal_hole(self) -> bool:
+        """
+        :return: True if the hole cards can be dealt, else False.
+        """
+        return self.hole_deal_count is not None
+
+    @property
+    def can_deal_board(self) -> bool:
+        """
+        :return: True if the board cards can be dealt, else False.
+        """
+        return self.board_deal_count is not None
+
+
+@final
+class PokerPlayerActions:
+    """PokerPlayerActions is the class for the legal actions of poker players.
+
+       The minimum and maximum bet/raise amounts are None if betting/raising is not allowed.
+    """
+
+    def __init__(
+            self,
+            can_fold: bool = False,
+            can_check_call: bool = False,
+            min_bet_raise: Optional[int] = None,
+            max_bet_raise: Optional[int] = None,
+            can_discard_draw: bool = False,
+            can_showdown: bool = False,
+    ):
+        self.can_fold: Final = can_fold
+        self.can_check_call: Final = can_check_call
+        self.min_bet_raise: Final = min_bet_raise
+        self.max_bet_raise: Final = max_bet_raise
+        self.can_discard_draw: Final = can_discard_draw
+        self.can_showdown: Final = can_showdown
+
+    @property
+    def can_bet_raise(self) -> bool:
+        """
+        :return: True if the player can bet or raise, else False.
+        """
+        return self.min_bet_raise is not None
+
+
+@final
+class Pot:
+    """Pot is the class for main and side pots.
+
+       Only the eligible players can win the pot. The eligible players are ordered by their contributions.
+    """
+
+    def __init__(self, amount: int, eligible_players: Iterable[PokerPlayer]):
+        self.amount: Final = amount
+        self.eligible_players: Final = tuple(eligible_players)
+
+    def __repr__(self) -> str:
+        return f'Pot({self.amount}, {list(self.eligible_players)})'
+
+
 class Poker(SequentialGame[PokerNature, PokerPlayer]):
     """Poker is the abstract base class for all poker games.
 
@@ -395,6 +631,10 @@ class Poker(SequentialGame[PokerNature, PokerPlayer]):
        should override the ante, blinds, and starting_stacks properties accordingly.
 
        The number of players, denoted by the length of the starting_stacks property, must be greater than or equal to 2.
+
+       The deck is shuffled once on creation with the random number generator of the game. Cards that are dealt
+       randomly are then drawn from the top of the shuffled deck. Clones given their own random number generator
+       reshuffle the cards that have not been dealt yet.
     """
 
     def __init__(
@@ -402,27 +642,49 @@ class Poker(SequentialGame[PokerNature, PokerPlayer]):
             stages: Iterable[Stage],
             limit: Limit, evaluator: Evaluator, deck: Deck,
             ante: int, blinds: Iterable[int], stacks: Iterable[int],
+            rng: Optional[Union[RNG, int]] = None,
     ):
-        super().__init__(actor := PokerNature(self), (PokerPlayer(self, stack) for stack in stacks), actor)
+        super().__init__(actor := PokerNature(self), (
+            PokerPlayer(self, index, stack) for index, stack in enumerate(stacks)
+        ), actor, rng)
         from gameframe.poker.parameters import _ShowdownStage
 
         self.ante: Final = ante
         self.blinds: Final = tuple(blinds)
 
         self._stages = tuple(stages) + (_ShowdownStage(),)
-        self._stage = self._stages[0]
+        self._stage_index = 0
+        self._card_targets = tuple(self.__card_targets())
 
         self._limit = limit
         self._evaluator = evaluator
-        self._deck = deck
+        self._deck = list(deck)
+        self._deck_cursor = 0
+        self._deck_indices = dict[Card, int]()
+        self._deck_mask = card_mask(self._deck)
+        self._reseed()
 
         self._pot = 0
         self._board = list[Card]()
+        self._board_mask = 0
+        self._runouts = tuple[tuple[Card, ...], ...]()
+        self._hands = dict[int, Hand]()
+        self._hands_board_mask = 0
 
         self._aggressor = self.players[0] if len(self.players) == 2 else self.players[len(self.blinds) - 1]
         self._max_delta = 0
         self._bet_raise_count = 0
 
+        self._ef_stacks = tuple(sorted(player.starting_stack for player in self.players))
+
+        self._max_bet = 0
+        self._bet_total = 0
+        self._active_count = 0
+        self._shown_count = 0
+        self._active_mask = 0
+        self._relevant_mask = 0
+        self._later_masks = tuple(-1 << (index + 1) for index in range(len(self.players)))
+
         if len(self.players) < 2:
             raise ParameterException('Poker needs at least 2 players')
         elif not iter_equal(self.blinds, sorted(self.blinds)):
@@ -431,6 +693,8 @@ class Poker(SequentialGame[PokerNature, PokerPlayer]):
             raise ParameterException('There are more blinds than players')
 
         self._tax()
+        self._aggregate()
+        self._pots = self._build_pots()
 
         if not self._stage._skippable(self):
             self._stage._open(self)
@@ -441,7 +705,7 @@ class Poker(SequentialGame[PokerNature, PokerPlayer]):
         """
         :return: The deck of this poker game.
         """
-        return iter(self._deck)
+        return islice(self._deck, self._deck_cursor, None)
 
     @property
     @final
@@ -451,6 +715,30 @@ class Poker(SequentialGame[PokerNature, PokerPlayer]):
         """
         return tuple(self._board)
 
+    @property
+    @final
+    def boards(self) -> Sequence[Sequence[Card]]:
+        """
+        :return: The board cards of every runout of this poker game, the first of which are the board cards.
+        """
+        return (tuple(self._board),) + self._runouts
+
+    @property
+    @final
+    def deck_mask(self) -> int:
+        """
+        :return: The card mask of the deck of this poker game.
+        """
+        return self._deck_mask
+
+    @property
+    @final
+    def board_mask(self) -> int:
+        """
+        :return: The card mask of the board cards of this poker game.
+        """
+        return self._board_mask
+
     @property
     @final
     def pot(self) -> int:
@@ -459,6 +747,105 @@ class Poker(SequentialGame[PokerNature, PokerPlayer]):
         """
         return self._pot
 
+    @property
+    @final
+    def pots(self) -> Sequence[Pot]:
+        """
+        :return: The main and side pots of this poker game, excluding the bets of the current stage.
+        """
+        return self._pots
+
+    @property
+    def _stage(self) -> Stage:
+        return self._stages[self._stage_index]
+
+    def __card_targets(self) -> Iterator[int]:
+        from gameframe.poker.parameters import DealingStage
+
+        counts = dict[type, int]()
+
+        for stage in self._stages:
+            if isinstance(stage, DealingStage):
+                counts[type(stage)] = counts.get(type(stage), 0) + stage._card_count
+                yield counts[type(stage)]
+            else:
+                yield 0
+
+    def _clone(self, game: Poker) -> None:
+        vars(game).update(nature=PokerNature(game), players=tuple(player._clone(game) for player in self.players))
+
+        game._actor = self._clone_actor(game, self._actor)
+        game._aggressor = cast(PokerPlayer, self._clone_actor(game, self._aggressor))
+
+        game._stages = tuple(map(copy, self._stages))
+
+        game._deck = self._deck.copy()
+        game._deck_indices = self._deck_indices.copy()
+        game._board = self._board.copy()
+        game._pots = tuple(
+            Pot(pot.amount, (game.players[player._index] for player in pot.eligible_players)) for pot in self._pots
+        )
+
+    def _reseed(self) -> None:
+        cards = self._deck[self._deck_cursor:]
+
+        if isinstance(self._rng, Random):
+            self._rng.shuffle(cards)
+        else:
+            cards = [cards[index] for index in self._rng.permutation(len(cards))]
+
+        self._deck[self._deck_cursor:] = cards
+        self._deck_indices.update((card, index) for index, card in enumerate(cards, self._deck_cursor))
+
+    def _clone_actor(
+            self, game: Poker, actor: Optional[Union[PokerNature, PokerPlayer]],
+    ) -> Optional[Union[PokerNature, PokerPlayer]]:
+        if isinstance(actor, PokerPlayer):
+            return game.players[actor._index]
+        elif actor is None:
+            return None
+        else:
+            return game.nature
+
+    def _hand(self, player: PokerPlayer) -> Hand:
+        if self._hands_board_mask != self._board_mask:
+            self._hands = {}
+            self._hands_board_mask = self._board_mask
+
+        try:
+            return self._hands[player._hole_mask]
+        except KeyError:
+            hand = self._hands[player._hole_mask] = self._evaluator.hand(player._hole, self._board)
+
+            return hand
+
+    def _peek(self, count: int) -> list[Card]:
+        return self._deck[self._deck_cursor:self._deck_cursor + count]
+
+    def _draw(self, cards: Iterable[Card]) -> list[int]:
+        indices = list[int]()
+
+        for card in cards:
+            indices.append(index := self._deck_indices[card])
+            self.__swap(index, self._deck_cursor)
+            self._deck_cursor += 1
+
+        self._deck_mask &= ~card_mask(self._deck[self._deck_cursor - len(indices):self._deck_cursor])
+
+        return indices
+
+    def _undraw(self, indices: Sequence[int]) -> None:
+        self._deck_mask |= card_mask(self._deck[self._deck_cursor - len(indices):self._deck_cursor])
+
+        for index in reversed(indices):
+            self._deck_cursor -= 1
+            self.__swap(index, self._deck_cursor)
+
+    def __swap(self, i: int, j: int) -> None:
+        self._deck[i], self._deck[j] = self._deck[j], self._deck[i]
+        self._deck_indices[self._deck[i]] = i
+        self._deck_indices[self._deck[j]] = j
+
     def _tax(self) -> None:
         for player in self.players:
             cur_ante = min(self.ante, player._stack)
@@ -482,12 +869,77 @@ class Poker(SequentialGame[PokerNature, PokerPlayer]):
             player._stack += player._bet - cur_entitlement
             player._bet = 0
 
+        self._aggregate()
+        self._pots = self._build_pots()
+
+    def _build_pots(self) -> tuple[Pot, ...]:
+        players = sorted(self.players, key=lambda player: player._put - player._bet)
+        levels = sorted({player._put - player._bet for player in players if not player.mucked})
+        pots = list[Pot]()
+        index = 0
+        lo = 0
+
+        for hi in levels:
+            start = index
+            amount = 0
+
+            while index < len(players) and players[index]._put - players[index]._bet <= hi:
+                amount += players[index]._put - players[index]._bet - lo
+                index += 1
+
+            amount += (len(players) - index) * (hi - lo)
+
+            if amount:
+                pots.append(Pot(amount, (player for player in players[start:] if not player.mucked)))
+
+            lo = hi
+
+        if index < len(players):
+            amount = sum(player._put - player._bet - lo for player in players[index:])
+
+            if pots:
+                pots[-1] = Pot(pots[-1].amount + amount, pots[-1].eligible_players)
+            else:
+                pots.append(Pot(amount, (player for player in players if not player.mucked)))
+
+        return tuple(pots)
+
+    @property
+    def _max_ef_stack(self) -> int:
+        return self._ef_stacks[-2] if len(self._ef_stacks) > 1 else 0
+
+    def _aggregate(self) -> None:
+        self._max_bet = max(player._bet for player in self.players)
+        self._bet_total = sum(player._bet for player in self.players)
+        self._active_count = sum(not player.mucked for player in self.players)
+        self._shown_count = sum(player.shown for player in self.players)
+        self._active_mask = sum(1 << player._index for player in self.players if not player.mucked)
+        self._relevant_mask = sum(1 << player._index for player in self.players if player._relevant)
+
+    def _first_seat(self, mask: int) -> int:
+        return (mask & -mask).bit_length() - 1
+
+    def _next_seat(self, index: int, mask: int) -> int:
+        return self._first_seat(mask & self._later_masks[index] or mask)
+
+    def _save_aggregates(self) -> tuple[Any, ...]:
+        return (
+            self._ef_stacks, self._max_bet, self._bet_total, self._active_count, self._shown_count,
+            self._active_mask, self._relevant_mask, self._pots,
+        )
+
+    def _restore_aggregates(self, aggregates: tuple[Any, ...]) -> None:
+        (
+            self._ef_stacks, self._max_bet, self._bet_total, self._active_count, self._shown_count,
+            self._active_mask, self._relevant_mask, self._pots,
+        ) = aggregates
+
 
 class Stage(ABC):
     """Stage is the abstract base class for all stages."""
 
     def _skippable(self, game: Poker) -> bool:
-        return sum(not player.mucked for player in game.players) == 1
+        return game._active_count == 1
 
     def _open(self, game: Poker) -> None:
         game._actor = self._opener(game)
@@ -498,6 +950,12 @@ class Stage(ABC):
     def _update(self, game: Poker) -> None:
         pass
 
+    def _save(self) -> Any:
+        return None
+
+    def _restore(self, state: Any) -> None:
+        pass
+
     @abstractmethod
     def _opener(self, game: Poker) -> Union[PokerNature, PokerPlayer]:
         pass
@@ -510,7 +968,7 @@ class Limit(ABC):
 
     @classmethod
     def _min_amount(cls, game: Poker) -> int:
-        return min(max(player._bet for player in game.players) + game._max_delta, cast(PokerPlayer, game._actor)._total)
+        return min(game._max_bet + game._max_delta, cast(PokerPlayer, game._actor)._total)
 
     @abstractmethod
     def _max_amount(self, game: Poker) -> int:
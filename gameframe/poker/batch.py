@@ -0,0 +1,537 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any, Final, Optional, Union, final
+
+import numpy as np
+import numpy.typing as npt
+from numpy.random import Generator, default_rng
+
+from gameframe.exceptions import ActionException, ParameterException
+
+FOLD: Final = 0
+CHECK_CALL: Final = 1
+BET_RAISE: Final = 2
+
+_SHOWDOWN = 3
+
+_DEFAULT = 0
+_IGNORE = 1
+_FINAL = 2
+
+_RANKS = '23456789TJQKA'
+_SUITS = 'cdhs'
+
+
+def _create_tables() -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    masks = np.arange(1 << len(_RANKS), dtype=np.int64)
+    top5s = np.zeros_like(masks)
+    counts = np.zeros_like(masks)
+
+    for rank in reversed(range(len(_RANKS))):
+        taken = (masks >> rank & 1 == 1) & (counts < 5)
+        top5s |= np.where(taken, rank + 1 << 4 * (4 - counts.clip(max=4)), 0)
+        counts += taken
+
+    straights = np.zeros_like(masks)
+    wheel = 1 << len(_RANKS) - 1 | 0b1111
+    straights[masks & wheel == wheel] = 4
+
+    for high in range(4, len(_RANKS)):
+        window = 0b11111 << high - 4
+        straights[masks & window == window] = high + 1
+
+    return top5s, straights
+
+
+_TOP5S, _STRAIGHTS = _create_tables()
+
+
+def _high(masks: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    return _TOP5S[masks] >> 16
+
+
+def _bit(highs: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    return np.where(highs > 0, 1 << (highs - 1).clip(min=0), 0)
+
+
+def _evaluate(cards: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    ranks = cards // len(_SUITS)
+    suits = cards % len(_SUITS)
+    weights = 1 << np.arange(len(_RANKS), dtype=np.int64)
+
+    rank_counts = (ranks[..., None] == np.arange(len(_RANKS))).sum(-2)
+    presents = ((rank_counts >= 1) * weights).sum(-1)
+    pairs = ((rank_counts >= 2) * weights).sum(-1)
+    trips = ((rank_counts >= 3) * weights).sum(-1)
+    quads = ((rank_counts >= 4) * weights).sum(-1)
+
+    suited = suits[..., None] == np.arange(len(_SUITS))
+    suit_masks = (suited * (1 << ranks)[..., None]).sum(-2)
+    flushes = np.where(suited.sum(-2) >= 5, suit_masks, 0).max(-1)
+
+    quad_highs = _high(quads)
+    trip_highs = _high(trips)
+    pair_highs = _high(pairs)
+    pair_lows = _high(pairs & ~_bit(pair_highs))
+    full_house_lows = _high(pairs & ~_bit(trip_highs))
+
+    return np.select((
+        _STRAIGHTS[flushes] > 0,
+        quads > 0,
+        (trips > 0) & (full_house_lows > 0),
+        flushes > 0,
+        _STRAIGHTS[presents] > 0,
+        trips > 0,
+        pair_lows > 0,
+        pairs > 0,
+    ), (
+        8 << 20 | _STRAIGHTS[flushes],
+        7 << 20 | quad_highs << 4 | _high(presents & ~_bit(quad_highs)),
+        6 << 20 | trip_highs << 4 | full_house_lows,
+        5 << 20 | _TOP5S[flushes],
+        4 << 20 | _STRAIGHTS[presents],
+        3 << 20 | trip_highs << 8 | _TOP5S[presents & ~_bit(trip_highs)] >> 12,
+        2 << 20 | pair_highs << 8 | pair_lows << 4 | _high(presents & ~_bit(pair_highs) & ~_bit(pair_lows)),
+        1 << 20 | pair_highs << 12 | _TOP5S[presents & ~_bit(pair_highs)] >> 8,
+    ), _TOP5S[presents])
+
+
+def _next_seats(indices: npt.NDArray[np.int64], masks: npt.NDArray[np.bool_]) -> npt.NDArray[np.int64]:
+    player_count = int(masks.shape[1])
+    offsets = np.where(masks, (np.arange(player_count) - indices[:, None] - 1) % player_count, player_count)
+
+    return np.where(masks.any(1), offsets.argmin(1), player_count - 1)
+
+
+def _card_str(card: int) -> str:
+    return _RANKS[card // len(_SUITS)] + _SUITS[card % len(_SUITS)]
+
+
+Policy = Callable[
+    ['NoLimitTexasHoldEmBatch', npt.NDArray[np.bool_], npt.NDArray[np.int64], npt.NDArray[np.int64]],
+    tuple[npt.ArrayLike, npt.ArrayLike],
+]
+
+
+@final
+class NoLimitTexasHoldEmBatch:
+    """NoLimitTexasHoldEmBatch is the class for batches of independent No-Limit Texas Hold'em games.
+
+       The games follow the same rules as NoLimitTexasHoldEm, but their states are kept in NumPy arrays so that every
+       game in the batch is stepped at once. The cards are dealt randomly on creation and every showdown is resolved
+       without forcing the players to show their hands. The indices of the actions are FOLD, CHECK_CALL, and BET_RAISE.
+    """
+
+    def __init__(
+            self, count: int, ante: int, blinds: Sequence[int], starting_stacks: npt.ArrayLike,
+            rng: Optional[Union[Generator, int]] = None, record: bool = False,
+    ):
+        starting_stacks = np.asarray(starting_stacks, dtype=np.int64)
+        player_count = starting_stacks.shape[-1]
+
+        if player_count < 2:
+            raise ParameterException('Poker needs at least 2 players')
+        elif list(blinds) != sorted(blinds):
+            raise ParameterException('Blinds have to be sorted')
+        elif len(blinds) > player_count:
+            raise ParameterException('There are more blinds than players')
+
+        self.ante: Final = ante
+        self.blinds: Final = tuple(blinds)
+
+        self._rng = rng if isinstance(rng, Generator) else default_rng(rng)
+        self._starting_stacks = np.broadcast_to(starting_stacks, (count, player_count)).copy()
+        self._cards = np.argsort(self._rng.random((count, len(_RANKS) * len(_SUITS))), 1)[:, :2 * player_count + 5]
+        self._records: Optional[list[tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64]]]] \
+            = [] if record else None
+
+        self._stacks = self._starting_stacks.copy()
+        self._bets = np.zeros_like(self._stacks)
+        self._mucked = np.zeros(self._stacks.shape, dtype=np.bool_)
+        self._pots = np.zeros(count, dtype=np.int64)
+        self._streets = np.zeros(count, dtype=np.int64)
+        self._board_counts = np.zeros(count, dtype=np.int64)
+        self._actors = np.full(count, -1, dtype=np.int64)
+        self._aggressors = np.full(count, 0 if player_count == 2 else len(self.blinds) - 1, dtype=np.int64) \
+            % player_count
+        self._behaviors = np.full(count, _DEFAULT, dtype=np.int64)
+        self._max_deltas = np.zeros(count, dtype=np.int64)
+        self._terminal = np.zeros(count, dtype=np.bool_)
+
+        antes = np.minimum(ante, self._stacks)
+        self._stacks -= antes
+        self._pots += antes.sum(1)
+
+        blind_row = np.zeros(player_count, dtype=np.int64)
+        blind_row[:len(self.blinds)] = tuple(reversed(self.blinds)) if player_count == 2 else self.blinds
+        self._bets = np.minimum(blind_row, self._stacks)
+        self._stacks -= self._bets
+
+        self.__advance(np.arange(count), False)
+
+    @property
+    def count(self) -> int:
+        """
+        :return: The number of games in this batch.
+        """
+        return len(self._stacks)
+
+    @property
+    def player_count(self) -> int:
+        """
+        :return: The number of players in each game of this batch.
+        """
+        return int(self._stacks.shape[1])
+
+    @property
+    def starting_stacks(self) -> npt.NDArray[np.int64]:
+        """
+        :return: The starting stacks of the players of this batch.
+        """
+        return self._starting_stacks
+
+    @property
+    def stacks(self) -> npt.NDArray[np.int64]:
+        """
+        :return: The stacks of the players of this batch.
+        """
+        return self._stacks
+
+    @property
+    def bets(self) -> npt.NDArray[np.int64]:
+        """
+        :return: The bets of the players of this batch.
+        """
+        return self._bets
+
+    @property
+    def mucked(self) -> npt.NDArray[np.bool_]:
+        """
+        :return: True for the players of this batch that have mucked their hands, else False.
+        """
+        return self._mucked
+
+    @property
+    def pots(self) -> npt.NDArray[np.int64]:
+        """
+        :return: The pots of the games of this batch.
+        """
+        return self._pots
+
+    @property
+    def actors(self) -> npt.NDArray[np.int64]:
+        """
+        :return: The indices of the acting players of this batch, -1 for terminal games.
+        """
+        return self._actors
+
+    @property
+    def terminal(self) -> npt.NDArray[np.bool_]:
+        """
+        :return: True for the terminal games of this batch, else False.
+        """
+        return self._terminal
+
+    @property
+    def hole_cards(self) -> npt.NDArray[np.int64]:
+        """
+        :return: The hole card indices of the players of this batch.
+        """
+        return self._cards[:, :2 * self.player_count].reshape(self.count, self.player_count, 2)
+
+    @property
+    def board_cards(self) -> npt.NDArray[np.int64]:
+        """
+        :return: The board card indices of this batch, including the undealt ones.
+        """
+        return self._cards[:, 2 * self.player_count:]
+
+    @property
+    def payoffs(self) -> npt.NDArray[np.int64]:
+        """
+        :return: The payoffs of the players of this batch.
+        """
+        payoffs: npt.NDArray[np.int64] = self._stacks + self._bets - self._starting_stacks
+
+        return payoffs
+
+    def legal_actions(self) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Determines the legal actions of the acting players of this batch.
+
+        :return: The legal action mask of each game, and the minimum and maximum bet/raise amounts.
+        """
+        rows = np.arange(self.count)
+        actors = self._actors.clip(min=0)
+        bets = self._bets[rows, actors]
+        totals = self._stacks[rows, actors] + bets
+        max_bets = self._bets.max(1)
+        others = self.__relevant().copy()
+        others[rows, actors] = False
+
+        legal = np.zeros((self.count, 3), dtype=np.bool_)
+        legal[:, FOLD] = bets < max_bets
+        legal[:, CHECK_CALL] = True
+        legal[:, BET_RAISE] = (max_bets < totals) & others.any(1)
+        legal[self._terminal] = False
+
+        return legal, np.minimum(max_bets + self._max_deltas, totals), totals
+
+    def step(self, actions: npt.ArrayLike, amounts: npt.ArrayLike = 0) -> None:
+        """Applies the actions of the acting players of this batch. The actions of terminal games are ignored.
+
+        :param actions: The action index of each game.
+        :param amounts: The bet/raise amount of each game.
+        :return: None.
+        """
+        actions = np.broadcast_to(np.asarray(actions, dtype=np.int64), (self.count,))
+        amounts = np.broadcast_to(np.asarray(amounts, dtype=np.int64), (self.count,))
+        legal, min_amounts, max_amounts = self.legal_actions()
+        rows = np.flatnonzero(~self._terminal)
+        actors = self._actors[rows]
+        actions = actions[rows]
+        amounts = amounts[rows]
+
+        if np.any((actions < 0) | (actions >= 3)) or not legal[rows, actions.clip(0, 2)].all():
+            raise ActionException('The actions are not allowed')
+        elif np.any((actions == BET_RAISE) & ((amounts < min_amounts[rows]) | (amounts > max_amounts[rows]))):
+            raise ActionException('The bet/raise amounts are not allowed')
+
+        self.__record(rows, actions, amounts)
+
+        folds = actions == FOLD
+        self._mucked[rows[folds], actors[folds]] = True
+
+        max_bets = self._bets[rows].max(1)
+        commits = np.where(
+            actions == CHECK_CALL,
+            np.minimum(self._stacks[rows, actors], max_bets - self._bets[rows, actors]),
+            np.where(actions == BET_RAISE, amounts - self._bets[rows, actors], 0),
+        )
+        raises = actions == BET_RAISE
+        self._behaviors[rows[raises]] = _DEFAULT
+        self._aggressors[rows[raises]] = actors[raises]
+        self._max_deltas[rows] = np.where(
+            raises, np.maximum(self._max_deltas[rows], amounts - max_bets), self._max_deltas[rows],
+        )
+        self._stacks[rows, actors] -= commits
+        self._bets[rows, actors] += commits
+
+        relevant = self.__relevant()[rows]
+        aggressor_mask = np.arange(self.player_count) == self._aggressors[rows, None]
+        self._actors[rows] = _next_seats(actors, relevant | aggressor_mask)
+        on_aggressor = self._actors[rows] == self._aggressors[rows]
+        closed = ((~self._mucked[rows]).sum(1) == 1) | ~relevant.any(1) \
+            | (on_aggressor & (self._behaviors[rows] != _IGNORE)) | (self._behaviors[rows] == _FINAL)
+        self._behaviors[rows[~closed & on_aggressor]] = _FINAL
+
+        self.__advance(rows[closed], True)
+
+    def run(self, policy: Policy) -> npt.NDArray[np.int64]:
+        """Steps this batch with the policy until every game is terminal.
+
+        The policy is called with this batch, the legal action masks, and the minimum and maximum bet/raise amounts,
+        and it must return the action indices and the bet/raise amounts.
+
+        :param policy: The policy of the players.
+        :return: The payoffs of the players.
+        """
+        while not self._terminal.all():
+            self.step(*policy(self, *self.legal_actions()))
+
+        return self.payoffs
+
+    def tokens(self, index: int) -> tuple[str, ...]:
+        """Determines the tokens of the game at the index that can be replayed with parse_poker.
+
+        :param index: The index of the game.
+        :return: The tokens of the game.
+        """
+        if self._records is None:
+            raise ValueError('The actions of this batch are not recorded')
+
+        holes = self.hole_cards[index]
+        board = tuple(map(_card_str, self.board_cards[index]))
+        tokens = [f'dh {i} ' + ''.join(map(_card_str, hole)) for i, hole in enumerate(holes)]
+        board_count = 0
+
+        def deal(street: int) -> None:
+            nonlocal board_count
+
+            while board_count < min(street, self._board_counts[index]):
+                board_count += 1
+                tokens.append('db ' + ''.join(board[:3] if board_count == 1 else board[board_count + 1]))
+
+        for actions, amounts, streets in self._records:
+            if actions[index] >= 0:
+                deal(streets[index])
+
+                if actions[index] == FOLD:
+                    tokens.append('f')
+                elif actions[index] == CHECK_CALL:
+                    tokens.append('cc')
+                elif actions[index] == BET_RAISE:
+                    tokens.append(f'br {amounts[index]}')
+                else:
+                    tokens.append('s')
+
+        deal(self._board_counts[index])
+
+        return tuple(tokens)
+
+    def __relevant(self) -> npt.NDArray[np.bool_]:
+        ef_stacks = np.sort(np.where(self._mucked, -1, self._starting_stacks), 1)[:, -2].clip(min=0)
+        puts = self._starting_stacks - self._stacks
+
+        relevant: npt.NDArray[np.bool_] = ~self._mucked & (puts < np.minimum(ef_stacks[:, None], self._starting_stacks))
+
+        return relevant
+
+    def __record(self, rows: npt.NDArray[np.int64], actions: npt.ArrayLike, amounts: npt.ArrayLike) -> None:
+        if self._records is not None:
+            record = np.full(self.count, -1, dtype=np.int64), np.zeros(self.count, dtype=np.int64), self._streets.copy()
+            record[0][rows] = actions
+            record[1][rows] = amounts
+            self._records.append(record)
+
+    def __advance(self, rows: npt.NDArray[np.int64], close: bool) -> None:
+        if close:
+            self.__reset(rows)
+
+        while rows.size:
+            active_counts = (~self._mucked[rows]).sum(1)
+            relevant = self.__relevant()[rows]
+
+            if close:
+                self._streets[rows] += 1
+                self._board_counts[rows] = np.where(active_counts > 1, self._streets[rows], self._board_counts[rows])
+                self._board_counts[rows] = self._board_counts[rows].clip(max=3)
+
+            opened = (self._streets[rows] < 4) & (active_counts > 1) & relevant.any(1)
+            self.__open(rows[opened], relevant[opened])
+            rows = rows[~opened]
+            close = True
+
+            ended = self._streets[rows] >= 4
+            self.__end(rows[ended])
+            rows = rows[~ended]
+
+    def __open(self, rows: npt.NDArray[np.int64], relevant: npt.NDArray[np.bool_]) -> None:
+        bets = self._bets[rows]
+        sub_openers = np.where(relevant, bets * self.player_count + np.arange(self.player_count), -1).argmax(1)
+        openers = _next_seats(sub_openers, relevant)
+        ignored = bets.sum(1) > 0
+
+        self._actors[rows] = openers
+        self._behaviors[rows] = np.where(ignored, _IGNORE, _DEFAULT)
+        self._aggressors[rows] = np.where(ignored, self._aggressors[rows], openers)
+        self._max_deltas[rows] = max(self.ante, max(self.blinds, default=0))
+
+    def __reset(self, rows: npt.NDArray[np.int64]) -> None:
+        bets = self._bets[rows]
+        entitlements = np.minimum(np.sort(bets, 1)[:, -2, None], bets)
+
+        self._pots[rows] += entitlements.sum(1)
+        self._stacks[rows] += bets - entitlements
+        self._bets[rows] = 0
+
+    def __end(self, rows: npt.NDArray[np.int64]) -> None:
+        self._streets[rows] = 4
+        hands = np.zeros((rows.size, self.player_count), dtype=np.int64)
+        showdowns = (~self._mucked[rows]).sum(1) > 1
+
+        if showdowns.any():
+            hands[showdowns] = self.__show(rows[showdowns])
+
+        self.__reset(rows)
+        self.__distribute(rows, hands)
+
+        self._actors[rows] = -1
+        self._terminal[rows] = True
+
+    def __show(self, rows: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        holes = self.hole_cards[rows]
+        boards = np.broadcast_to(self.board_cards[rows, None], (rows.size, self.player_count, 5))
+        hands = _evaluate(np.concatenate((holes, boards), 2))
+        puts = self._starting_stacks[rows] - self._stacks[rows]
+        indices = np.arange(rows.size)
+        shown = np.zeros((rows.size, self.player_count), dtype=np.bool_)
+
+        exhausted = (self._mucked[rows] | (self._stacks[rows] == 0)).all(1)
+        actors = np.where(exhausted, (~self._mucked[rows]).argmax(1), self._aggressors[rows])
+
+        for _ in range(self.player_count):
+            acting = shown.sum(1) < (~self._mucked[rows]).sum(1)
+
+            if not acting.any():
+                break
+
+            beaten = (shown & (hands > hands[indices, actors, None]) & (puts >= puts[indices, actors, None])).any(1)
+            acting_rows = indices[acting]
+            acting_actors = actors[acting]
+            mucks = beaten[acting]
+            self._mucked[rows[acting_rows[mucks]], acting_actors[mucks]] = True
+            shown[acting_rows[~mucks], acting_actors[~mucks]] = True
+
+            self.__record(rows[acting_rows], np.full(acting_rows.size, _SHOWDOWN), np.zeros(acting_rows.size))
+
+            actors[acting] = _next_seats(acting_actors, ~self._mucked[rows[acting_rows]])
+
+        return hands
+
+    def __distribute(self, rows: npt.NDArray[np.int64], hands: npt.NDArray[np.int64]) -> None:
+        indices = np.arange(rows.size)
+        puts = self._starting_stacks[rows] - self._stacks[rows]
+        active = ~self._mucked[rows]
+        orders = np.argsort(puts, 1, kind='stable')
+        sorted_puts = np.take_along_axis(puts, orders, 1)
+        sorted_active = np.take_along_axis(active, orders, 1)
+        levels = np.zeros(rows.size, dtype=np.int64)
+        amounts = np.zeros((rows.size, self.player_count), dtype=np.int64)
+        highs = np.zeros((rows.size, self.player_count), dtype=np.int64)
+
+        for k in range(self.player_count):
+            his = sorted_puts[:, k]
+            is_levels = sorted_active[:, k] & (his > levels)
+            amounts[:, k] = np.where(is_levels, (puts.clip(max=his[:, None]) - levels[:, None]).clip(min=0).sum(1), 0)
+            highs[:, k] = np.where(is_levels, his, 0)
+            levels = np.where(is_levels, his, levels)
+
+        leftovers = (puts - levels[:, None]).clip(min=0).sum(1)
+        has_levels = (amounts > 0).any(1)
+        last_levels = self.player_count - 1 - (amounts > 0)[:, ::-1].argmax(1)
+        amounts[indices[has_levels], last_levels[has_levels]] += leftovers[has_levels]
+        amounts[indices[~has_levels], 0] += leftovers[~has_levels]
+
+        for k in range(self.player_count):
+            eligible = active & (puts >= highs[:, k, None])
+            best_hands = np.where(eligible, hands, -1).max(1)
+            winners = eligible & (hands == best_hands[:, None])
+            winner_counts = winners.sum(1).clip(min=1)
+            first_winners = orders[indices, np.take_along_axis(winners, orders, 1).argmax(1)]
+
+            self._bets[rows] += winners * (amounts[:, k] // winner_counts)[:, None]
+            self._bets[rows, first_winners] += np.where(winners.any(1), amounts[:, k] % winner_counts, 0)
+
+        self._stacks[rows] += self._bets[rows]
+        self._bets[rows] = 0
+        self._pots[rows] = 0
+
+
+def random_policy(rng: Optional[Union[Generator, int]] = None) -> Policy:
+    """Creates the policy that chooses uniformly random legal actions and bet/raise amounts.
+
+    :param rng: The optional random number generator or seed.
+    :return: The random policy.
+    """
+    rng = rng if isinstance(rng, Generator) else default_rng(rng)
+
+    def policy(
+            batch: Any, legal: npt.NDArray[np.bool_], min_amounts: npt.NDArray[np.int64],
+            max_amounts: npt.NDArray[np.int64],
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        weights = legal * rng.random(legal.shape)
+
+        return weights.argmax(1), rng.integers(min_amounts, max_amounts, endpoint=True)
+
+    return policy
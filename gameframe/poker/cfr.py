@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from itertools import combinations
+from typing import Final, NamedTuple, Optional, cast, final
+
+import numpy as np
+import numpy.typing as npt
+from pokertools import Card
+
+from gameframe.poker.bases import Poker, PokerPlayer, card_mask
+from gameframe.poker.games import KuhnPoker
+
+_Sequence = Optional[tuple[str, str]]
+
+
+class _Level(NamedTuple):
+    lo: int
+    hi: int
+    starts: npt.NDArray[np.intp]
+    indices: npt.NDArray[np.intp]
+    parents: npt.NDArray[np.intp]
+    slot_parents: npt.NDArray[np.intp]
+    incidences: npt.NDArray[np.float64]
+
+
+@final
+class CFRSolver:
+    """CFRSolver is the class for CFR+ solvers of two-player poker games.
+
+       The game tree is walked once through the public action API of the poker game and flattened into its sequence
+       form, which consists of NumPy arrays of the information sets and actions of each player and of the matrix of the
+       expected payoffs of the first player between the action sequences of the two players. The CFR+ iterations, with
+       alternating updates and linearly weighted averages, then operate only on these arrays.
+
+       Bets and raises are always made with the minimum amount, so the tree is exact for fixed-limit games like Kuhn
+       poker, and discards and draws are not supported. Information sets are keyed by the hole cards of the player and
+       the public history, where f, c, and b denote folds, checks or calls, and bets or raises, and the dealt board
+       cards are enclosed in slashes. The cards in the keys are sorted, so the keys do not depend on the deal order.
+    """
+
+    BATCH_SIZE: Final = 1 << 12
+
+    def __init__(self, game: Optional[Poker] = None):
+        game = (KuhnPoker() if game is None else game).clone(history=True)
+
+        if len(game.players) != 2:
+            raise ValueError('Only two-player games can be solved')
+
+        self.__infosets: tuple[dict[str, tuple[int, _Sequence, tuple[str, ...]]], ...] = {}, {}
+        self.__payoffs = defaultdict[tuple[_Sequence, _Sequence], float](float)
+
+        self.__walk(game, (None, None), '', 1)
+
+        self.__keys = tuple(sorted(infosets, key=lambda key: (infosets[key][0], key)) for infosets in self.__infosets)
+        self.__indices = tuple(self.__index(i) for i in range(2))
+        self.__levels = tuple(self.__level(i) for i in range(2))
+        self.__starts = tuple(self.__start(i) for i in range(2))
+        self.__slot_infosets = tuple(self.__slot_infoset(i) for i in range(2))
+        self.__uniforms = tuple(1 / np.bincount(indices)[indices] for indices in self.__slot_infosets)
+
+        matrix = np.zeros((len(self.__indices[0]) + 1, len(self.__indices[1]) + 1))
+
+        for (sequence_0, sequence_1), payoff in self.__payoffs.items():
+            matrix[self.__sequence(0, sequence_0), self.__sequence(1, sequence_1)] += payoff
+
+        self.__matrices = matrix, -matrix.T.copy()
+        self.__regrets = tuple(np.zeros(len(uniforms) + 1) for uniforms in self.__uniforms)
+        self.__strategies = tuple(np.concatenate(((1.0,), uniforms)) for uniforms in self.__uniforms)
+        self.__plans = tuple(np.ones(len(uniforms) + 1) for uniforms in self.__uniforms)
+        self.__averages = tuple(np.zeros(len(uniforms) + 1) for uniforms in self.__uniforms)
+        self.__iteration_count = 0
+
+        for i in range(2):
+            self.__update_plan(i)
+
+    @property
+    def iteration_count(self) -> int:
+        """
+        :return: The number of iterations run so far.
+        """
+        return self.__iteration_count
+
+    @property
+    def game_value(self) -> float:
+        """
+        :return: The expected payoff of the first player when both players follow their average strategies.
+        """
+        return float(self.__average_plan(0) @ self.__matrices[0] @ self.__average_plan(1))
+
+    @property
+    def exploitability(self) -> float:
+        """
+        :return: The mean gain of the best responses of the players against the average strategies.
+        """
+        return float(self.__exploitabilities(self.__average_plan(0)[None], self.__average_plan(1)[None])[0])
+
+    @property
+    def average_strategies(self) -> Sequence[dict[str, dict[str, float]]]:
+        """
+        :return: The average action probabilities of each information set of the players.
+        """
+        return tuple(self.__strategy(i, self.__average_plan(i)) for i in range(2))
+
+    @property
+    def current_strategies(self) -> Sequence[dict[str, dict[str, float]]]:
+        """
+        :return: The action probabilities of each information set of the players in the last iteration.
+        """
+        return tuple(self.__strategy(i, self.__plans[i]) for i in range(2))
+
+    def iterate(self, count: int = 1) -> npt.NDArray[np.float64]:
+        """Runs the CFR+ iterations.
+
+        The exploitabilities are evaluated for batches of iterations at once, so they barely slow down the solver.
+
+        :param count: The number of iterations.
+        :return: The exploitabilities of the average strategies after each iteration.
+        """
+        exploitabilities = np.empty(count)
+
+        for start in range(0, count, self.BATCH_SIZE):
+            stop = min(start + self.BATCH_SIZE, count)
+            averages = tuple(np.empty((stop - start, len(average))) for average in self.__averages)
+
+            for k in range(stop - start):
+                self.__iteration_count += 1
+
+                for i in range(2):
+                    self.__update(i)
+
+                    averages[i][k] = self.__averages[i]
+
+            iteration_counts = np.arange(self.__iteration_count - (stop - start) + 1, self.__iteration_count + 1)
+            weights = (iteration_counts * (iteration_counts + 1) / 2)[:, None]
+            exploitabilities[start:stop] = self.__exploitabilities(averages[0] / weights, averages[1] / weights)
+
+        return exploitabilities
+
+    def __walk(self, game: Poker, sequences: tuple[_Sequence, _Sequence], history: str, probability: float) -> None:
+        if game.terminal:
+            self.__payoffs[sequences] += probability * (game.players[0].stack - game.players[0].starting_stack)
+        elif game.actor is game.nature:
+            if game.nature.can_deal_hole():
+                player = next(game.nature.dealable_players)
+                options = tuple(combinations(game.deck, game.nature.hole_deal_count))
+
+                for cards in options:
+                    game.nature.deal_hole(player, cards)
+                    self.__walk(game, sequences, history, probability / len(options))
+                    game.undo()
+            else:
+                options = tuple(combinations(game.deck, game.nature.board_deal_count))
+
+                for cards in options:
+                    game.nature.deal_board(cards)
+                    self.__walk(game, sequences, f'{history}/{_cards_key(cards)}/', probability / len(options))
+                    game.undo()
+        elif (player := cast(PokerPlayer, game.actor)).can_showdown():
+            player.showdown()
+            self.__walk(game, sequences, history, probability)
+            game.undo()
+        elif player.can_discard_draw():
+            raise ValueError('Discards and draws are not supported')
+        else:
+            i = game.players.index(player)
+            key = f'{_cards_key(player.hole)}:{history}'
+            actions: list[tuple[str, Callable[[], None]]] = []
+
+            if player.can_fold():
+                actions.append(('f', player.fold))
+            if player.can_check_call():
+                actions.append(('c', player.check_call))
+            if player.can_bet_raise():
+                actions.append(('b', player.bet_raise))
+
+            parent = sequences[i]
+            level = 0 if parent is None else self.__infosets[i][parent[0]][0] + 1
+            self.__infosets[i][key] = level, parent, tuple(label for label, _ in actions)
+
+            for label, act in actions:
+                act()
+                self.__walk(
+                    game,
+                    ((key, label), sequences[1]) if i == 0 else (sequences[0], (key, label)),
+                    history + label,
+                    probability,
+                )
+                game.undo()
+
+    def __index(self, i: int) -> dict[tuple[str, str], int]:
+        indices: dict[tuple[str, str], int] = {}
+
+        for key in self.__keys[i]:
+            for label in self.__infosets[i][key][2]:
+                indices[key, label] = len(indices) + 1
+
+        return indices
+
+    def __sequence(self, i: int, sequence: _Sequence) -> int:
+        return 0 if sequence is None else self.__indices[i][sequence]
+
+    def __level(self, i: int) -> Sequence[_Level]:
+        levels = []
+        level_count = max((infoset[0] + 1 for infoset in self.__infosets[i].values()), default=0)
+
+        for level in range(level_count):
+            keys = tuple(key for key in self.__keys[i] if self.__infosets[i][key][0] == level)
+            counts = tuple(len(self.__infosets[i][key][2]) for key in keys)
+            lo = self.__indices[i][keys[0], self.__infosets[i][keys[0]][2][0]]
+            parents = np.array(tuple(self.__sequence(i, self.__infosets[i][key][1]) for key in keys), np.intp)
+            incidences = np.zeros((len(keys), len(self.__indices[i]) + 1))
+            incidences[np.arange(len(keys)), parents] = 1
+
+            levels.append(_Level(
+                lo,
+                lo + sum(counts),
+                np.cumsum((0,) + counts[:-1], dtype=np.intp),
+                np.repeat(np.arange(len(keys), dtype=np.intp), counts),
+                parents,
+                np.repeat(parents, counts),
+                incidences,
+            ))
+
+        return levels
+
+    def __start(self, i: int) -> npt.NDArray[np.intp]:
+        return np.cumsum((0,) + tuple(len(self.__infosets[i][key][2]) for key in self.__keys[i][:-1]), dtype=np.intp)
+
+    def __slot_infoset(self, i: int) -> npt.NDArray[np.intp]:
+        counts = tuple(len(self.__infosets[i][key][2]) for key in self.__keys[i])
+
+        return np.repeat(np.arange(len(counts), dtype=np.intp), counts)
+
+    def __update(self, i: int) -> None:
+        strategies = self.__strategies[i]
+        regrets = self.__regrets[i]
+        values = self.__matrices[i] @ self.__plans[1 - i]
+
+        for level in reversed(self.__levels[i]):
+            infoset_values = np.add.reduceat(strategies[level.lo:level.hi] * values[level.lo:level.hi], level.starts)
+            regrets[level.lo:level.hi] += values[level.lo:level.hi] - infoset_values[level.indices]
+            values += np.bincount(level.parents, infoset_values, len(values))
+
+        np.maximum(regrets, 0, out=regrets)
+
+        totals = np.add.reduceat(regrets[1:], self.__starts[i])[self.__slot_infosets[i]]
+        strategies[1:] = self.__uniforms[i]
+        np.divide(regrets[1:], totals, out=strategies[1:], where=totals > 0)
+
+        self.__update_plan(i)
+
+        averages = self.__averages[i]
+        averages += self.__iteration_count * self.__plans[i]
+
+    def __update_plan(self, i: int) -> None:
+        plan = self.__plans[i]
+
+        for level in self.__levels[i]:
+            plan[level.lo:level.hi] = self.__strategies[i][level.lo:level.hi] * plan[level.slot_parents]
+
+    def __average_plan(self, i: int) -> npt.NDArray[np.float64]:
+        if self.__iteration_count:
+            return self.__averages[i] / (self.__iteration_count * (self.__iteration_count + 1) / 2)
+        else:
+            return self.__plans[i]
+
+    def __exploitabilities(
+            self,
+            plans_0: npt.NDArray[np.float64],
+            plans_1: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        best_response_values = []
+
+        for i, plans in enumerate((plans_1, plans_0)):
+            values = plans @ self.__matrices[i].T
+
+            for level in reversed(self.__levels[i]):
+                values += np.maximum.reduceat(values[:, level.lo:level.hi], level.starts, 1) @ level.incidences
+
+            best_response_values.append(values[:, 0])
+
+        return (best_response_values[0] + best_response_values[1]) / 2
+
+    def __strategy(self, i: int, plan: npt.NDArray[np.float64]) -> dict[str, dict[str, float]]:
+        strategy = {}
+
+        for key in self.__keys[i]:
+            labels = self.__infosets[i][key][2]
+            reaches = tuple(float(plan[self.__indices[i][key, label]]) for label in labels)
+            total = sum(reaches)
+            strategy[key] = {
+                label: reach / total if total > 0 else 1 / len(labels) for label, reach in zip(labels, reaches)
+            }
+
+        return strategy
+
+
+def _cards_key(cards: Iterable[Card]) -> str:
+    return ''.join(map(str, sorted(cards, key=lambda card: card_mask((card,)))))
@@ -1,9 +1,10 @@
 from collections.abc import Sequence
-from typing import final
+from typing import Optional, Union, final
 
 from pokertools import (BadugiEvaluator, Card, Deck, Lowball27Evaluator, Rank, RankEvaluator, StandardDeck,
                         StandardEvaluator, Suit)
 
+from gameframe.game import RNG
 from gameframe.poker.bases import Limit, Poker
 from gameframe.poker.parameters import BettingStage, DiscardDrawStage, FixedLimit, HoleDealingStage, NoLimit, PotLimit
 
@@ -11,12 +12,13 @@ from gameframe.poker.parameters import BettingStage, DiscardDrawStage, FixedLimi
 class FiveCardDraw(Poker):
     """FiveCardDraw is the base class for all Five-Card Draw games."""
 
-    def __init__(self, limit: Limit, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
+    def __init__(self, limit: Limit, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
         max_delta = max(ante, max(blinds))
 
         super().__init__(
             (HoleDealingStage(5, False), BettingStage(max_delta), DiscardDrawStage(), BettingStage(max_delta)),
-            limit, StandardEvaluator(), StandardDeck(), ante, blinds, starting_stacks,
+            limit, StandardEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng,
         )
 
 
@@ -24,30 +26,34 @@ class FiveCardDraw(Poker):
 class FixedLimitFiveCardDraw(FiveCardDraw):
     """FixedLimitFiveCardDraw is the class for Fixed-Limit Five-Card Draw games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(FixedLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(FixedLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class PotLimitFiveCardDraw(FiveCardDraw):
     """PotLimitFiveCardDraw is the class for Pot-Limit Five-Card Draw games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(PotLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(PotLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class NoLimitFiveCardDraw(FiveCardDraw):
     """NoLimitFiveCardDraw is the class for No-Limit Five-Card Draw games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(NoLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(NoLimit(), ante, blinds, starting_stacks, rng)
 
 
 class Badugi(Poker):
     """Badugi is the class for Badugi games."""
 
-    def __init__(self, limit: Limit, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
+    def __init__(self, limit: Limit, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
         max_delta = max(ante, max(blinds))
 
         super().__init__((
@@ -55,72 +61,80 @@ class Badugi(Poker):
             DiscardDrawStage(), BettingStage(max_delta),
             DiscardDrawStage(), BettingStage(2 * max_delta if isinstance(limit, FixedLimit) else max_delta),
             DiscardDrawStage(), BettingStage(2 * max_delta if isinstance(limit, FixedLimit) else max_delta),
-        ), limit, BadugiEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+        ), limit, BadugiEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class FixedLimitBadugi(Badugi):
     """FixedLimitBadugi is the class for Fixed-Limit Badugi games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(FixedLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(FixedLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class PotLimitBadugi(Badugi):
     """PotLimitBadugi is the class for Pot-Limit Badugi games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(PotLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(PotLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class NoLimitBadugi(Badugi):
     """NoLimitBadugi is the class for No-Limit Badugi games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(NoLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(NoLimit(), ante, blinds, starting_stacks, rng)
 
 
 class SingleDrawLowball27(Poker):
     """SingleDrawLowball27 is the class for 2-7 Single Draw Lowball games."""
 
-    def __init__(self, limit: Limit, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
+    def __init__(self, limit: Limit, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
         max_delta = max(ante, max(blinds))
 
         super().__init__(
             (HoleDealingStage(5, False), BettingStage(max_delta), DiscardDrawStage(), BettingStage(max_delta)),
-            limit, Lowball27Evaluator(), StandardDeck(), ante, blinds, starting_stacks)
+            limit, Lowball27Evaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class FixedLimitSingleDrawLowball27(SingleDrawLowball27):
     """FixedLimitSingleDrawLowball27 is the class for Fixed-Limit 2-7 Single Draw Lowball games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(FixedLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(FixedLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class PotLimitSingleDrawLowball27(SingleDrawLowball27):
     """PotLimitSingleDrawLowball27 is the class for Pot-Limit 2-7 Single Draw Lowball games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(PotLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(PotLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class NoLimitSingleDrawLowball27(SingleDrawLowball27):
     """NoLimitSingleDrawLowball27 is the class for No-Limit 2-7 Single Draw Lowball games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(NoLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(NoLimit(), ante, blinds, starting_stacks, rng)
 
 
 class TripleDrawLowball27(Poker):
     """TripleDrawLowball27 is the class for 2-7 Triple Draw Lowball games."""
 
-    def __init__(self, limit: Limit, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
+    def __init__(self, limit: Limit, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
         max_delta = max(ante, max(blinds))
 
         super().__init__((
@@ -128,37 +142,41 @@ class TripleDrawLowball27(Poker):
             DiscardDrawStage(), BettingStage(max_delta),
             DiscardDrawStage(), BettingStage(2 * max_delta if isinstance(limit, FixedLimit) else max_delta),
             DiscardDrawStage(), BettingStage(2 * max_delta if isinstance(limit, FixedLimit) else max_delta),
-        ), limit, Lowball27Evaluator(), StandardDeck(), ante, blinds, starting_stacks)
+        ), limit, Lowball27Evaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class FixedLimitTripleDrawLowball27(SingleDrawLowball27):
     """FixedLimitTripleDrawLowball27 is the class for Fixed-Limit 2-7 Triple Draw Lowball games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(FixedLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(FixedLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class PotLimitTripleDrawLowball27(SingleDrawLowball27):
     """PotLimitTripleDrawLowball27 is the class for Pot-Limit 2-7 Triple Draw Lowball games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(PotLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(PotLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class NoLimitTripleDrawLowball27(SingleDrawLowball27):
     """NoLimitTripleDrawLowball27 is the class for No-Limit 2-7 Triple Draw Lowball games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(NoLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(NoLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class KuhnPoker(Poker):
     """KuhnPoker is the class for Kuhn Poker games."""
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[Union[RNG, int]] = None) -> None:
         super().__init__((HoleDealingStage(1, False), BettingStage(1)), FixedLimit(), RankEvaluator(), Deck(
-            (Card(Rank.JACK, Suit.SPADE), Card(Rank.QUEEN, Suit.SPADE), Card(Rank.KING, Suit.SPADE))), 1, (), (2, 2))
+            (Card(Rank.JACK, Suit.SPADE), Card(Rank.QUEEN, Suit.SPADE), Card(Rank.KING, Suit.SPADE)),
+        ), 1, (), (2, 2), rng)
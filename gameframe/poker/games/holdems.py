@@ -1,9 +1,10 @@
 from collections.abc import Sequence
-from typing import final
+from typing import Optional, Union, final
 
 from pokertools import (Deck, Evaluator, GreekEvaluator, OmahaEvaluator, ShortDeck, ShortEvaluator, StandardDeck,
                         StandardEvaluator)
 
+from gameframe.game import RNG
 from gameframe.poker.bases import Limit, Poker
 from gameframe.poker.parameters import BettingStage, BoardDealingStage, FixedLimit, HoleDealingStage, NoLimit, PotLimit
 
@@ -12,7 +13,8 @@ class HoldEm(Poker):
     """HoldEm is the class for Hold'em games."""
 
     def __init__(self, hole_card_count: int, limit: Limit, evaluator: Evaluator, deck: Deck,
-                 ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
+                 ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
         max_delta = max(ante, max(blinds))
 
         super().__init__((
@@ -20,133 +22,149 @@ class HoldEm(Poker):
             BoardDealingStage(3), BettingStage(max_delta),
             BoardDealingStage(1), BettingStage(2 * max_delta if isinstance(limit, FixedLimit) else max_delta),
             BoardDealingStage(1), BettingStage(2 * max_delta if isinstance(limit, FixedLimit) else max_delta),
-        ), limit, evaluator, deck, ante, blinds, starting_stacks)
+        ), limit, evaluator, deck, ante, blinds, starting_stacks, rng)
 
 
 class FixedLimitHoldEm(HoldEm):
     """FixedLimitHoldEm is the class for Fixed-Limit Hold'em games."""
 
     def __init__(self, hole_card_count: int, evaluator: Evaluator, deck: Deck,
-                 ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(hole_card_count, FixedLimit(), evaluator, deck, ante, blinds, starting_stacks)
+                 ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(hole_card_count, FixedLimit(), evaluator, deck, ante, blinds, starting_stacks, rng)
 
 
 class PotLimitHoldEm(HoldEm):
     """PotLimitHoldEm is the class for Pot-Limit Hold'em games."""
 
     def __init__(self, hole_card_count: int, evaluator: Evaluator, deck: Deck,
-                 ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(hole_card_count, PotLimit(), evaluator, deck, ante, blinds, starting_stacks)
+                 ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(hole_card_count, PotLimit(), evaluator, deck, ante, blinds, starting_stacks, rng)
 
 
 class NoLimitHoldEm(HoldEm):
     """NoLimitHoldEm is the class for No-Limit Hold'em games."""
 
     def __init__(self, hole_card_count: int, evaluator: Evaluator, deck: Deck,
-                 ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(hole_card_count, NoLimit(), evaluator, deck, ante, blinds, starting_stacks)
+                 ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(hole_card_count, NoLimit(), evaluator, deck, ante, blinds, starting_stacks, rng)
 
 
 @final
 class FixedLimitTexasHoldEm(FixedLimitHoldEm):
     """FixedLimitTexasHoldEm is the class for Fixed-Limit Texas Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(2, StandardEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(2, StandardEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class PotLimitTexasHoldEm(PotLimitHoldEm):
     """PotLimitTexasHoldEm is the class for Pot-Limit Texas Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(2, StandardEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(2, StandardEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class NoLimitTexasHoldEm(NoLimitHoldEm):
     """NoLimitTexasHoldEm is the class for No-Limit Texas Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(2, StandardEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(2, StandardEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class FixedLimitOmahaHoldEm(FixedLimitHoldEm):
     """FixedLimitOmahaHoldEm is the class for Fixed-Limit Omaha Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(4, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(4, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class PotLimitOmahaHoldEm(PotLimitHoldEm):
     """PotLimitOmahaHoldEm is the class for Pot-Limit Omaha Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(4, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(4, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class NoLimitOmahaHoldEm(NoLimitHoldEm):
     """NoLimitOmahaHoldEm is the class for No-Limit Omaha Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(4, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(4, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class FixedLimitFiveCardOmahaHoldEm(FixedLimitHoldEm):
     """FixedLimitFiveCardOmahaHoldEm is the class for Fixed-Limit 5-Card Omaha Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(5, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(5, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class PotLimitFiveCardOmahaHoldEm(PotLimitHoldEm):
     """PotLimitFiveCardOmahaHoldEm is the class for Pot-Limit 5-Card Omaha Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(5, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(5, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class NoLimitFiveCardOmahaHoldEm(NoLimitHoldEm):
     """NoLimitFiveCardOmahaHoldEm is the class for No-Limit 5-Card Omaha Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(5, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(5, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class FixedLimitSixCardOmahaHoldEm(FixedLimitHoldEm):
     """FixedLimitSixCardOmahaHoldEm is the class for Fixed-Limit 6-Card Omaha Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(6, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(6, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class PotLimitSixCardOmahaHoldEm(PotLimitHoldEm):
     """PotLimitSixCardOmahaHoldEm is the class for Pot-Limit 6-Card Omaha Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(6, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(6, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class NoLimitSixCardOmahaHoldEm(NoLimitHoldEm):
     """NoLimitSixCardOmahaHoldEm is the class for No-Limit 6-Card Omaha Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(6, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(6, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 class Courchevel(Poker):
     """Courchevel is the class for Courchevel games."""
 
-    def __init__(self, limit: Limit, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
+    def __init__(self, limit: Limit, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
         max_delta = max(ante, max(blinds))
 
         super().__init__((
@@ -154,79 +172,88 @@ class Courchevel(Poker):
             BoardDealingStage(2), BettingStage(max_delta),
             BoardDealingStage(1), BettingStage(2 * max_delta if isinstance(limit, FixedLimit) else max_delta),
             BoardDealingStage(1), BettingStage(2 * max_delta if isinstance(limit, FixedLimit) else max_delta),
-        ), limit, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+        ), limit, OmahaEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class FixedLimitCourchevel(Courchevel):
     """FixedLimitCourchevel is the class for Fixed-Limit Courchevel games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(FixedLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(FixedLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class PotLimitCourchevel(Courchevel):
     """PotLimitCourchevel is the class for Pot-Limit Courchevel games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(PotLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(PotLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class NoLimitCourchevel(Courchevel):
     """NoLimitCourchevel is the class for No-Limit Courchevel games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(NoLimit(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(NoLimit(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class FixedLimitGreekHoldEm(FixedLimitHoldEm):
     """FixedLimitGreekHoldEm is the class for Fixed-Limit Greek Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(2, GreekEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(2, GreekEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class PotLimitGreekHoldEm(PotLimitHoldEm):
     """PotLimitGreekHoldEm is the class for Pot-Limit Greek Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(2, GreekEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(2, GreekEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class NoLimitGreekHoldEm(NoLimitHoldEm):
     """NoLimitGreekHoldEm is the class for No-Limit Greek Hold'em games."""
 
-    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int]):
-        super().__init__(2, GreekEvaluator(), StandardDeck(), ante, blinds, starting_stacks)
+    def __init__(self, ante: int, blinds: Sequence[int], starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
+        super().__init__(2, GreekEvaluator(), StandardDeck(), ante, blinds, starting_stacks, rng)
 
 
 @final
 class FixedLimitShortHoldEm(FixedLimitHoldEm):
     """FixedLimitShortHoldEm is the class for Fixed-Limit Short-Deck Hold'em games."""
 
-    def __init__(self, ante: int, button_blind: int, starting_stacks: Sequence[int]):
+    def __init__(self, ante: int, button_blind: int, starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
         super().__init__(2, ShortEvaluator(), ShortDeck(), ante, (0,) * (len(starting_stacks) - 1) + (button_blind,),
-                         starting_stacks)
+                         starting_stacks, rng)
 
 
 @final
 class PotLimitShortHoldEm(PotLimitHoldEm):
     """PotLimitShortHoldEm is the class for Pot-Limit Short-Deck Hold'em games."""
 
-    def __init__(self, ante: int, button_blind: int, starting_stacks: Sequence[int]):
+    def __init__(self, ante: int, button_blind: int, starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
         super().__init__(2, ShortEvaluator(), ShortDeck(), ante, (0,) * (len(starting_stacks) - 1) + (button_blind,),
-                         starting_stacks)
+                         starting_stacks, rng)
 
 
 @final
 class NoLimitShortHoldEm(NoLimitHoldEm):
     """NoLimitShortHoldEm is the class for No-Limit Short-Deck Hold'em games."""
 
-    def __init__(self, ante: int, button_blind: int, starting_stacks: Sequence[int]):
+    def __init__(self, ante: int, button_blind: int, starting_stacks: Sequence[int],
+                 rng: Optional[Union[RNG, int]] = None):
         super().__init__(2, ShortEvaluator(), ShortDeck(), ante, (0,) * (len(starting_stacks) - 1) + (button_blind,),
-                         starting_stacks)
+                         starting_stacks, rng)
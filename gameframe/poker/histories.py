@@ -0,0 +1,143 @@
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from inspect import signature
+from mmap import ACCESS_READ, mmap
+from os import PathLike
+from typing import Any, Optional, TypeVar, Union
+
+from gameframe.poker import games
+from gameframe.poker.bases import Poker
+from gameframe.poker.utils import apply_actions, parse_actions
+
+_T = TypeVar('_T')
+_SEQUENCE_PARAMETERS = frozenset({'blinds', 'starting_stacks'})
+
+
+def parse_hand(line: str, trusted: bool = False) -> Poker:
+    """Parses the line of a hand history into the poker game it describes.
+
+    Each line consists of tab-separated fields: the name of the poker game class in gameframe.poker.games, the
+    arguments of its constructor, and the space-separated tokens of the hand in the format of parse_poker. Sequence
+    arguments, such as the blinds and the starting stacks, are comma-separated. For instance, a no-limit Texas hold'em
+    hand with the fields below separated by tabs is written as follows:
+
+    NoLimitTexasHoldEm 1 1,2 200,200 dh 0 AcAd dh 1 KsKh br 6 cc db 2c3c4c cc cc db 5c cc cc db 6c cc cc s s
+
+    :param line: The line to parse.
+    :param trusted: True to skip the verification of the actions.
+    :return: The poker game after the actions of the hand.
+    """
+    name, *arguments, tokens = line.rstrip('\r\n').split('\t')
+    factory, converters = _variant(name)
+
+    if len(arguments) != len(converters):
+        raise ValueError('Invalid number of arguments')
+
+    game = factory(*(converter(argument) for converter, argument in zip(converters, arguments)))
+
+    return apply_actions(game, parse_actions(tokens), trusted)
+
+
+def read_hands(
+        path: Union[str, PathLike[str]],
+        function: Optional[Callable[[Poker], _T]] = None,
+        trusted: bool = False,
+        max_workers: int = 0,
+        chunk_size: int = 1 << 24,
+) -> Iterator[Any]:
+    """Lazily reads the hand history file and yields its parsed games, or the results of the function on them.
+
+    The file is memory-mapped and consumed one line at a time, so the memory use does not depend on the size of the
+    file. Empty lines are skipped. The format of each line is described in parse_hand.
+
+    If the number of workers is positive, the file is split into byte ranges of about the chunk size and each worker
+    process maps the file itself and parses the lines that start in its range, so no hand passes through the parent
+    process. The results are still yielded in the order of the file, and at most two ranges per worker are in flight
+    at once. The function and its results must then be picklable, and supplying a function that reduces each game to
+    its final result, such as its payoffs, avoids sending whole games back to the parent process.
+
+    :param path: The path of the hand history file.
+    :param function: The optional function applied to each parsed game.
+    :param trusted: True to skip the verification of the actions.
+    :param max_workers: The number of worker processes, or zero to parse in the current process.
+    :param chunk_size: The approximate number of bytes parsed per task.
+    :return: The iterator of the games or the results.
+    """
+    if max_workers < 0 or chunk_size <= 0:
+        raise ValueError('The number of workers must be non-negative and the chunk size positive')
+
+    with open(path, 'rb') as file:
+        size = file.seek(0, 2)
+
+    if not max_workers:
+        yield from _read_range(path, 0, size, function, trusted)
+    else:
+        with ProcessPoolExecutor(max_workers) as executor:
+            futures = deque[Future[list[Any]]]()
+
+            for start in range(0, size, chunk_size):
+                if len(futures) == 2 * max_workers:
+                    yield from futures.popleft().result()
+
+                futures.append(executor.submit(_read_chunk, path, start, start + chunk_size, function, trusted))
+
+            while futures:
+                yield from futures.popleft().result()
+
+
+@lru_cache
+def _variant(name: str) -> tuple[Callable[..., Poker], Sequence[Callable[[str], Any]]]:
+    factory = getattr(games, name, None)
+
+    if not isinstance(factory, type) or not issubclass(factory, Poker):
+        raise ValueError('Unknown poker game')
+
+    return factory, tuple(
+        _ints if parameter in _SEQUENCE_PARAMETERS else int
+        for parameter in signature(factory).parameters if parameter != 'rng'
+    )
+
+
+def _ints(string: str) -> tuple[int, ...]:
+    return tuple(map(int, string.split(','))) if string else ()
+
+
+def _read_range(
+        path: Union[str, PathLike[str]],
+        start: int,
+        stop: int,
+        function: Optional[Callable[[Poker], Any]],
+        trusted: bool,
+) -> Iterator[Any]:
+    with open(path, 'rb') as file:
+        size = file.seek(0, 2)
+
+        if start >= size:
+            return
+
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+            if start and buffer[start - 1] != ord('\n'):
+                start = buffer.find(b'\n', start) + 1 or size
+
+            while start < min(stop, size):
+                end = buffer.find(b'\n', start)
+                end = size if end == -1 else end
+                line = buffer[start:end].decode()
+                start = end + 1
+
+                if line.strip():
+                    game = parse_hand(line, trusted)
+
+                    yield game if function is None else function(game)
+
+
+def _read_chunk(
+        path: Union[str, PathLike[str]],
+        start: int,
+        stop: int,
+        function: Optional[Callable[[Poker], Any]],
+        trusted: bool,
+) -> list[Any]:
+    return list(_read_range(path, start, stop, function, trusted))
@@ -2,7 +2,7 @@ from abc import ABC
 from enum import Enum, auto
 from typing import Optional, cast
 
-from auxiliary import after, bind
+from auxiliary import bind
 
 from gameframe.poker.bases import Limit, Poker, PokerNature, PokerPlayer, Stage
 
@@ -14,13 +14,7 @@ class DealingStage(Stage, ABC):
         self._card_count = card_count
 
     def _card_target(self, game: Poker) -> int:
-        count = 0
-
-        for stage in game._stages[:game._stages.index(self) + 1]:
-            if isinstance(stage, type(self)):
-                count += stage._card_count
-
-        return count
+        return game._card_targets[game._stages.index(self)]
 
     def _opener(self, game: Poker) -> PokerNature:
         return game.nature
@@ -56,14 +50,14 @@ class BettingStage(Stage, ABC):
         self._behavior: Optional[BettingStage._Behavior] = None
 
     def _skippable(self, game: Poker) -> bool:
-        return super()._skippable(game) or all(not player._relevant for player in game.players) \
+        return super()._skippable(game) or not game._relevant_mask \
                or (game._actor is game._aggressor and self._Behavior.IGNORE != self._behavior is not None) \
                or self._behavior == self._Behavior.FINAL
 
     def _open(self, game: Poker) -> None:
         super()._open(game)
 
-        if any(player._bet for player in game.players):
+        if game._bet_total:
             self._behavior = self._Behavior.IGNORE
             game._bet_raise_count = 1
         else:
@@ -80,11 +74,17 @@ class BettingStage(Stage, ABC):
         if game._actor is game._aggressor:
             self._behavior = self._Behavior.FINAL
 
+    def _save(self) -> 'Optional[BettingStage._Behavior]':
+        return self._behavior
+
+    def _restore(self, state: 'Optional[BettingStage._Behavior]') -> None:
+        self._behavior = state
+
     def _opener(self, game: Poker) -> PokerPlayer:
-        relevant_players = tuple(player for player in game.players if player._relevant)
-        sub_opener = max(relevant_players, key=lambda player: (player._bet, game.players.index(player)))
+        sub_opener = max((player for player in game.players if player._relevant),
+                         key=lambda player: (player._bet, player._index))
 
-        return after(relevant_players, sub_opener, True)
+        return game.players[game._next_seat(sub_opener._index, game._relevant_mask)]
 
     class _Behavior(Enum):
         DEFAULT = auto()
@@ -102,21 +102,27 @@ class DiscardDrawStage(Stage):
         return super()._skippable(game) or (self.__opened and game._actor is self._opener(game))
 
     def _opener(self, game: Poker) -> PokerPlayer:
-        return next(player for player in game.players if not player.mucked)
+        return game.players[game._first_seat(game._active_mask)]
 
     def _open(self, game: Poker) -> None:
         super()._open(game)
 
         self.__opened = True
 
+    def _save(self) -> bool:
+        return self.__opened
+
+    def _restore(self, state: bool) -> None:
+        self.__opened = state
+
 
 class _ShowdownStage(Stage):
     def _skippable(self, game: Poker) -> bool:
-        return super()._skippable(game) or all(player.mucked or player.shown for player in game.players)
+        return super()._skippable(game) or game._shown_count == game._active_count
 
     def _opener(self, game: Poker) -> PokerPlayer:
         if all(player.mucked or player._stack == 0 for player in game.players):
-            return next(player for player in game.players if not player.mucked)
+            return game.players[game._first_seat(game._active_mask)]
         else:
             return game._aggressor
 
@@ -136,10 +142,9 @@ class PotLimit(Limit):
     _max_count = None
 
     def _max_amount(self, game: Poker) -> int:
-        bets = tuple(player._bet for player in game.players)
         actor = cast(PokerPlayer, game._actor)
 
-        return bind(max(bets) + game._pot + sum(bets) + max(bets) - actor._bet, game._max_delta, actor._total)
+        return bind(2 * game._max_bet + game._pot + game._bet_total - actor._bet, game._max_delta, actor._total)
 
 
 class NoLimit(Limit):
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from os import PathLike
+from typing import Any, Final, Union, cast, final
+
+import numpy as np
+import numpy.typing as npt
+
+from gameframe.poker.bases import Poker, PokerPlayer
+from gameframe.poker.batch import BET_RAISE, CHECK_CALL, FOLD
+
+NODE_DTYPE: Final = np.dtype([
+    ('parent', np.int32),
+    ('first_child', np.int32),
+    ('child_count', np.int8),
+    ('actor', np.int8),
+    ('action', np.int8),
+    ('stage', np.int8),
+    ('pot', np.int64),
+])
+
+
+@final
+class BettingTree:
+    """BettingTree is the class for the public betting trees of fixed-limit poker games.
+
+       The nodes are stored in breadth-first order in one structured NumPy array of NODE_DTYPE, so the children of each
+       node are the child_count nodes from its first_child index on. The root is the first betting decision and has no
+       parent. The actor of each node is the index of the acting player or -1 for terminal nodes, the action is the
+       FOLD, CHECK_CALL, or BET_RAISE action that leads to the node or -1 for the root, the stage is the index of the
+       stage of the poker game, and the pot is the total amount of chips put in by the players so far.
+
+       Betting trees are saved as NumPy files, which can be loaded as read-only memory maps, so that several processes
+       share one copy of a tree.
+    """
+
+    def __init__(self, nodes: npt.NDArray[Any]):
+        if nodes.dtype != NODE_DTYPE:
+            raise ValueError('The nodes must be of the node data type')
+
+        self.nodes: Final = nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def parents(self) -> npt.NDArray[np.int32]:
+        """
+        :return: The parent indices of the nodes.
+        """
+        return cast(npt.NDArray[np.int32], self.nodes['parent'])
+
+    @property
+    def actors(self) -> npt.NDArray[np.int8]:
+        """
+        :return: The actor indices of the nodes.
+        """
+        return cast(npt.NDArray[np.int8], self.nodes['actor'])
+
+    @property
+    def actions(self) -> npt.NDArray[np.int8]:
+        """
+        :return: The codes of the actions leading to the nodes.
+        """
+        return cast(npt.NDArray[np.int8], self.nodes['action'])
+
+    @property
+    def stages(self) -> npt.NDArray[np.int8]:
+        """
+        :return: The stage indices of the nodes.
+        """
+        return cast(npt.NDArray[np.int8], self.nodes['stage'])
+
+    @property
+    def pots(self) -> npt.NDArray[np.int64]:
+        """
+        :return: The pots of the nodes.
+        """
+        return cast(npt.NDArray[np.int64], self.nodes['pot'])
+
+    @property
+    def terminals(self) -> npt.NDArray[np.bool_]:
+        """
+        :return: The mask of the terminal nodes.
+        """
+        return self.nodes['actor'] < 0
+
+    def children(self, index: int) -> range:
+        """Determines the indices of the children of the node.
+
+        :param index: The index of the node.
+        :return: The indices of the children.
+        """
+        node = self.nodes[index]
+
+        return range(int(node['first_child']), int(node['first_child']) + int(node['child_count']))
+
+    def save(self, path: Union[str, PathLike[str]]) -> None:
+        """Saves this betting tree as a NumPy file.
+
+        :param path: The path of the file.
+        :return: None.
+        """
+        with open(path, 'wb') as file:
+            np.save(file, self.nodes)
+
+
+def build_betting_tree(game: Poker) -> BettingTree:
+    """Expands the public betting tree of the fixed-limit poker game from its current state.
+
+    Chance nodes are skipped by dealing cards from the top of the deck, and showdowns, discards, and draws are resolved
+    without any choice, as they do not change the betting. The game is left unchanged.
+
+    :param game: The poker game to be expanded.
+    :return: The betting tree.
+    """
+    if game._limit._max_count is None:
+        raise ValueError('Only fixed-limit games have finite betting trees')
+
+    game = game.clone(history=True)
+    records: list[tuple[int, int, int, int, int]] = []
+    children: list[list[int]] = []
+
+    _advance(game)
+    _expand(game, -1, -1, sum(player.starting_stack - player.stack for player in game.players), records, children)
+
+    order = [0]
+
+    for index in order:
+        order.extend(children[index])
+
+    indices = np.empty(len(order), np.int32)
+    indices[order] = np.arange(len(order), dtype=np.int32)
+    nodes = np.empty(len(order), NODE_DTYPE)
+    first_child = 1
+
+    for i, index in enumerate(order):
+        parent, actor, action, stage, pot = records[index]
+        nodes[i] = (
+            parent if parent < 0 else indices[parent], first_child, len(children[index]), actor, action, stage, pot,
+        )
+        first_child += len(children[index])
+
+    return BettingTree(nodes)
+
+
+def load_betting_tree(path: Union[str, PathLike[str]], mmap: bool = True) -> BettingTree:
+    """Loads the betting tree from the NumPy file.
+
+    :param path: The path of the file.
+    :param mmap: True to map the file into memory as read-only instead of reading it.
+    :return: The betting tree.
+    """
+    return BettingTree(np.load(path, 'r' if mmap else None))
+
+
+def _advance(game: Poker) -> int:
+    count = 0
+
+    while not game.terminal and not _is_betting(game):
+        if game.actor is game.nature:
+            if game.nature.can_deal_hole():
+                game.nature.deal_hole(next(game.nature.dealable_players))
+            else:
+                game.nature.deal_board()
+        elif cast(PokerPlayer, game.actor).can_showdown():
+            cast(PokerPlayer, game.actor).showdown()
+        else:
+            cast(PokerPlayer, game.actor).discard_draw()
+
+        count += 1
+
+    return count
+
+
+def _is_betting(game: Poker) -> bool:
+    return isinstance(game.actor, PokerPlayer) and (
+            game.actor.can_fold() or game.actor.can_check_call() or game.actor.can_bet_raise()
+    )
+
+
+def _expand(
+        game: Poker,
+        parent: int,
+        action: int,
+        pot: int,
+        records: list[tuple[int, int, int, int, int]],
+        children: list[list[int]],
+) -> None:
+    count = _advance(game)
+    index = len(records)
+    player = cast(PokerPlayer, game.actor)
+
+    records.append((parent, -1 if game.terminal else game.players.index(player), action, game._stage_index, pot))
+    children.append([])
+
+    if parent >= 0:
+        children[parent].append(index)
+
+    if not game.terminal:
+        if player.can_fold():
+            player.fold()
+            _expand(game, index, FOLD, pot, records, children)
+            game.undo()
+
+        if player.can_check_call():
+            amount = min(max(opponent.bet for opponent in game.players) - player.bet, player.stack)
+
+            player.check_call()
+            _expand(game, index, CHECK_CALL, pot + amount, records, children)
+            game.undo()
+
+        if player.can_bet_raise():
+            amount = player.min_bet_raise - player.bet
+
+            player.bet_raise()
+            _expand(game, index, BET_RAISE, pot + amount, records, children)
+            game.undo()
+
+    for _ in range(count):
+        game.undo()
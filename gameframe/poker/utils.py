@@ -1,44 +1,214 @@
 import re
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
+from random import Random
+from typing import Any, Optional, Union, cast
 
-from pokertools import parse_cards
+from pokertools import Card, parse_cards
 
-from gameframe.poker.bases import Poker, PokerPlayer
+from gameframe.game import RNG
+from gameframe.poker._actions import (BetRaiseAction, BoardDealingAction, CheckCallAction, DiscardDrawAction,
+                                      FoldAction, HoleDealingAction, PokerAction, RunOutAction, ShowdownAction)
+from gameframe.poker.bases import Poker, PokerNature, PokerPlayer
+from gameframe.poker.parameters import DealingStage
 
+_CARDS = r'(?:[2-9TJQKA][cdhs])'
+_TOKEN = re.compile(
+    r'(?P<br>br(?: (?P<amount>\d+))?)'
+    r'|(?P<cc>cc)'
+    r'|(?P<f>f)'
+    rf'|(?P<dd>dd(?: (?P<discards>{_CARDS}*))?(?: (?P<draws>{_CARDS}*))?)'
+    r'|(?P<s>s(?: (?P<force>[01]))?)'
+    rf'|(?P<dh>dh (?P<index>\d+)(?: (?P<hole>{_CARDS}+))?)'
+    rf'|(?P<db>db(?: (?P<board>{_CARDS}+))?)'
+    r'|(?P<ro>ro(?: (?P<times>\d+))?)'
+)
+_STREAM_TOKEN = re.compile(rf'[ \t]*(?:{_TOKEN.pattern})(?=[ \t]|$)')
 
-def parse_poker(game: Poker, tokens: Iterable[str]) -> Poker:
+
+def parse_poker(
+        game: Poker,
+        tokens: Union[str, Iterable[str]],
+        trusted: bool = False,
+        spot_check_rate: float = 0,
+        rng: Optional[Union[RNG, int]] = None,
+) -> Poker:
     """Parses the tokens as actions and applies them the supplied poker game.
 
+    Trusted tokens, such as those of hand histories that were validated when recorded, are applied without verifying
+    the actions, except for the hands that are spot-checked at the optional rate. Applying invalid tokens as trusted
+    ones leaves the game in an undefined state.
+
     :param game: The poker game to be applied on.
-    :param tokens: The tokens to parse as actions.
+    :param tokens: The tokens to parse as actions, or the string of space-separated tokens.
+    :param trusted: True to skip the verification of the actions.
+    :param spot_check_rate: The probability of verifying the actions of the trusted tokens anyway.
+    :param rng: The optional random number generator or seed of the spot checks.
     :return: None.
     """
-    for token in tokens:
-        if isinstance(game._actor, PokerPlayer):
-            if match := re.fullmatch(r'br( (?P<amount>\d+))?', token):
-                game._actor.bet_raise(None if (amount := match.group('amount')) is None else int(amount))
-            elif token == 'cc':
-                game._actor.check_call()
-            elif token == 'f':
-                game._actor.fold()
-            elif match := re.fullmatch(r'dd( (?P<froms>\w*))?( (?P<tos>\w*))?', token):
-                game._actor.discard_draw(
-                    () if (cards := match.group('froms')) is None else parse_cards(cards),
-                    None if (cards := match.group('tos')) is None else parse_cards(cards),
-                )
-            elif match := re.fullmatch(r's( (?P<force>[0|1]))?', token):
-                game._actor.showdown(False if (force := match.group('force')) is None else bool(force))
-            else:
-                raise ValueError('Invalid command')
-        else:
-            if match := re.fullmatch(r'dh (?P<index>\d+)( (?P<cards>\w+))?', token):
-                game.nature.deal_hole(
-                    game.players[int(match.group('index'))],
-                    None if (cards := match.group('cards')) is None else parse_cards(cards),
-                )
-            elif match := re.fullmatch(r'db( (?P<cards>\w+))?', token):
-                game.nature.deal_board(None if (cards := match.group('cards')) is None else parse_cards(cards))
-            else:
+    return apply_actions(game, parse_actions(tokens), trusted, spot_check_rate, rng)
+
+
+def parse_actions(tokens: Union[str, Iterable[str]]) -> list[tuple[Any, ...]]:
+    """Parses the tokens into a compact list of actions.
+
+    Each action is a tuple of its token name and its arguments. Tokens are either given separately or as one string of
+    space-separated tokens. The list can be applied to any number of games with apply_actions.
+
+    :param tokens: The tokens to parse, or the string of space-separated tokens.
+    :return: The parsed actions.
+    """
+    actions = []
+
+    if isinstance(tokens, str):
+        index = 0
+
+        while match := _STREAM_TOKEN.match(tokens, index):
+            actions.append(_parse_action(match))
+            index = match.end()
+
+        if tokens[index:].strip():
+            raise ValueError('Invalid command')
+    else:
+        for token in tokens:
+            if (match := _TOKEN.fullmatch(token)) is None:
                 raise ValueError('Invalid command')
 
+            actions.append(_parse_action(match))
+
+    return actions
+
+
+def parse_action_log(log: str) -> Iterator[list[tuple[Any, ...]]]:
+    """Parses the newline-delimited log of hands into the compact lists of actions of each hand.
+
+    Every non-empty line of the log is a string of space-separated tokens.
+
+    :param log: The log to parse.
+    :return: The iterator of the parsed actions of each hand.
+    """
+    for line in log.splitlines():
+        if line.strip():
+            yield parse_actions(line)
+
+
+def apply_actions(
+        game: Poker,
+        actions: Iterable[tuple[Any, ...]],
+        trusted: bool = False,
+        spot_check_rate: float = 0,
+        rng: Optional[Union[RNG, int]] = None,
+) -> Poker:
+    """Applies the parsed actions to the supplied poker game.
+
+    :param game: The poker game to be applied on.
+    :param actions: The actions parsed by parse_actions.
+    :param trusted: True to skip the verification of the actions.
+    :param spot_check_rate: The probability of verifying the actions anyway if trusted.
+    :param rng: The optional random number generator or seed of the spot checks.
+    :return: The poker game.
+    """
+    if trusted and spot_check_rate:
+        rng = Random(rng) if rng is None or isinstance(rng, int) else rng
+        trusted = rng.random() >= spot_check_rate
+
+    for name, *arguments in actions:
+        if (name in _PLAYER_ACTIONS) != isinstance(game._actor, PokerPlayer):
+            raise ValueError('Invalid command')
+
+        _ACTIONS[name](game, trusted, *arguments).act(trusted)
+
     return game
+
+
+@lru_cache(maxsize=1 << 16)
+def _cards(string: str) -> tuple[Card, ...]:
+    return tuple(parse_cards(string))
+
+
+def _parse_action(match: re.Match[str]) -> tuple[Any, ...]:
+    name = match.lastgroup
+
+    if name == 'br':
+        return name, None if (amount := match['amount']) is None else int(amount)
+    elif name == 'dd':
+        return name, _cards(match['discards'] or ''), None if (draws := match['draws']) is None else _cards(draws)
+    elif name == 's':
+        return name, match['force'] == '1'
+    elif name == 'dh':
+        return name, int(match['index']), None if (hole := match['hole']) is None else _cards(hole)
+    elif name == 'db':
+        return name, None if (board := match['board']) is None else _cards(board)
+    elif name == 'ro':
+        return name, 1 if (times := match['times']) is None else int(times)
+    else:
+        return cast(str, name),
+
+
+def _bet_raise(game: Poker, trusted: bool, amount: Optional[int]) -> PokerAction[PokerPlayer]:
+    actor = cast(PokerPlayer, game._actor)
+
+    if amount is None:
+        amount = game._limit._min_amount(game) if trusted else actor.min_bet_raise
+
+    return BetRaiseAction(game, actor, amount)
+
+
+def _check_call(game: Poker, trusted: bool) -> PokerAction[PokerPlayer]:
+    return CheckCallAction(game, cast(PokerPlayer, game._actor))
+
+
+def _fold(game: Poker, trusted: bool) -> PokerAction[PokerPlayer]:
+    return FoldAction(game, cast(PokerPlayer, game._actor))
+
+
+def _discard_draw(
+        game: Poker, trusted: bool, discards: tuple[Card, ...], draws: Optional[tuple[Card, ...]],
+) -> PokerAction[PokerPlayer]:
+    actor = cast(PokerPlayer, game._actor)
+
+    if draws is None:
+        return DiscardDrawAction(game, actor, discards, game._peek(len(discards)), True)
+    else:
+        return DiscardDrawAction(game, actor, discards, draws)
+
+
+def _showdown(game: Poker, trusted: bool, force: bool) -> PokerAction[PokerPlayer]:
+    return ShowdownAction(game, cast(PokerPlayer, game._actor), force)
+
+
+def _deal_hole(game: Poker, trusted: bool, index: int, cards: Optional[tuple[Card, ...]]) -> PokerAction[PokerNature]:
+    if cards is not None:
+        return HoleDealingAction(game, game.nature, game.players[index], cards)
+    elif trusted:
+        count = cast(DealingStage, game._stage)._card_count
+
+        return HoleDealingAction(game, game.nature, game.players[index], game._peek(count), True)
+    else:
+        return HoleDealingAction(game, game.nature, game.players[index], game._peek(game.nature.hole_deal_count), True)
+
+
+def _deal_board(game: Poker, trusted: bool, cards: Optional[tuple[Card, ...]]) -> PokerAction[PokerNature]:
+    if cards is not None:
+        return BoardDealingAction(game, game.nature, cards)
+    elif trusted:
+        return BoardDealingAction(game, game.nature, game._peek(cast(DealingStage, game._stage)._card_count), True)
+    else:
+        return BoardDealingAction(game, game.nature, game._peek(game.nature.board_deal_count), True)
+
+
+def _run_out(game: Poker, trusted: bool, times: int) -> PokerAction[PokerNature]:
+    return RunOutAction(game, game.nature, None, times)
+
+
+_ACTIONS: dict[str, Callable[..., PokerAction[Any]]] = {
+    'br': _bet_raise,
+    'cc': _check_call,
+    'f': _fold,
+    'dd': _discard_draw,
+    's': _showdown,
+    'dh': _deal_hole,
+    'db': _deal_board,
+    'ro': _run_out,
+}
+_PLAYER_ACTIONS = frozenset(('br', 'cc', 'f', 'dd', 's'))
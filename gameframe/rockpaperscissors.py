@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 from enum import auto
-from typing import Any, Optional, final
+from typing import Any, Optional, Union, final
 
 from auxiliary import OrderedEnum
 from auxiliary import default, get
 
 from gameframe.exceptions import ActionException
-from gameframe.game import Game, _Action
+from gameframe.game import Game, RNG, _Action
 
 
 @final
@@ -51,8 +51,8 @@ class RockPaperScissorsPlayer:
 class RockPaperScissors(Game[None, RockPaperScissorsPlayer]):
     """RockPaperScissors is the class for rock paper scissors games."""
 
-    def __init__(self) -> None:
-        super().__init__(None, (RockPaperScissorsPlayer(self), RockPaperScissorsPlayer(self)))
+    def __init__(self, rng: Optional[Union[RNG, int]] = None) -> None:
+        super().__init__(None, (RockPaperScissorsPlayer(self), RockPaperScissorsPlayer(self)), rng)
 
     @property
     def winner(self) -> Optional[RockPaperScissorsPlayer]:
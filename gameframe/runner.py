@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import zip_longest
+from random import Random
+from typing import Any, Final, Optional, cast, final
+
+from auxiliary import default
+
+from gameframe.poker import Poker, PokerNature, PokerPlayer
+from gameframe.rockpaperscissors import RockPaperScissors, RockPaperScissorsHand
+from gameframe.tictactoe import TicTacToe
+
+Factory = Callable[[Random], Any]
+Policy = Callable[[Any, Random], str]
+Payoff = Callable[[Any], Sequence[int]]
+
+
+@final
+class RolloutSummary:
+    """RolloutSummary is the class for aggregated results of simulated games.
+
+       The payoffs are summed per player index and the action counts are keyed by the labels returned from the policy.
+       Summaries are added together to merge the results of several chunks.
+    """
+
+    def __init__(
+            self,
+            game_count: int = 0,
+            payoffs: Sequence[int] = (),
+            action_counts: Optional[Mapping[str, int]] = None,
+    ):
+        self.game_count: Final = game_count
+        self.payoffs: Final = tuple(payoffs)
+        self.action_counts: Final = dict(default(action_counts, {}))
+
+    def __add__(self, other: RolloutSummary) -> RolloutSummary:
+        return RolloutSummary(
+            self.game_count + other.game_count,
+            tuple(x + y for x, y in zip_longest(self.payoffs, other.payoffs, fillvalue=0)),
+            Counter(self.action_counts) + Counter(other.action_counts),
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RolloutSummary):
+            return (self.game_count, self.payoffs, self.action_counts) \
+                   == (other.game_count, other.payoffs, other.action_counts)
+        else:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'RolloutSummary({self.game_count}, {self.payoffs}, {self.action_counts})'
+
+
+def random_policy(game: Any, rng: Random) -> str:
+    """Applies a uniformly random legal action to the poker, tic tac toe, or rock paper scissors game.
+
+    Poker bet/raise amounts are drawn uniformly between the minimum and maximum amounts and discards are drawn as
+    random subsets of the hole cards that the deck can replace. All dealt cards are taken from the deck of the game.
+
+    :param game: The game to be applied on.
+    :param rng: The random number generator to use.
+    :return: The name of the applied action.
+    """
+    if isinstance(game, Poker):
+        if isinstance(game.actor, PokerNature):
+            nature_actions = game.actor.legal_actions()
+
+            if nature_actions.can_deal_hole:
+                game.actor.deal_hole(nature_actions.dealable_players[0])
+
+                return 'deal_hole'
+            else:
+                game.actor.deal_board()
+
+                return 'deal_board'
+        elif isinstance(game.actor, PokerPlayer):
+            player_actions = game.actor.legal_actions()
+            names = []
+
+            if player_actions.can_fold:
+                names.append('fold')
+            if player_actions.can_check_call:
+                names.append('check_call')
+            if player_actions.can_bet_raise:
+                names.append('bet_raise')
+            if player_actions.can_discard_draw:
+                names.append('discard_draw')
+            if player_actions.can_showdown:
+                names.append('showdown')
+
+            name = rng.choice(names)
+
+            if name == 'fold':
+                game.actor.fold()
+            elif name == 'check_call':
+                game.actor.check_call()
+            elif name == 'bet_raise':
+                game.actor.bet_raise(rng.randint(
+                    cast(int, player_actions.min_bet_raise), cast(int, player_actions.max_bet_raise),
+                ))
+            elif name == 'discard_draw':
+                count = rng.randint(0, min(len(game.actor.hole), bin(game.deck_mask).count('1')))
+                game.actor.discard_draw(rng.sample(game.actor.hole, count))
+            else:
+                game.actor.showdown()
+
+            return name
+    elif isinstance(game, TicTacToe):
+        if game.actor is not None:
+            game.actor.mark(*rng.choice(tuple(game.empty_coords)))
+
+            return 'mark'
+    elif isinstance(game, RockPaperScissors):
+        for player in game.players:
+            if player.hand is None:
+                player.throw(rng.choice(tuple(RockPaperScissorsHand)))
+
+                return 'throw'
+
+    raise ValueError('The game cannot be acted on')
+
+
+def payoffs(game: Any) -> Sequence[int]:
+    """Determines the payoffs of the players of the terminal poker, tic tac toe, or rock paper scissors game.
+
+    Poker payoffs are the net stack changes and other games score a win as 1 and a loss as -1.
+
+    :param game: The terminal game.
+    :return: The payoffs of the players.
+    """
+    if isinstance(game, Poker):
+        return tuple(player.stack - player.starting_stack for player in game.players)
+    elif isinstance(game, (TicTacToe, RockPaperScissors)):
+        if game.winner is None:
+            return (0,) * len(game.players)
+        else:
+            return tuple(1 if player is game.winner else -1 for player in game.players)
+    else:
+        raise ValueError('The game has no defined payoffs')
+
+
+def game_rng(seed: int, index: int) -> Random:
+    """Creates the random number generator of the game at the index.
+
+    The stream depends only on the seed and the index, so the games are reproducible regardless of how they are
+    sharded.
+
+    :param seed: The seed of the simulation.
+    :param index: The index of the game.
+    :return: The random number generator of the game.
+    """
+    return Random(f'{seed}:{index}')
+
+
+def _rollout(factory: Factory, policy: Policy, payoff: Payoff, seed: int, start: int, stop: int) -> RolloutSummary:
+    totals: list[int] = []
+    action_counts = Counter[str]()
+
+    for index in range(start, stop):
+        rng = game_rng(seed, index)
+        game = factory(rng)
+
+        while not game.terminal:
+            action_counts[policy(game, rng)] += 1
+
+        for i, value in enumerate(payoff(game)):
+            if i < len(totals):
+                totals[i] += value
+            else:
+                totals.append(value)
+
+    return RolloutSummary(stop - start, totals, action_counts)
+
+
+def stream_rollouts(
+        factory: Factory,
+        count: int,
+        seed: int = 0,
+        policy: Policy = random_policy,
+        payoff: Payoff = payoffs,
+        chunk_size: int = 1000,
+        max_workers: Optional[int] = None,
+) -> Iterator[RolloutSummary]:
+    """Simulates the games across a process pool and yields the summary of each chunk as it completes.
+
+    The factory, policy, and payoff function must be picklable, so they should be defined at the module level or be
+    partial objects of such. The factory is called with the random number generator of the game, which the policy
+    also receives.
+
+    :param factory: The function that creates a game.
+    :param count: The number of games to simulate.
+    :param seed: The seed of the simulation.
+    :param policy: The function that applies an action and returns its name.
+    :param payoff: The function that determines the payoffs of a terminal game.
+    :param chunk_size: The number of games simulated per task.
+    :param max_workers: The maximum number of worker processes.
+    :return: The iterator of the chunk summaries in order of completion.
+    """
+    if chunk_size <= 0:
+        raise ValueError('The chunk size must be positive')
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(_rollout, factory, policy, payoff, seed, start, min(start + chunk_size, count))
+            for start in range(0, count, chunk_size)
+        ]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_rollouts(
+        factory: Factory,
+        count: int,
+        seed: int = 0,
+        policy: Policy = random_policy,
+        payoff: Payoff = payoffs,
+        chunk_size: int = 1000,
+        max_workers: Optional[int] = None,
+) -> RolloutSummary:
+    """Simulates the games across a process pool and aggregates their results.
+
+    The summary is identical for any number of workers and any chunk size.
+
+    :param factory: The function that creates a game.
+    :param count: The number of games to simulate.
+    :param seed: The seed of the simulation.
+    :param policy: The function that applies an action and returns its name.
+    :param payoff: The function that determines the payoffs of a terminal game.
+    :param chunk_size: The number of games simulated per task.
+    :param max_workers: The maximum number of worker processes.
+    :return: The summary of all games.
+    """
+    return sum(stream_rollouts(factory, count, seed, policy, payoff, chunk_size, max_workers), RolloutSummary())
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable, Sequence
+from math import inf
+from time import perf_counter
+from typing import Any, Final, Generic, Optional, TypeVar, final
+
+from gameframe.sequential import SequentialGame
+
+_SG = TypeVar('_SG', bound=SequentialGame[Any, Any])
+_M = TypeVar('_M')
+
+_EXACT = 0
+_LOWER = 1
+_UPPER = 2
+
+
+class SearchAdapter(Generic[_SG, _M], ABC):
+    """SearchAdapter is the abstract generic base class for all adapters of deterministic two-player sequential games
+       to the search.
+
+       Adapters generate and play the moves of the games, which are undone through the undo method of the games. The
+       keys of the states must be hashable and equal exactly when the states are, including the actors. Scores and
+       evaluations are from the perspective of the first player of the games.
+    """
+
+    @abstractmethod
+    def moves(self, game: _SG) -> Iterable[_M]:
+        """Generates the legal moves of the actor of the non-terminal game.
+
+        :param game: The game.
+        :return: The legal moves.
+        """
+        pass
+
+    @abstractmethod
+    def play(self, game: _SG, move: _M) -> None:
+        """Plays the legal move in the game.
+
+        :param game: The game.
+        :param move: The move to play.
+        :return: None.
+        """
+        pass
+
+    @abstractmethod
+    def key(self, game: _SG) -> Hashable:
+        """Determines the key of the state of the game.
+
+        :param game: The game.
+        :return: The key of the state.
+        """
+        pass
+
+    @abstractmethod
+    def score(self, game: _SG) -> float:
+        """Scores the terminal game.
+
+        :param game: The terminal game.
+        :return: The score of the first player.
+        """
+        pass
+
+    def evaluate(self, game: _SG) -> float:
+        """Evaluates the non-terminal game at the depth limit of the search.
+
+        :param game: The game.
+        :return: The evaluation for the first player.
+        """
+        return 0
+
+    def order(self, game: _SG, moves: Iterable[_M]) -> Sequence[_M]:
+        """Orders the moves so that the likely best moves are searched first.
+
+        The move stored in the transposition table is always searched first regardless of this ordering.
+
+        :param game: The game.
+        :param moves: The moves to order.
+        :return: The ordered moves.
+        """
+        return tuple(moves)
+
+
+@final
+class TranspositionTable:
+    """TranspositionTable is the class for bounded transposition tables.
+
+       Entries are stored in a fixed number of slots, which are indexed by the hashes of the keys of the states. When
+       two states collide, the entry of the current search replaces that of an older search, and otherwise the entry
+       whose subtree took more nodes to search is kept.
+    """
+
+    def __init__(self, size: int = 1 << 20):
+        if size <= 0:
+            raise ValueError('The size must be positive')
+
+        self.size: Final = size
+        self.probe_count = 0
+        self.hit_count = 0
+        self._generation = 0
+        self._entries: list[Optional[tuple[Hashable, float, float, int, Any, int, int]]] = [None] * size
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        :return: The fraction of the probes that found their states.
+        """
+        return self.hit_count / self.probe_count if self.probe_count else 0
+
+    def clear(self) -> None:
+        """Clears the entries and the statistics of this transposition table.
+
+        :return: None.
+        """
+        self.probe_count = 0
+        self.hit_count = 0
+        self._entries = [None] * self.size
+
+    def _probe(self, key: Hashable) -> Optional[tuple[Hashable, float, float, int, Any, int, int]]:
+        self.probe_count += 1
+        entry = self._entries[hash(key) % self.size]
+
+        if entry is not None and entry[0] == key:
+            self.hit_count += 1
+
+            return entry
+        else:
+            return None
+
+    def _store(self, key: Hashable, depth: float, value: float, flag: int, move: Any, node_count: int) -> None:
+        index = hash(key) % self.size
+        entry = self._entries[index]
+
+        if entry is None or entry[0] == key or entry[6] != self._generation or entry[5] <= node_count:
+            self._entries[index] = key, depth, value, flag, move, node_count, self._generation
+
+
+@final
+class SearchResult(Generic[_M]):
+    """SearchResult is the class for the results of searches.
+
+       The value is from the perspective of the actor of the searched game. If the game is terminal, the value is the
+       score of the first player and the best move is None. The transposition table statistics only count the probes
+       of the search.
+    """
+
+    def __init__(
+            self,
+            value: float,
+            move: Optional[_M],
+            node_count: int,
+            elapsed_time: float,
+            probe_count: int,
+            hit_count: int,
+    ):
+        self.value: Final = value
+        self.move: Final = move
+        self.node_count: Final = node_count
+        self.elapsed_time: Final = elapsed_time
+        self.probe_count: Final = probe_count
+        self.hit_count: Final = hit_count
+
+    @property
+    def nodes_per_second(self) -> float:
+        """
+        :return: The number of nodes searched per second.
+        """
+        return self.node_count / self.elapsed_time if self.elapsed_time else inf
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        :return: The fraction of the transposition table probes that found their states.
+        """
+        return self.hit_count / self.probe_count if self.probe_count else 0
+
+    def __repr__(self) -> str:
+        return f'SearchResult({self.value}, {self.move}, {self.node_count}, {self.nodes_per_second:.0f} nodes/s, ' \
+               f'{self.hit_rate:.1%} hits)'
+
+
+@final
+class AlphaBetaSearch(Generic[_SG, _M]):
+    """AlphaBetaSearch is the class for negamax searches with alpha-beta pruning of deterministic two-player sequential
+       games.
+
+       The searches share the transposition table, which is kept between the searches so that later searches reuse the
+       earlier results. Each game is searched on a clone with its history enabled, which is backtracked with its undo
+       method, so the game itself is left unchanged.
+    """
+
+    def __init__(self, adapter: SearchAdapter[_SG, _M], table: Optional[TranspositionTable] = None):
+        self.adapter: Final = adapter
+        self.table: Final = TranspositionTable() if table is None else table
+
+        self.__node_count = 0
+
+    def search(self, game: _SG, depth: Optional[int] = None) -> SearchResult[_M]:
+        """Searches the game.
+
+        :param game: The game to be searched.
+        :param depth: The optional depth limit in moves, at which the games are evaluated by the adapter.
+        :return: The result of the search.
+        """
+        if game.terminal:
+            return SearchResult(self.adapter.score(game), None, 1, 0, 0, 0)
+
+        game = game.clone(history=True)
+        self.table._generation += 1
+        self.__node_count = 0
+        probe_count = self.table.probe_count
+        hit_count = self.table.hit_count
+        start_time = perf_counter()
+        color = 1 if game.actor is game.players[0] else -1
+        value, move = self.__negamax(game, inf if depth is None else depth, -inf, inf, color)
+
+        return SearchResult(
+            value,
+            move,
+            self.__node_count,
+            perf_counter() - start_time,
+            self.table.probe_count - probe_count,
+            self.table.hit_count - hit_count,
+        )
+
+    def __negamax(self, game: _SG, depth: float, alpha: float, beta: float, color: int) -> tuple[float, Optional[_M]]:
+        if game.terminal:
+            self.__node_count += 1
+
+            return color * self.adapter.score(game), None
+        elif color != (1 if game.actor is game.players[0] else -1):
+            return -self.__negamax(game, depth, -beta, -alpha, -color)[0], None
+
+        self.__node_count += 1
+
+        if not depth:
+            return color * self.adapter.evaluate(game), None
+
+        key = self.adapter.key(game)
+        entry = self.table._probe(key)
+        moves = self.adapter.order(game, self.adapter.moves(game))
+
+        if entry is not None:
+            _, entry_depth, value, flag, move, _, _ = entry
+
+            if entry_depth >= depth:
+                if flag == _EXACT:
+                    return value, move
+                elif flag == _LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+
+                if alpha >= beta:
+                    return value, move
+
+            if move in moves:
+                moves = (move,) + tuple(other for other in moves if other != move)
+
+        node_count = self.__node_count
+        initial_alpha = alpha
+        best_value = -inf
+        best_move = None
+
+        for move in moves:
+            self.adapter.play(game, move)
+            value = self.__negamax(game, depth - 1, alpha, beta, color)[0]
+            game.undo()
+
+            if value > best_value:
+                best_value, best_move = value, move
+
+                if value > alpha:
+                    alpha = value
+
+                    if alpha >= beta:
+                        break
+
+        if best_value <= initial_alpha:
+            flag = _UPPER
+        elif best_value >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+
+        self.table._store(key, depth, best_value, flag, best_move, self.__node_count - node_count)
+
+        return best_value, best_move
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
+from copy import copy, deepcopy
+from random import Random
 from typing import Any, Optional, TypeVar, Union, final
 
 from gameframe.exceptions import ActionException
-from gameframe.game import Game, _A, _Action, _N, _P
+from gameframe.game import Game, RNG, _A, _Action, _N, _P
+
+_SG = TypeVar('_SG', bound='SequentialGame[Any, Any]')
 
 
 class SequentialGame(Game[_N, _P], ABC):
@@ -13,10 +17,17 @@ class SequentialGame(Game[_N, _P], ABC):
        is terminal, its actor attribute must be set to None to denote such.
     """
 
-    def __init__(self, nature: _N, players: Iterable[_P], actor: Optional[Union[_N, _P]]):
-        super().__init__(nature, players)
+    def __init__(
+            self,
+            nature: _N,
+            players: Iterable[_P],
+            actor: Optional[Union[_N, _P]],
+            rng: Optional[Union[RNG, int]] = None,
+    ):
+        super().__init__(nature, players, rng)
 
         self._actor = actor
+        self._history: Optional[list[_SequentialAction[Any, Any]]] = None
 
     @property
     @final
@@ -31,8 +42,52 @@ class SequentialGame(Game[_N, _P], ABC):
     def terminal(self) -> bool:
         return self._actor is None
 
+    @final
+    def clone(self: _SG, rng: Optional[Union[RNG, int]] = None, history: bool = False) -> _SG:
+        """Clones this sequential game.
+
+        Only the mutable state of this sequential game is copied, while the immutable parts are shared with the clone.
+        By default, the random number generator is copied as well, so the clone reproduces the random draws of this
+        game. If a random number generator or seed is given instead, the clone draws from it and any random outcomes
+        this game has prepared but not yet revealed are redrawn, so the clone diverges from this game.
+
+        If the history is enabled, the clone records the actions applied to it so that they can be undone. Recording
+        is off by default, as games that are never undone would otherwise keep every action they have seen.
+
+        :param rng: The optional random number generator or seed of the clone, defaults to a copy of that of this game.
+        :param history: True to record the actions applied to the clone, defaults to False.
+        :return: The clone of this sequential game.
+        """
+        game = copy(self)
+        game._history = [] if history else None
+        game._rng = deepcopy(self._rng) if rng is None else Random(rng) if isinstance(rng, int) else rng
+        self._clone(game)
+
+        if rng is not None:
+            game._reseed()
+
+        return game
+
+    @final
+    def undo(self) -> None:
+        """Undoes the last action applied to this sequential game.
+
+        Only the changes made by the action are reverted, so undoing costs as much as applying the action did. Only
+        the clones with their history enabled record their actions.
+
+        :return: None.
+        """
+        if not self._history:
+            raise ActionException('There is no action to undo')
+
+        self._history.pop().undo()
+
+    @abstractmethod
+    def _clone(self, game: Any) -> None:
+        pass
 
-_SG = TypeVar('_SG', bound=SequentialGame[Any, Any])
+    def _reseed(self) -> None:
+        pass
 
 
 class _SequentialAction(_Action[_SG, _A], ABC):
@@ -41,11 +96,23 @@ class _SequentialAction(_Action[_SG, _A], ABC):
     def next_actor(self) -> Any:
         pass
 
-    def act(self) -> None:
-        super().act()
+    def act(self, trusted: bool = False) -> None:
+        super().act(trusted)
 
         self.game._actor = self.next_actor
 
+        if self.game._history is not None:
+            self.game._history.append(self)
+
+    def undo(self) -> None:
+        self.unapply()
+
+        self.game._actor = self.actor
+
+    @abstractmethod
+    def unapply(self) -> None:
+        pass
+
     def verify(self) -> None:
         super().verify()
 
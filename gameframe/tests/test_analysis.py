@@ -0,0 +1,136 @@
+from importlib.util import find_spec
+from itertools import combinations
+from random import Random
+from unittest import TestCase, main, skipUnless
+from unittest.mock import Mock, patch
+
+from gameframe.poker import (NoLimitShortHoldEm, NoLimitTexasHoldEm, Poker, PotLimitOmahaHoldEm, equity, exact_equity,
+                             parse_poker)
+
+
+class EquityTestCase(TestCase):
+    def test_sampling(self) -> None:
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 200)), ('dh 0 AsAh', 'dh 1 KsKh'))
+        result = equity(game, 20000, 0)
+
+        self.assertEqual(result.sample_count, 20000)
+        self.assertAlmostEqual(sum(result.equities), 1)
+        self.assertLess(abs(result.equities[0] - 0.82), 5 * result.equity_errors[0])
+        self.assertAlmostEqual(result.equities[0], result.wins[0] + result.ties[0] / 2)
+        self.assertEqual(equity(game, 1000, 1).equities, equity(game, 1000, 1).equities)
+
+        result = equity(game, 100000, 0, 500, 0.02)
+
+        self.assertLess(result.sample_count, 100000)
+        self.assertLessEqual(1.96 * result.equity_errors[0], 0.02)
+
+    @skipUnless(find_spec('numpy'), 'NumPy is not installed')
+    def test_numpy_rng(self) -> None:
+        from numpy.random import default_rng
+
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 200)), ('dh 0 AsAh', 'dh 1 KsKh'))
+
+        self.assertEqual(equity(game, 1000, default_rng(1)).equities, equity(game, 1000, default_rng(1)).equities)
+
+    def test_game_rng(self) -> None:
+        rng = Random(0)
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 200), rng), ('dh 0 AsAh', 'dh 1 KsKh'))
+        state = rng.getstate()
+
+        equity(game, 1000)
+
+        self.assertEqual(rng.getstate(), state)
+
+    def test_unknown_cards(self) -> None:
+        game = parse_poker(PotLimitOmahaHoldEm(1, (1, 2), (200, 200, 200)), ('dh 0 AsAhKsKh',))
+        result = equity(game, 2000, 0)
+
+        self.assertAlmostEqual(sum(result.equities), 1)
+        self.assertGreater(result.equities[0], max(result.equities[1:]))
+
+        result = equity(parse_poker(game, ('dh 1', 'dh 2', 'f')), 2000, 0)
+
+        self.assertEqual(sum(result.equities), 1)
+        self.assertEqual(
+            tuple(player.mucked for player in game.players), tuple(share == 0 for share in result.equities),
+        )
+
+    def test_river(self) -> None:
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 200, 200)), (
+            'dh 0 AsAh', 'dh 1 AdAc', 'dh 2 7c2d', 'f', 'cc', 'cc',
+            'db 2s3s4s', 'cc', 'cc', 'db 5c', 'cc', 'cc', 'db 9d',
+        ))
+        result = equity(game)
+
+        self.assertEqual(result.sample_count, 1)
+        self.assertEqual(result.equities, (0.5, 0.5, 0))
+        self.assertEqual(result.ties, (1, 1, 0))
+        self.assertEqual(result.equity_errors, (0, 0, 0))
+
+
+class ExactEquityTestCase(TestCase):
+    def test_enumeration(self) -> None:
+        games = (
+            parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 200, 200)), (
+                'dh 0 AsAh', 'dh 1 KsQs', 'dh 2 7c2d', 'cc', 'cc', 'cc', 'db 9s8hTc', 'cc', 'cc', 'cc',
+            )),
+            parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 200)), ('dh 0 AsKs', 'dh 1 QhQd', 'cc', 'cc', 'db 2c3c4c')),
+            parse_poker(NoLimitShortHoldEm(1, 2, (200, 200)), ('dh 0 AcKc', 'dh 1 6d6h', 'cc', 'cc', 'db 7s8s9h')),
+            parse_poker(PotLimitOmahaHoldEm(1, (1, 2), (200, 200, 200)), (
+                'dh 0 AsAhKsKh', 'dh 1 QcJcTd9d', 'dh 2 7c2d3h4s', 'f', 'cc', 'cc', 'db 2s3s4h', 'cc', 'cc',
+            )),
+        )
+
+        for game in games:
+            result = exact_equity(game)
+
+            for share, brute_force_share in zip(result.equities, self.brute_force(game)):
+                self.assertAlmostEqual(share, brute_force_share)
+
+            self.assertAlmostEqual(sum(result.equities), 1)
+            self.assertEqual(result.equity_errors, (0,) * len(game.players))
+
+        self.assertEqual(exact_equity(games[1]).sample_count, 990)
+
+    def test_isomorphism(self) -> None:
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 200)), (
+            'dh 0 AsKs', 'dh 1 QhQd', 'cc', 'cc', 'db 2c3c4c',
+        ))
+
+        with patch.object(game, '_evaluator', Mock(wraps=game._evaluator)) as evaluator:
+            result = exact_equity(game)
+
+        for share, brute_force_share in zip(result.equities, self.brute_force(game)):
+            self.assertAlmostEqual(share, brute_force_share)
+
+        self.assertEqual(result.sample_count, 990)
+        self.assertEqual(evaluator.hand.call_count, 606 * len(game.players))
+
+    def test_river(self) -> None:
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 200)), (
+            'dh 0 AsAh', 'dh 1 AdAc', 'cc', 'cc', 'db 2s3s4s', 'cc', 'cc', 'db 5c', 'cc', 'cc', 'db 9d',
+        ))
+
+        self.assertEqual(exact_equity(game).ties, (1, 1))
+        self.assertRaises(ValueError, exact_equity, parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 200)), ('dh 0',)))
+
+    def brute_force(self, game: Poker) -> tuple[float, ...]:
+        board_count = 5 - len(game.board)
+        shares = [0.0] * len(game.players)
+        count = 0
+
+        for cards in combinations(game.deck, board_count):
+            players = tuple(player for player in game.players if not player.mucked)
+            hands = tuple(game._evaluator.hand(player.hole, tuple(game.board) + cards) for player in players)
+            winners = tuple(player for player, hand in zip(players, hands) if hand == max(hands))
+
+            for player in winners:
+                shares[game.players.index(player)] += 1 / len(winners)
+
+            count += 1
+
+        return tuple(share / count for share in shares)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+from unittest import SkipTest, TestCase, main
+
+try:
+    import numpy as np
+except ImportError:
+    raise SkipTest('NumPy is not installed')
+
+from gameframe.exceptions import ActionException
+from gameframe.poker import NoLimitTexasHoldEm, parse_poker
+from gameframe.poker.batch import BET_RAISE, CHECK_CALL, FOLD, NoLimitTexasHoldEmBatch, random_policy
+
+
+class NoLimitTexasHoldEmBatchTestCase(TestCase):
+    BATCH_COUNT = 20
+    GAME_COUNT = 100
+    SAMPLE_COUNT = 20
+
+    def test_differential(self) -> None:
+        rng = np.random.default_rng(0)
+
+        for i in range(self.BATCH_COUNT):
+            player_count = int(rng.integers(2, 10))
+            ante = int(rng.integers(0, 3))
+            blinds = (1, 2)[:int(rng.integers(1, 3))]
+            stacks = rng.integers(0, 200, (self.GAME_COUNT, player_count))
+            batch = NoLimitTexasHoldEmBatch(self.GAME_COUNT, ante, blinds, stacks, rng, True)
+            payoffs = batch.run(random_policy(rng))
+
+            self.assertTrue(batch.terminal.all())
+            self.assertFalse(payoffs.sum(1).any())
+            self.assertFalse(batch.pots.any())
+
+            for index in rng.choice(self.GAME_COUNT, self.SAMPLE_COUNT, False):
+                game = parse_poker(NoLimitTexasHoldEm(ante, blinds, stacks[index].tolist()), batch.tokens(index))
+
+                self.assertTrue(game.terminal)
+                self.assertEqual([player.stack for player in game.players], batch.stacks[index].tolist())
+
+    def test_no_blinds(self) -> None:
+        batch = NoLimitTexasHoldEmBatch(self.GAME_COUNT, 1, (), (200, 200, 200), 0)
+        payoffs = batch.run(random_policy(0))
+
+        self.assertTrue(batch.terminal.all())
+        self.assertFalse(payoffs.sum(1).any())
+
+    def test_legal_actions(self) -> None:
+        batch = NoLimitTexasHoldEmBatch(3, 0, (1, 2), ((200, 200, 200), (1, 200, 200), (200, 200, 2)))
+        legal, min_amounts, max_amounts = batch.legal_actions()
+
+        self.assertEqual(batch.actors.tolist(), [2, 2, 2])
+        self.assertEqual(legal.tolist(), [[True, True, True], [True, True, True], [True, True, False]])
+        self.assertEqual(min_amounts.tolist(), [4, 4, 2])
+        self.assertEqual(max_amounts.tolist(), [200, 200, 2])
+
+        batch.step((BET_RAISE, CHECK_CALL, FOLD), (200, 0, 0))
+
+        self.assertEqual(batch.bets.tolist(), [[1, 2, 200], [1, 2, 2], [1, 2, 0]])
+        self.assertEqual(batch.actors.tolist(), [0, 1, 0])
+        self.assertFalse(batch.terminal.any())
+        self.assertRaises(ActionException, batch.step, (BET_RAISE, BET_RAISE, FOLD), (199, 4, 0))
+        self.assertRaises(ActionException, batch.step, (FOLD, FOLD, FOLD))
+
+
+if __name__ == '__main__':
+    main()
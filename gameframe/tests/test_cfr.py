@@ -0,0 +1,68 @@
+from unittest import SkipTest, TestCase, main
+
+try:
+    import numpy as np
+except ImportError:
+    raise SkipTest('NumPy is not installed')
+
+from pokertools import Card, Deck, Rank, RankEvaluator, Suit
+
+from gameframe.poker import (BettingStage, BoardDealingStage, FixedLimit, HoleDealingStage, KuhnPoker,
+                             NoLimitTexasHoldEm, Poker)
+from gameframe.poker.cfr import CFRSolver
+
+
+class CFRSolverTestCase(TestCase):
+    def test_kuhn_poker(self) -> None:
+        solver = CFRSolver(KuhnPoker())
+        exploitabilities = solver.iterate(1000)
+
+        self.assertEqual(solver.iteration_count, 1000)
+        self.assertEqual(exploitabilities.shape, (1000,))
+        self.assertTrue(np.all(exploitabilities >= -1e-12))
+        self.assertLess(exploitabilities[-1], 1e-3)
+        self.assertLess(exploitabilities[-1], exploitabilities[9])
+        self.assertAlmostEqual(solver.exploitability, exploitabilities[-1])
+        self.assertAlmostEqual(solver.game_value, -1 / 18, 2)
+
+        strategies = solver.average_strategies
+
+        self.assertEqual(len(strategies[0]), 6)
+        self.assertEqual(len(strategies[1]), 6)
+        self.assertAlmostEqual(strategies[0]['Ks:']['b'], 3 * strategies[0]['Js:']['b'], 2)
+        self.assertAlmostEqual(strategies[0]['Ks:cb']['c'], 1, 2)
+        self.assertAlmostEqual(strategies[1]['Js:b']['f'], 1, 2)
+        self.assertAlmostEqual(strategies[1]['Qs:b']['c'], 1 / 3, 2)
+        self.assertAlmostEqual(strategies[1]['Js:c']['b'], 1 / 3, 2)
+
+        for strategy in solver.current_strategies:
+            for probabilities in strategy.values():
+                self.assertAlmostEqual(sum(probabilities.values()), 1)
+
+    def test_batches(self) -> None:
+        solver = CFRSolver()
+        exploitabilities = np.concatenate((solver.iterate(3), solver.iterate(0), solver.iterate(97)))
+
+        np.testing.assert_allclose(exploitabilities, CFRSolver().iterate(100))
+
+    def test_card_order(self) -> None:
+        strategies = []
+
+        for rng in range(4):
+            solver = CFRSolver(Poker(
+                (HoleDealingStage(1, False), BettingStage(1), BoardDealingStage(2), BettingStage(1)), FixedLimit(),
+                RankEvaluator(), Deck(Card(rank, Suit.SPADE) for rank in (Rank.JACK, Rank.QUEEN, Rank.KING, Rank.ACE)),
+                1, (), (4, 4), rng,
+            ))
+            solver.iterate(10)
+            strategies.append(solver.average_strategies)
+
+        self.assertIn('As:bbc/JsKs/', strategies[0][0])
+        self.assertTrue(all(strategy == strategies[0] for strategy in strategies))
+
+    def test_unsupported(self) -> None:
+        self.assertRaises(ValueError, CFRSolver, NoLimitTexasHoldEm(0, (1, 2), (10,) * 3))
+
+
+if __name__ == '__main__':
+    main()
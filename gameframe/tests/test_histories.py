@@ -0,0 +1,51 @@
+from os import remove
+from tempfile import NamedTemporaryFile
+from unittest import TestCase, main
+
+from gameframe.poker import KuhnPoker, NoLimitTexasHoldEm, parse_hand, read_hands
+from gameframe.runner import payoffs
+
+
+class HistoriesTestCase(TestCase):
+    LINES = (
+        'NoLimitTexasHoldEm\t1\t1,2\t200,200\tdh 0 AcAd dh 1 KsKh br 6 cc db 2c3c4c cc cc db 5c cc cc db 6c cc cc s s',
+        'NoLimitTexasHoldEm\t0\t1,2\t100,50,200\tdh 0 AcAd dh 1 KsKh dh 2 QsQh br 100 cc f db 2c3d4h db 5s db 8d s s',
+        '',
+        'KuhnPoker\tdh 0 Js dh 1 Qs br f',
+        'NoLimitShortHoldEm\t1\t2\t100,100\tdh 0 AsAd dh 1 KsKh f',
+        'PotLimitTripleDrawLowball27\t0\t1,2\t100,100\tdh 0 2s3s4s5s7d dh 1 AcAdAhKsKh f',
+    )
+
+    def setUp(self) -> None:
+        with NamedTemporaryFile('w', suffix='.txt', delete=False) as file:
+            file.write('\n'.join(self.LINES * 20))
+            self.path = file.name
+
+    def tearDown(self) -> None:
+        remove(self.path)
+
+    def test_parse_hand(self) -> None:
+        game = parse_hand(self.LINES[1])
+
+        self.assertIsInstance(game, NoLimitTexasHoldEm)
+        self.assertTrue(game.terminal)
+        self.assertEqual(payoffs(game), (102, -2, -100))
+        self.assertEqual(payoffs(parse_hand(self.LINES[3], True)), (1, -1))
+        self.assertIsInstance(parse_hand(self.LINES[3]), KuhnPoker)
+
+        self.assertRaises(ValueError, parse_hand, 'Poker\tdh 0 AcAd')
+        self.assertRaises(ValueError, parse_hand, 'KuhnPoker\t1\tdh 0 Js')
+        self.assertRaises(ValueError, parse_hand, 'KuhnPoker\tdh 0 Js xx')
+
+    def test_read_hands(self) -> None:
+        results = tuple(payoffs(parse_hand(line)) for line in self.LINES if line) * 20
+
+        self.assertEqual(tuple(map(payoffs, read_hands(self.path))), results)
+        self.assertEqual(tuple(read_hands(self.path, payoffs, True)), results)
+
+        for chunk_size in (1, 37, 1000, 1 << 20):
+            self.assertEqual(tuple(read_hands(self.path, payoffs, max_workers=2, chunk_size=chunk_size)), results)
+
+
+if __name__ == '__main__':
+    main()
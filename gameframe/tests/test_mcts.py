@@ -0,0 +1,95 @@
+from collections.abc import Sequence
+from random import Random
+from unittest import TestCase, main
+
+from gameframe.adapters import PokerMCTSAdapter, TicTacToeMCTSAdapter
+from gameframe.mcts import MCTSAdapter, MonteCarloTreeSearch
+from gameframe.poker import FixedLimitBadugi, NoLimitTexasHoldEm
+from gameframe.tictactoe import TicTacToe, parse_tic_tac_toe
+
+
+class LosingTicTacToeMCTSAdapter(MCTSAdapter[TicTacToe, tuple[int, int]]):
+    adapter = TicTacToeMCTSAdapter()
+
+    def moves(self, game: TicTacToe) -> Sequence[tuple[int, int]]:
+        return self.adapter.moves(game)
+
+    def play(self, game: TicTacToe, move: tuple[int, int]) -> None:
+        self.adapter.play(game, move)
+
+    def payoffs(self, game: TicTacToe) -> Sequence[float]:
+        return -2, -2
+
+
+class MonteCarloTreeSearchTestCase(TestCase):
+    def test_tic_tac_toe(self) -> None:
+        adapter = TicTacToeMCTSAdapter()
+        game = parse_tic_tac_toe(TicTacToe(), ((0, 0), (1, 0), (0, 1), (1, 1)))
+        search = MonteCarloTreeSearch(adapter, rng=0)
+
+        self.assertEqual(search.search(game, 200), (0, 2))
+        self.assertEqual(tuple(game.empty_coords), ((0, 2), (1, 2), (2, 0), (2, 1), (2, 2)))
+        self.assertEqual(search.visit_count, 200)
+        self.assertEqual(sum(visit_count for visit_count, _ in search.statistics().values()), 199)
+
+        game = TicTacToe()
+        search = MonteCarloTreeSearch(adapter, rng=0)
+
+        while not game.terminal:
+            move = search.search(game, 500)
+            statistics = search.statistics()
+            node_count = search.node_count
+
+            adapter.play(game, move)
+            search.advance(move)
+
+            self.assertEqual(search.visit_count, statistics[move][0])
+            self.assertLess(search.node_count, node_count)
+
+        self.assertIsNone(game.winner)
+        self.assertRaises(ValueError, search.search, game, 1)
+
+    def test_low_scores(self) -> None:
+        game = parse_tic_tac_toe(TicTacToe(), ((0, 0), (1, 0), (0, 1), (1, 1)))
+
+        for search in (
+                MonteCarloTreeSearch(LosingTicTacToeMCTSAdapter(), rng=0),
+                MonteCarloTreeSearch(TicTacToeMCTSAdapter(), exploration=0, rng=0),
+        ):
+            search.search(game, 200)
+
+            self.assertEqual(search.visit_count, 200)
+            self.assertEqual(sum(visit_count for visit_count, _ in search.statistics().values()), 199)
+            self.assertEqual(tuple(game.empty_coords), ((0, 2), (1, 2), (2, 0), (2, 1), (2, 2)))
+
+        self.assertRaises(ValueError, LosingTicTacToeMCTSAdapter().sample, game, Random(0))
+
+    def test_poker(self) -> None:
+        adapter = PokerMCTSAdapter()
+
+        for game in (NoLimitTexasHoldEm(1, (1, 2), (200, 200), 0), FixedLimitBadugi(1, (1, 2), (50, 50), 0)):
+            search = MonteCarloTreeSearch(adapter, rng=0)
+
+            self.assertRaises(ValueError, search.search, game, 1)
+
+            while not game.terminal:
+                if adapter.is_chance(game):
+                    adapter.sample(game, search.rng)
+                    search.advance()
+                else:
+                    deck = tuple(game.deck)
+                    stacks = tuple(player.stack for player in game.players)
+                    move = search.search(game, 100)
+
+                    self.assertIn(move, adapter.moves(game))
+                    self.assertEqual(tuple(game.deck), deck)
+                    self.assertEqual(tuple(player.stack for player in game.players), stacks)
+
+                    adapter.play(game, move)
+                    search.advance(move)
+
+            self.assertEqual(sum(adapter.payoffs(game)), 0)
+
+
+if __name__ == '__main__':
+    main()
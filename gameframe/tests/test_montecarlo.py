@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from copy import copy
 from random import choice, randint, sample
 from typing import Generic, cast
 from unittest import TestCase, main
@@ -39,6 +40,7 @@ class MonteCarloTestCaseMixin(Generic[_G], ABC):
 
 class NoLimitTexasHoldEmTestCase(TestCase, MonteCarloTestCaseMixin[NoLimitTexasHoldEm]):
     MONTE_CARLO_TEST_COUNT = 1000
+    UNDO_TEST_COUNT = 100
 
     ANTE = 1
     BLINDS = 1, 2
@@ -57,11 +59,36 @@ class NoLimitTexasHoldEmTestCase(TestCase, MonteCarloTestCaseMixin[NoLimitTexasH
         self.assertEqual(game.pot + sum(player.bet + player.stack for player in game.players),
                          sum(player.starting_stack for player in game.players))
 
+    def test_undo(self) -> None:
+        def snapshot(obj: object) -> dict[str, object]:
+            return {key: copy(value) if isinstance(value, (list, dict)) else value for key, value in vars(obj).items()
+                    if key not in ('_history', '_hands', '_hands_board_mask')}
+
+        def state() -> tuple[object, ...]:
+            return snapshot(game), tuple(map(snapshot, game.players)), tuple(map(snapshot, game._stages))
+
+        for i in range(self.UNDO_TEST_COUNT):
+            game = self.create_game().clone(history=True)
+            history = cast(list[object], game._history)
+            states = []
+
+            while not game.terminal:
+                states.append((len(history), state()))
+                self.act(game)
+
+            for count, previous_state in reversed(states):
+                while len(history) > count:
+                    game.undo()
+
+                self.assertEqual(state(), previous_state)
+
     def act(self, game: NoLimitTexasHoldEm) -> None:
         if isinstance(game.actor, PokerNature):
             if game.actor.can_deal_hole():
                 for player in game.players:
                     game.nature.deal_hole(player, sample(tuple(game.deck), game.actor.hole_deal_count))
+            elif game.actor.can_run_out(times := randint(1, 3)):
+                game.nature.run_out(times=times)
             elif game.actor.can_deal_board():
                 game.nature.deal_board(sample(tuple(game.deck), game.actor.board_deal_count))
             else:
@@ -0,0 +1,36 @@
+from functools import partial
+from unittest import TestCase, main
+
+from gameframe.poker import NoLimitTexasHoldEm, PotLimitTripleDrawLowball27
+from gameframe.runner import RolloutSummary, run_rollouts, stream_rollouts
+from gameframe.tictactoe import TicTacToe
+
+
+class RunnerTestCase(TestCase):
+    def test_determinism(self) -> None:
+        factories = (
+            partial(NoLimitTexasHoldEm, 1, (1, 2), (200,) * 6),
+            partial(PotLimitTripleDrawLowball27, 1, (1, 2), (50,) * 6),
+            TicTacToe,
+        )
+
+        for factory in factories:
+            summary = run_rollouts(factory, 200, 0, chunk_size=200, max_workers=1)
+
+            self.assertEqual(summary.game_count, 200)
+            self.assertEqual(run_rollouts(factory, 200, 0, chunk_size=7, max_workers=3), summary)
+            self.assertNotEqual(run_rollouts(factory, 200, 1, chunk_size=50, max_workers=2), summary)
+
+    def test_summary(self) -> None:
+        summaries = tuple(stream_rollouts(partial(NoLimitTexasHoldEm, 1, (1, 2), (200,) * 6), 100, chunk_size=30))
+        summary = sum(summaries, RolloutSummary())
+
+        self.assertEqual(sorted(chunk.game_count for chunk in summaries), [10, 30, 30, 30])
+        self.assertEqual(sum(summary.payoffs), 0)
+        self.assertEqual(summary.action_counts['deal_hole'], 600)
+        self.assertEqual(RolloutSummary(1, (1,), {'fold': 1}) + RolloutSummary(2, (1, 2), {'fold': 1, 'check_call': 1}),
+                         RolloutSummary(3, (2, 2), {'fold': 2, 'check_call': 1}))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+from random import Random
+from typing import cast
+from unittest import TestCase, main
+
+from gameframe.adapters import TicTacToeSearchAdapter
+from gameframe.search import AlphaBetaSearch, TranspositionTable
+from gameframe.tictactoe import TicTacToe, parse_tic_tac_toe
+
+
+def minimax(game: TicTacToe, adapter: TicTacToeSearchAdapter) -> float:
+    if game.terminal:
+        return adapter.score(game)
+
+    values = []
+
+    for move in tuple(adapter.moves(game)):
+        adapter.play(game, move)
+        values.append(minimax(game, adapter))
+        game.undo()
+
+    return max(values) if game.actor is game.players[0] else min(values)
+
+
+class AlphaBetaSearchTestCase(TestCase):
+    def test_tic_tac_toe(self) -> None:
+        search = AlphaBetaSearch(TicTacToeSearchAdapter())
+        game = TicTacToe()
+        result = search.search(game)
+
+        self.assertEqual(result.value, 0)
+        self.assertIn(result.move, tuple(game.empty_coords))
+        self.assertEqual(tuple(game.empty_coords), tuple((r, c) for r in range(3) for c in range(3)))
+        self.assertGreater(result.probe_count, 0)
+        self.assertGreater(result.hit_count, 0)
+        self.assertLess(result.node_count, 5000)
+        self.assertEqual(search.search(game).node_count, 1)
+
+        game = parse_tic_tac_toe(TicTacToe(), ((0, 0), (1, 0), (1, 1)))
+        result = search.search(game)
+
+        self.assertEqual(result.value, -1)
+        self.assertIn(result.move, tuple(game.empty_coords))
+
+        game = parse_tic_tac_toe(TicTacToe(), ((0, 0), (0, 1), (1, 1), (1, 0), (2, 2)))
+        result = search.search(game)
+
+        self.assertTrue(game.terminal)
+        self.assertEqual((result.value, result.move, result.node_count), (1, None, 1))
+
+    def test_differential(self) -> None:
+        adapter = TicTacToeSearchAdapter()
+        rng = Random(0)
+
+        for size in (1, 7, 1 << 10):
+            search = AlphaBetaSearch(adapter, TranspositionTable(size))
+
+            for _ in range(20):
+                game = TicTacToe().clone(history=True)
+
+                for _ in range(rng.randint(3, 7)):
+                    if not game.terminal:
+                        adapter.play(game, rng.choice(tuple(game.empty_coords)))
+
+                value = minimax(game, adapter)
+                result = search.search(game)
+
+                if game.terminal:
+                    self.assertEqual(result.value, value)
+                else:
+                    self.assertEqual(result.value, value if game.actor is game.players[0] else -value)
+
+                    self.assertIsNotNone(result.move)
+
+                    adapter.play(game, cast(tuple[int, int], result.move))
+                    self.assertEqual(minimax(game, adapter), value)
+
+    def test_depth(self) -> None:
+        search = AlphaBetaSearch(TicTacToeSearchAdapter(), TranspositionTable(1 << 10))
+        game = parse_tic_tac_toe(TicTacToe(), ((0, 0), (1, 0), (1, 1)))
+
+        self.assertEqual(search.search(game, 1).value, 0)
+        self.assertEqual(search.search(game, 3).value, 0)
+        self.assertEqual(search.search(game, 4).value, -1)
+        self.assertEqual(search.search(game).value, -1)
+        self.assertEqual(search.table.size, 1 << 10)
+        self.assertGreater(search.table.hit_rate, 0)
+
+        search.table.clear()
+
+        self.assertEqual(search.table.probe_count, 0)
+        self.assertRaises(ValueError, TranspositionTable, 0)
+
+
+if __name__ == '__main__':
+    main()
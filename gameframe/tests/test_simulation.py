@@ -1,18 +1,21 @@
 from abc import ABC
+from collections.abc import Callable
+from copy import copy
+from importlib.util import find_spec
 from itertools import repeat
-from random import sample
+from random import Random, sample
 from typing import Generic, cast
-from unittest import TestCase, main
+from unittest import TestCase, main, skipUnless
 
 from auxiliary import ExtendedTestCase
 from pokertools import parse_cards
 
 from gameframe.exceptions import ActionException
-from gameframe.game import _G
+from gameframe.game import _G, RNG, spawn_rngs
 from gameframe.poker import (BetRaiseAmountException, BettingStage, BoardDealingStage, FixedLimitBadugi,
                              FixedLimitGreekHoldEm, HoleDealingStage, KuhnPoker, NoLimitFiveCardDraw,
                              NoLimitShortHoldEm, NoLimitTexasHoldEm, Poker, PokerPlayer, PotLimitOmahaHoldEm,
-                             parse_poker)
+                             apply_actions, card_mask, parse_action_log, parse_actions, parse_poker)
 from gameframe.poker.parameters import _ShowdownStage
 from gameframe.tictactoe import TicTacToe, parse_tic_tac_toe
 
@@ -624,7 +627,334 @@ class NoLimitTexasHoldEmSimulationTestCase(ExtendedTestCase, SimulationTestCaseM
             parse_poker(game, (command,))
             self.verify(game)
 
+    def test_clone(self) -> None:
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300, 200)), (
+            'dh 0 QdQh', 'dh 1 AhAd', 'dh 2 KsKh', 'dh 3 JsJd', 'br 6', 'cc', 'cc', 'cc',
+            'db AcAsKc',
+        ))
+        clone = parse_poker(game.clone(), ('cc', 'cc', 'cc', 'cc', 'db Qs', 'br 50', 'f', 'f', 'f'))
+
+        self.assertTrue(clone.terminal)
+        self.assertIs(game.actor, game.players[0])
+        self.assertEqual(len(tuple(game.deck)), 41)
+        self.assertEqual(len(game.board), 3)
+        self.assertIterableEqual((player.stack for player in game.players), (193, 93, 293, 193))
+        self.assertIterableEqual((player.stack for player in clone.players), (221, 93, 293, 193))
+
+        self.verify(game)
+        self.verify(clone)
+
+        parse_poker(game, ('cc', 'cc', 'cc', 'cc', 'db Qs', 'br 50', 'f', 'f', 'f'))
+
+        self.assertIterableEqual((player.stack for player in game.players), (221, 93, 293, 193))
+
+    def test_hand_cache(self) -> None:
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 200)).clone(history=True), (
+            'dh 0 AhAd', 'dh 1 KsKh', 'cc', 'cc', 'db AcAsKc',
+        ))
+        hands = tuple(player.hand for player in game.players)
+        clone = game.clone()
+
+        self.assertIs(clone._hands, game._hands)
+        self.assertEqual(len(game._hands), 2)
+
+        parse_poker(game, ('cc', 'cc', 'db Qs'))
+        self.assertIterableEqual(
+            (player.hand for player in game.players),
+            (game._evaluator.hand(player.hole, game.board) for player in game.players),
+        )
+        self.assertEqual(len(game._hands), 2)
+        self.assertIsNot(clone._hands, game._hands)
+
+        game.undo()
+        self.assertEqual(tuple(player.hand for player in game.players), hands)
+        self.assertEqual(len(game._hands), 2)
+
+    def test_card_targets(self) -> None:
+        game = NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300))
+
+        self.assertIterableEqual((stage._card_target(game) for stage in game._stages
+                                  if isinstance(stage, (HoleDealingStage, BoardDealingStage))), (2, 3, 4, 5))
+
+    def test_undo(self) -> None:
+        def snapshot(obj: object) -> dict[str, object]:
+            return {key: copy(value) if isinstance(value, (list, dict)) else value for key, value in vars(obj).items()
+                    if key not in ('_history', '_hands', '_hands_board_mask')}
+
+        def state() -> tuple[object, ...]:
+            return snapshot(game), tuple(map(snapshot, game.players)), tuple(map(snapshot, game._stages))
+
+        self.assertRaises(ActionException, parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 100)), ('dh 0 QdQh',)).undo)
+
+        game = NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300, 200)).clone(history=True)
+        states = []
+
+        for command in (
+                'dh 0 QdQh', 'dh 1 AhAd', 'dh 2 KsKh', 'dh 3 JsJd', 'br 6', 'cc', 'cc', 'cc',
+                'db AcAsKc', 'cc', 'cc', 'br 10', 'br 20', 'cc', 'br 93', 'cc', 'cc', 'cc',
+                'db Qs', 'br 50', 'cc', 'cc',
+                'db Qc', 'cc', 'cc', 'cc',
+                's', 's', 's', 's',
+        ):
+            states.append(state())
+            parse_poker(game, (command,))
+
+        self.assertTrue(game.terminal)
+
+        for previous_state in reversed(states):
+            game.undo()
+            self.verify(game)
+            self.assertEqual(state(), previous_state)
+
+        self.assertRaises(ActionException, game.undo)
+
+    def test_pots(self) -> None:
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (50, 100, 200)), (
+            'dh 0 AsKs', 'dh 1 AhKh', 'dh 2 2c7d', 'br 199', 'cc', 'cc',
+        ))
+
+        self.assertEqual(len(game.pots), 2)
+        self.assertIterableEqual((pot.amount for pot in game.pots), (150, 100))
+        self.assertIterableEqual(game.pots[0].eligible_players, game.players)
+        self.assertIterableEqual(game.pots[1].eligible_players, game.players[1:])
+        self.verify(game)
+
+        parse_poker(game, ('db QdJc8s', 'db 3c', 'db 4h', 's', 's', 's'))
+
+        self.assertTrue(game.terminal)
+        self.assertFalse(game.pots)
+        self.assertIterableEqual((player.stack for player in game.players), (75, 175, 100))
+
+    def test_seed(self) -> None:
+        commands = (
+            'dh 0 AhAd', 'dh 1', 'dh 2', 'br 6', 'cc', 'cc',
+            'db', 'cc', 'cc', 'cc',
+            'db', 'cc', 'cc', 'cc',
+            'db',
+        )
+        games = tuple(
+            parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300), Random(seed)), commands) for seed in (0, 0, 1)
+        )
+
+        self.assertEqual(repr(games[0].players), repr(games[1].players))
+        self.assertIterableEqual(games[0].board, games[1].board)
+        self.assertIterableEqual(games[0].deck, games[1].deck)
+        self.assertIterableEqual(
+            NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300), 0).deck,
+            NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300), Random(0)).deck,
+        )
+        self.assertNotEqual(tuple(games[0].deck), tuple(games[2].deck))
+        self.assertEqual(bin(NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300)).deck_mask).count('1'), 52)
+        self.assertEqual(bin(games[0].deck_mask).count('1'), 41)
+
+        for game in games:
+            self.assertEqual(len(tuple(game.deck)), 52 - 6 - 5)
+            self.assertFalse(set(game.deck) & set(game.board))
+            self.verify(game)
+
+    def test_rng(self) -> None:
+        self.verify_rng(Random)
+        self.assertEqual(TicTacToe(0).rng.random(), Random(0).random())
+
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300), 0), ('dh 0', 'dh 1', 'dh 2'))
+        rng = Random(1)
+
+        self.assertIs(game.clone(rng).rng, rng)
+        self.assertIterableEqual(game.clone(1).deck, game.clone(Random(1)).deck)
+        self.assertIterableEqual(game.clone().deck, game.deck)
+        self.assertIsNot(game.clone().rng, game.rng)
+
+    @skipUnless(find_spec('numpy'), 'NumPy is not installed')
+    def test_numpy_rng(self) -> None:
+        from numpy.random import default_rng
+
+        games = tuple(NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300), default_rng(seed)) for seed in (0, 0, 1))
+
+        self.assertIterableEqual(games[0].deck, games[1].deck)
+        self.assertNotEqual(tuple(games[0].deck), tuple(games[2].deck))
+        self.assertEqual(bin(games[0].deck_mask).count('1'), 52)
+
+        self.verify_rng(default_rng)
+
+    def verify_rng(self, create_rng: Callable[[int], RNG]) -> None:
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300), create_rng(0)), ('dh 0', 'dh 1', 'dh 2'))
+        clone = game.clone()
+
+        self.assertIsNot(clone.rng, game.rng)
+        self.assertEqual(clone.rng.random(), game.rng.random())
+        self.assertIterableEqual(parse_poker(clone, ('cc', 'cc', 'cc', 'db')).board,
+                                 parse_poker(game, ('cc', 'cc', 'cc', 'db')).board)
+
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (200, 100, 300), create_rng(0)), ('dh 0', 'dh 1', 'dh 2'))
+        hole_cards = tuple(tuple(player.hole) for player in game.players)
+        boards = set()
+
+        for seed in range(20):
+            clone = parse_poker(game.clone(create_rng(seed)), ('cc', 'cc', 'cc', 'db'))
+            boards.add(tuple(clone.board))
+
+            self.assertEqual(tuple(tuple(player.hole) for player in clone.players), hole_cards)
+            self.verify(clone)
+
+        self.assertGreater(len(boards), 1)
+
+        samples = tuple(child.random() for child in spawn_rngs(create_rng(0), 3))
+
+        self.assertEqual(len(set(samples)), 3)
+        self.assertEqual(samples, tuple(child.random() for child in spawn_rngs(create_rng(0), 3)))
+
+    def test_run_out(self) -> None:
+        commands = 'dh 0', 'dh 1', 'dh 2', 'br 100', 'cc', 'cc'
+        game = parse_poker(NoLimitTexasHoldEm(1, (1, 2), (100, 150, 300), 0), commands)
+
+        self.assertFalse(game.nature.can_run_out())
+        self.assertRaises(ActionException, game.nature.run_out)
+
+        parse_poker(game, ('db', 'br 49', 'cc'))
+        self.assertTrue(game.nature.can_run_out())
+        self.assertTrue(game.nature.can_run_out(21))
+        self.assertFalse(game.nature.can_run_out(22))
+        self.assertFalse(game.nature.can_run_out(0))
+
+        run_out_game = parse_poker(game.clone(), ('ro',))
+        dealt_game = parse_poker(game.clone(), ('db', 'db'))
+
+        self.assertIsInstance(run_out_game._stage, _ShowdownStage)
+        self.assertIterableEqual(run_out_game.board, dealt_game.board)
+        self.assertEqual(run_out_game.boards, (run_out_game.board,))
+        self.verify(run_out_game)
+
+        while not dealt_game.terminal:
+            parse_poker(run_out_game, ('s',))
+            parse_poker(dealt_game, ('s',))
+
+        self.assertEqual(repr(run_out_game.players), repr(dealt_game.players))
+
+        run_out_game = parse_poker(game.clone(history=True), ('ro 3',))
+
+        self.assertTrue(run_out_game.terminal)
+        self.assertEqual(len(run_out_game.boards), 3)
+        self.assertEqual(sum(player.stack for player in run_out_game.players), 550)
+        self.assertEqual(len(set().union(*run_out_game.boards)), 3 + 2 * 3)
+        self.assertTrue(all(board[:3] == run_out_game.board[:3] for board in run_out_game.boards))
+        self.verify(run_out_game)
+
+        run_out_game.undo()
+
+        self.assertEqual(repr(run_out_game.players), repr(game.players))
+        self.assertIterableEqual(run_out_game.deck, game.deck)
+        self.assertEqual(run_out_game.boards, game.boards)
+        self.verify(run_out_game)
+
+        run_out_games = game.clone(), game.clone()
+
+        for run_out_game in run_out_games:
+            run_out_game.nature.run_out(Random(1), 2)
+
+        self.assertEqual(run_out_games[0].boards, run_out_games[1].boards)
+
+    def test_trusted(self) -> None:
+        histories = (
+            (lambda: NoLimitTexasHoldEm(1, (1, 2), (50, 100, 200), 0), (
+                'dh 0 AsKs', 'dh 1 AhKh', 'dh 2 2c7d', 'br 199', 'cc', 'cc', 'db QdJc8s', 'db 3c', 'db 4h',
+                's', 's', 's',
+            )),
+            (lambda: NoLimitTexasHoldEm(1, (1, 2), (100, 150, 300), 1), (
+                'dh 0', 'dh 1', 'dh 2', 'br', 'cc', 'br 100', 'f', 'cc', 'db', 'ro 2',
+            )),
+            (lambda: PotLimitOmahaHoldEm(1, (1, 2), (200,) * 4, 2), (
+                'dh 0', 'dh 1', 'dh 2', 'dh 3', 'br', 'cc', 'cc', 'cc', 'db', 'cc', 'cc', 'cc', 'cc', 'db', 'br', 'f',
+                'f', 'cc', 'db', 'cc', 'cc', 's', 's',
+            )),
+            (lambda: NoLimitFiveCardDraw(1, (1, 2), (200, 200, 200), 3), (
+                'dh 0', 'dh 1', 'dh 2', 'cc', 'cc', 'cc', 'dd', 'dd', 'dd', 'br 10', 'cc', 'f', 's', 's',
+            )),
+        )
+
+        for create_game, tokens in histories:
+            game = parse_poker(create_game().clone(history=True), tokens)
+
+            for trusted_game in (
+                    parse_poker(create_game(), tokens, True),
+                    parse_poker(create_game(), tokens, True, 0.5, 0),
+                    parse_poker(create_game().clone(history=True), tokens, True, 1),
+            ):
+                self.assertEqual(repr(trusted_game.players), repr(game.players))
+                self.assertEqual(trusted_game.boards, game.boards)
+                self.assertIterableEqual(trusted_game.deck, game.deck)
+                self.assertEqual(trusted_game.terminal, game.terminal)
+                self.verify(trusted_game)
+
+            trusted_game.undo()
+            game.undo()
+
+            self.assertEqual(repr(trusted_game.players), repr(game.players))
+
+        create_game, tokens = histories[0]
+
+        self.assertRaises(ActionException, parse_poker, create_game(), ('dh 0 AsKs', 'dh 1 AsKh'), True, 1)
+        self.assertRaises(ValueError, parse_poker, create_game(), ('x',), True)
+
+    def test_parse_actions(self) -> None:
+        tokens = (
+            'dh 0 AsKs', 'dh 1 AhKh', 'dh 2', 'br', 'br 199', 'cc', 'cc', 'db QdJc8s', 'db', 'ro', 's 1', 's 0', 's',
+        )
+        actions = parse_actions(tokens)
+
+        self.assertEqual(actions[:4], [('dh', 0, tuple(parse_cards('AsKs'))), ('dh', 1, tuple(parse_cards('AhKh'))),
+                                       ('dh', 2, None), ('br', None)])
+        self.assertEqual(actions[-3:], [('s', True), ('s', False), ('s', False)])
+        self.assertEqual(parse_actions(' '.join(tokens)), actions)
+        self.assertEqual(parse_actions('  dh 0 AsKs\tdh 1  '), actions[:1] + [('dh', 1, None)])
+        self.assertEqual(list(parse_action_log('\n'.join((' '.join(tokens), '', 'dh 0 AsKs')))),
+                         [actions, actions[:1]])
+        self.assertEqual(parse_actions(('dd', 'dd AsKs', 'dd  AsKs', 'dd AsKs QhQd')), [
+            ('dd', (), None), ('dd', tuple(parse_cards('AsKs')), None), ('dd', (), tuple(parse_cards('AsKs'))),
+            ('dd', tuple(parse_cards('AsKs')), tuple(parse_cards('QhQd'))),
+        ])
+
+        for invalid_tokens in (('x',), ('br 1 2',), 'cc ccc', 'db Xx', 'dh 0 AsKs br1'):
+            self.assertRaises(ValueError, parse_actions, invalid_tokens)
+
+        for wrong_actor_tokens in (('cc',), ('dh 0', 'dh 1', 'dh 2', 'db'), ('dh 0', 'dh 1', 'f', 'dh 2')):
+            self.assertRaisesRegex(ValueError, 'Invalid command', parse_poker,
+                                   NoLimitTexasHoldEm(1, (1, 2), (200, 100, 50), 0), wrong_actor_tokens)
+            self.assertRaisesRegex(ValueError, 'Invalid command', parse_poker,
+                                   NoLimitTexasHoldEm(1, (1, 2), (200, 100, 50), 0), wrong_actor_tokens, True)
+
+        games = tuple(apply_actions(NoLimitTexasHoldEm(1, (1, 2), (200, 100, 50), 0), actions[:-3]) for _ in range(2))
+
+        for game in games:
+            self.assertEqual(repr(game.players), repr(parse_poker(
+                NoLimitTexasHoldEm(1, (1, 2), (200, 100, 50), 0), ' '.join(tokens[:-3]),
+            ).players))
+            self.verify(game)
+
     def verify(self, game: Poker) -> None:
+        for index, card in enumerate(game._deck):
+            self.assertEqual(game._deck_indices[card], index)
+
+        self.assertIterableEqual(game._deck[game._deck_cursor:], game.deck)
+        self.assertEqual(sum(pot.amount for pot in game.pots), game.pot)
+
+        for pot in game.pots:
+            self.assertTrue(pot.eligible_players)
+            self.assertFalse(any(player.mucked for player in pot.eligible_players))
+
+        if not game.terminal:
+            self.assertEqual(repr(game.pots), repr(game._build_pots()))
+
+        self.assertEqual(game.deck_mask, card_mask(game.deck))
+        self.assertEqual(game.board_mask, card_mask(game.board))
+        self.assertFalse(game.deck_mask & game.board_mask)
+
+        for player in game.players:
+            self.assertEqual(player.hole_mask, card_mask(player.hole))
+            self.assertFalse(player.hole_mask & (game.deck_mask | game.board_mask))
+
+            if isinstance(game._stage, _ShowdownStage) and not game.terminal:
+                self.assertEqual(player.hand, game._evaluator.hand(player.hole, game.board))
+
         for player in game.players:
             if isinstance(game._stage, BettingStage) and player.bet < max(player.bet for player in game.players) \
                     and game.actor is player:
@@ -661,15 +991,33 @@ class NoLimitTexasHoldEmSimulationTestCase(ExtendedTestCase, SimulationTestCaseM
                     and len(player.hole) != game._stage._card_target(game):
                 self.assertIn(player, game.nature.dealable_players)
                 self.assertTrue(game.nature.can_deal_hole(player))
-                self.assertTrue(game.nature.can_deal_hole(player, sample(tuple(game._deck), game._stage._card_count)))
+                self.assertTrue(game.nature.can_deal_hole(player, sample(tuple(game.deck), game._stage._card_count)))
                 self.assertFalse(
-                    game.nature.can_deal_hole(player, sample(tuple(game._deck), game._stage._card_count + 1)))
+                    game.nature.can_deal_hole(player, sample(tuple(game.deck), game._stage._card_count + 1)))
                 self.assertEqual(game.nature.hole_deal_count, game._stage._card_count)
             else:
                 self.assertNotIn(player, game.nature.dealable_players)
                 self.assertFalse(game.nature.can_deal_hole(player))
                 self.assertFalse(game.nature.can_deal_hole(player, ()))
 
+            actions = player.legal_actions()
+
+            self.assertEqual(actions.can_fold, player.can_fold())
+            self.assertEqual(actions.can_check_call, player.can_check_call())
+            self.assertEqual(actions.can_bet_raise, player.can_bet_raise())
+            self.assertEqual(actions.can_discard_draw, player.can_discard_draw())
+            self.assertEqual(actions.can_showdown, player.can_showdown())
+
+            if actions.can_bet_raise:
+                self.assertEqual(actions.min_bet_raise, player.min_bet_raise)
+                self.assertEqual(actions.max_bet_raise, player.max_bet_raise)
+
+        nature_actions = game.nature.legal_actions()
+
+        self.assertEqual(nature_actions.can_deal_hole, game.nature.can_deal_hole())
+        self.assertEqual(nature_actions.can_deal_board, game.nature.can_deal_board())
+        self.assertIterableEqual(nature_actions.dealable_players, game.nature.dealable_players)
+
         if isinstance(game._stage, HoleDealingStage):
             self.assertTrue(game.nature.can_deal_hole())
         else:
@@ -677,8 +1025,8 @@ class NoLimitTexasHoldEmSimulationTestCase(ExtendedTestCase, SimulationTestCaseM
 
         if isinstance(game._stage, BoardDealingStage):
             self.assertTrue(game.nature.can_deal_board())
-            self.assertTrue(game.nature.can_deal_board(sample(tuple(game._deck), game._stage._card_count)))
-            self.assertFalse(game.nature.can_deal_board(sample(tuple(game._deck), game._stage._card_count + 1)))
+            self.assertTrue(game.nature.can_deal_board(sample(tuple(game.deck), game._stage._card_count)))
+            self.assertFalse(game.nature.can_deal_board(sample(tuple(game.deck), game._stage._card_count + 1)))
             self.assertEqual(game.nature.board_deal_count, game._stage._card_count)
         else:
             self.assertFalse(game.nature.can_deal_board())
@@ -687,6 +1035,18 @@ class NoLimitTexasHoldEmSimulationTestCase(ExtendedTestCase, SimulationTestCaseM
         self.assertEqual(sum(player.bet + player.stack for player in game.players) + game.pot,
                          sum(player.starting_stack for player in game.players))
 
+        self.assertEqual(game._max_bet, max(player.bet for player in game.players))
+        self.assertEqual(game._bet_total, sum(player.bet for player in game.players))
+        self.assertEqual(game._active_count, sum(not player.mucked for player in game.players))
+        self.assertEqual(game._shown_count, sum(player.shown for player in game.players))
+        self.assertEqual(game._active_mask, sum(1 << i for i, player in enumerate(game.players) if not player.mucked))
+        self.assertEqual(game._relevant_mask, sum(1 << i for i, player in enumerate(game.players) if player._relevant))
+
+        ef_stacks = sorted(player.starting_stack for player in game.players if not player.mucked)
+
+        for player in game.players:
+            self.assertEqual(player._ef_stack, min(ef_stacks[-2], player.starting_stack) if len(ef_stacks) > 1 else 0)
+
         if game.terminal:
             self.assertEqual(game.pot, 0)
 
@@ -881,6 +1241,29 @@ class TicTacToeSimulationTestCase(TestCase, SimulationTestCaseMixin[TicTacToe]):
         ):
             self.assertIs(game.players[0], game.winner)
 
+    def test_clone(self) -> None:
+        game = parse_tic_tac_toe(TicTacToe(), ((1, 1), (0, 0)))
+        clone = parse_tic_tac_toe(game.clone(), ((0, 1), (0, 2), (2, 1)))
+
+        self.assertIs(clone.winner, clone.players[0])
+        self.assertIsNone(game.winner)
+        self.assertIs(game.actor, game.players[0])
+        self.assertEqual(len(tuple(game.empty_coords)), 7)
+
+    def test_undo(self) -> None:
+        game = parse_tic_tac_toe(TicTacToe().clone(history=True), ((1, 1), (0, 1), (2, 0), (2, 2), (0, 2)))
+
+        self.assertIs(game.winner, game.players[0])
+
+        game.undo()
+        game.undo()
+
+        self.assertIsNone(game.winner)
+        self.assertIs(game.actor, game.players[1])
+        self.assertIsNone(game.board[2][2])
+        self.assertEqual(len(tuple(game.empty_coords)), 6)
+        self.assertIs(parse_tic_tac_toe(game, ((2, 1), (0, 2))).winner, game.players[0])
+
     def test_illegal_actions(self) -> None:
         self.assertRaises(ActionException, parse_tic_tac_toe, parse_tic_tac_toe(TicTacToe(), ((0, 0),)), ((0, 0),))
         self.assertRaises(ActionException, parse_tic_tac_toe, parse_tic_tac_toe(TicTacToe(), ((0, 0), (0, 1))),
@@ -889,6 +1272,13 @@ class TicTacToeSimulationTestCase(TestCase, SimulationTestCaseMixin[TicTacToe]):
         self.assertRaises(ActionException, parse_tic_tac_toe, TicTacToe(), ((-1, -1),))
         self.assertRaises(ActionException, parse_tic_tac_toe(TicTacToe(), ((0, 0),)).players[0].mark, 0, 1)
 
+    def test_board(self) -> None:
+        game = parse_tic_tac_toe(TicTacToe(), ((1, 1), (0, 2), (2, 0)))
+        o, x = game.players
+
+        self.assertEqual(game.board, ((None, None, x), (None, o, None), (o, None, None)))
+        self.assertEqual(tuple(game.empty_coords), ((0, 0), (0, 1), (1, 0), (1, 2), (2, 1), (2, 2)))
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,81 @@
+from os import remove
+from tempfile import NamedTemporaryFile
+from unittest import SkipTest, TestCase, main
+
+try:
+    import numpy as np
+except ImportError:
+    raise SkipTest('NumPy is not installed')
+
+from gameframe.poker import FixedLimitBadugi, FixedLimitTexasHoldEm, KuhnPoker, NoLimitTexasHoldEm, parse_poker
+from gameframe.poker.batch import BET_RAISE, CHECK_CALL, FOLD
+from gameframe.poker.trees import BettingTree, build_betting_tree, load_betting_tree
+
+
+class BettingTreeTestCase(TestCase):
+    def test_kuhn_poker(self) -> None:
+        tree = build_betting_tree(KuhnPoker())
+
+        self.assertEqual(len(tree), 9)
+        self.assertEqual(tree.terminals.sum(), 5)
+        self.assertEqual(tree.actors.tolist(), [0, 1, 1, -1, 0, -1, -1, -1, -1])
+        self.assertEqual(tree.actions.tolist(), [-1, CHECK_CALL, BET_RAISE, CHECK_CALL, BET_RAISE, FOLD, CHECK_CALL,
+                                                 FOLD, CHECK_CALL])
+        self.assertEqual(tree.pots.tolist(), [2, 2, 3, 2, 3, 3, 4, 3, 4])
+        self.assertEqual(tree.parents.tolist(), [-1, 0, 0, 1, 1, 2, 2, 4, 4])
+        self.assertEqual(tuple(tree.children(1)), (3, 4))
+        self.assertEqual(tuple(tree.children(3)), ())
+
+    def test_structure(self) -> None:
+        for game in (
+                FixedLimitTexasHoldEm(0, (1, 2), (10, 10)),
+                FixedLimitTexasHoldEm(1, (1, 2), (6, 20, 20)),
+                FixedLimitBadugi(0, (1, 2), (12, 12)),
+        ):
+            tree = build_betting_tree(game)
+
+            self.assertEqual(tree.parents[0], -1)
+            self.assertFalse(game.terminal)
+
+            for index in range(len(tree)):
+                children = tree.children(index)
+
+                self.assertEqual(bool(children), not tree.terminals[index])
+                self.assertTrue(np.all(tree.parents[children] == index))
+                self.assertTrue(np.all(tree.pots[children] >= tree.pots[index]))
+                self.assertEqual(len(set(tree.actions[children])), len(children))
+
+            self.assertLessEqual(tree.pots.max(), sum(player.starting_stack for player in game.players))
+
+    def test_state(self) -> None:
+        game = parse_poker(FixedLimitTexasHoldEm(0, (1, 2), (100, 100)), 'dh 0 dh 1 br br cc')
+        tree = build_betting_tree(game)
+
+        self.assertEqual(tree.pots[0], 12)
+        self.assertEqual(tree.stages[0], game._stage_index + 1)
+        self.assertRaises(ValueError, build_betting_tree, NoLimitTexasHoldEm(0, (1, 2), (100, 100)))
+        self.assertRaises(ValueError, BettingTree, np.zeros(3))
+
+    def test_serialization(self) -> None:
+        tree = build_betting_tree(FixedLimitTexasHoldEm(0, (1, 2), (20, 20)))
+
+        with NamedTemporaryFile(suffix='.npy', delete=False) as file:
+            path = file.name
+
+        try:
+            tree.save(path)
+
+            for mmap in (True, False):
+                loaded_tree = load_betting_tree(path, mmap)
+
+                self.assertEqual(isinstance(loaded_tree.nodes, np.memmap), mmap)
+                np.testing.assert_array_equal(loaded_tree.nodes, tree.nodes)
+                self.assertEqual(tuple(loaded_tree.children(0)), tuple(tree.children(0)))
+
+                del loaded_tree
+        finally:
+            remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Iterator, Sequence
-from typing import Optional, cast, final, overload
-
-from auxiliary import next_or_none
+from typing import Optional, Union, cast, final, overload
 
 from gameframe.exceptions import ActionException
+from gameframe.game import RNG
 from gameframe.sequential import SequentialGame, _SequentialAction
 
 
@@ -54,47 +53,67 @@ class TicTacToePlayer:
         return 'O' if self.__game.players[0] is self else 'X'
 
 
+_FULL_MASK = (1 << 9) - 1
+_WIN_MASKS = (0b000000111, 0b000111000, 0b111000000, 0b001001001, 0b010010010, 0b100100100, 0b100010001, 0b001010100)
+_WINNING = tuple(any(mask & win_mask == win_mask for win_mask in _WIN_MASKS) for mask in range(_FULL_MASK + 1))
+_COORDS = tuple((r, c) for r in range(3) for c in range(3))
+_EMPTY_COORDS = tuple(
+    tuple(coords for i, coords in enumerate(_COORDS) if not mask >> i & 1) for mask in range(_FULL_MASK + 1)
+)
+
+
 @final
 class TicTacToe(SequentialGame[None, TicTacToePlayer]):
-    """TicTacToe is the class for tic tac toe games."""
+    """TicTacToe is the class for tic tac toe games.
 
-    def __init__(self) -> None:
-        super().__init__(None, players := (TicTacToePlayer(self), TicTacToePlayer(self)), players[0])
+       The board is stored as a 9-bit mask of the marked cells of each player, where the cell at the coordinates (r, c)
+       is the bit 3r + c.
+    """
+
+    def __init__(self, rng: Optional[Union[RNG, int]] = None) -> None:
+        super().__init__(None, players := (TicTacToePlayer(self), TicTacToePlayer(self)), players[0], rng)
 
-        self._board: list[list[Optional[TicTacToePlayer]]] = [[None, None, None],
-                                                              [None, None, None],
-                                                              [None, None, None]]
+        self._masks = [0, 0]
 
     @property
     def board(self) -> Sequence[Sequence[Optional[TicTacToePlayer]]]:
         """
         :return: The board of this tic tac toe game.
         """
-        return tuple(map(tuple, self._board))
+        return tuple(tuple(self.__player(3 * r + c) for c in range(3)) for r in range(3))
 
     @property
     def empty_coords(self) -> Iterator[tuple[int, int]]:
         """
         :return: The list of the empty coordinates of the board.
         """
-        return ((r, c) for r in range(3) for c in range(3) if self._board[r][c] is None)
+        return iter(_EMPTY_COORDS[self._masks[0] | self._masks[1]])
 
     @property
     def winner(self) -> Optional[TicTacToePlayer]:
         """
         :return: The winning player of the tic tac toe game if there is one, else None.
         """
-        for i in range(3):
-            if self._board[i][0] is self._board[i][1] is self._board[i][2] is not None:
-                return self._board[i][0]
-            elif self._board[0][i] is self._board[1][i] is self._board[2][i] is not None:
-                return self._board[0][i]
+        if _WINNING[self._masks[0]]:
+            return self.players[0]
+        elif _WINNING[self._masks[1]]:
+            return self.players[1]
+        else:
+            return None
+
+    def _clone(self, game: TicTacToe) -> None:
+        vars(game).update(players=(players := (TicTacToePlayer(game), TicTacToePlayer(game))))
 
-        if self._board[1][1] is not None and (self._board[0][0] is self._board[1][1] is self._board[2][2]
-                                              or self._board[0][2] is self._board[1][1] is self._board[2][0]):
-            return self._board[1][1]
+        game._actor = None if self._actor is None else players[self.players.index(self._actor)]
+        game._masks = self._masks.copy()
 
-        return None
+    def __player(self, index: int) -> Optional[TicTacToePlayer]:
+        if self._masks[0] >> index & 1:
+            return self.players[0]
+        elif self._masks[1] >> index & 1:
+            return self.players[1]
+        else:
+            return None
 
 
 class _MarkAction(_SequentialAction[TicTacToe, TicTacToePlayer]):
@@ -105,8 +124,11 @@ class _MarkAction(_SequentialAction[TicTacToe, TicTacToePlayer]):
 
     @property
     def next_actor(self) -> Optional[TicTacToePlayer]:
-        if next_or_none(self.game.empty_coords) is not None and self.game.winner is None:
-            return self.game.players[self.game.players[0] is self.actor]
+        masks = self.game._masks
+        index = self.actor is self.game.players[1]
+
+        if masks[0] | masks[1] != _FULL_MASK and not _WINNING[masks[index]]:
+            return self.game.players[not index]
         else:
             return None
 
@@ -117,11 +139,14 @@ class _MarkAction(_SequentialAction[TicTacToe, TicTacToePlayer]):
             raise TypeError('The coordinates must be of type int')
         elif not (0 <= self.r < 3 and 0 <= self.c < 3):
             raise ActionException('The coordinates are out of bounds')
-        elif self.game._board[self.r][self.c] is not None:
+        elif (self.game._masks[0] | self.game._masks[1]) >> (3 * self.r + self.c) & 1:
             raise ActionException('The cell is not empty')
 
     def apply(self) -> None:
-        self.game._board[self.r][self.c] = self.actor
+        self.game._masks[self.actor is self.game.players[1]] |= 1 << 3 * self.r + self.c
+
+    def unapply(self) -> None:
+        self.game._masks[self.actor is self.game.players[1]] &= ~(1 << 3 * self.r + self.c)
 
 
 def parse_tic_tac_toe(game: TicTacToe, coords: Iterable[Sequence[int]]) -> TicTacToe:
@@ -24,4 +24,5 @@ setup(
     ),
     python_requires='>=3.9',
     install_requires=('auxiliary', 'pokertools'),
+    extras_require={'numpy': ('numpy>=1.25',)},
 )